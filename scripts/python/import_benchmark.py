@@ -0,0 +1,79 @@
+#!/bin/python3
+"""
+This script measures how long it takes to import the terrasnek API module in a
+fresh interpreter, and fails out if it takes longer than the threshold we
+define, or if importing it loads any endpoint module, since endpoint modules
+should only be imported once they are first used. It is meant to be self
+contained.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+NUM_RUNS = int(os.getenv("IMPORT_BENCHMARK_RUNS", "20"))
+MAX_IMPORT_TIME_MS = float(os.getenv("IMPORT_BENCHMARK_MAX_MS", "250"))
+
+# Modules which are expected to be loaded by importing the API module, every
+# other terrasnek module is an endpoint module and should be loaded lazily.
+EAGER_MODULES = [
+    "terrasnek",
+    "terrasnek._constants",
+    "terrasnek._files",
+    "terrasnek.api",
+    "terrasnek.discovery",
+    "terrasnek.exceptions",
+    "terrasnek.serializers",
+    "terrasnek.transport"
+]
+
+IMPORT_SCRIPT = """
+import sys
+import time
+start = time.perf_counter()
+import terrasnek.api
+elapsed = time.perf_counter() - start
+print(elapsed * 1000)
+print(",".join(sorted(m for m in sys.modules if m.split(".")[0] == "terrasnek")))
+"""
+
+
+def time_import():
+    """
+    Import the API module in a fresh interpreter, return the time it took in
+    milliseconds and the terrasnek modules it loaded.
+    """
+    output = subprocess.run(\
+        [sys.executable, "-c", IMPORT_SCRIPT], check=True, stdout=subprocess.PIPE, \
+            universal_newlines=True).stdout.splitlines()
+    return float(output[0]), output[1].split(",")
+
+
+def main():
+    """
+    Time the import of the API module, and compare it to the tolerable threshold.
+    """
+    import_times = []
+    loaded_modules = []
+
+    for _ in range(NUM_RUNS):
+        import_time, loaded_modules = time_import()
+        import_times.append(import_time)
+
+    median_import_time = statistics.median(import_times)
+    unexpected_modules = sorted(set(loaded_modules) - set(EAGER_MODULES))
+
+    print(f"Median import time of terrasnek.api over {NUM_RUNS} runs: " \
+        f"{median_import_time:.1f}ms (min {min(import_times):.1f}ms, " \
+            f"max {max(import_times):.1f}ms, threshold {MAX_IMPORT_TIME_MS:.1f}ms)")
+
+    if unexpected_modules:
+        print(f"Modules imported eagerly which should be lazy: {', '.join(unexpected_modules)}")
+
+    if median_import_time > MAX_IMPORT_TIME_MS or unexpected_modules:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/bin/python3
+"""
+This script compares how long each JSON serializer takes to decode and encode
+large pages of results. Pages recorded from the API (e.g. the response of
+``GET /organizations/:org/workspaces?page[size]=100``) can be given as
+arguments, otherwise it uses 100 item pages of workspaces and runs shaped
+like the ones the API returns. It is meant to be self contained.
+"""
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# pylint: disable=wrong-import-position
+from terrasnek.serializers import TFCJSONSerializer, TFCOrjsonSerializer
+
+NUM_RUNS = int(os.getenv("JSON_BENCHMARK_RUNS", "50"))
+PAGE_SIZE = 100
+
+
+def workspace(index):
+    """
+    Return a workspace resource like the ones in a page of workspaces.
+    """
+    return {
+        "id": f"ws-{index:016d}",
+        "type": "workspaces",
+        "attributes": {
+            "allow-destroy-plan": True,
+            "auto-apply": False,
+            "auto-destroy-at": None,
+            "created-at": "2021-01-01T00:00:00.000Z",
+            "environment": "default",
+            "locked": False,
+            "name": f"workspace-{index}",
+            "queue-all-runs": False,
+            "speculative-enabled": True,
+            "structured-run-output-enabled": True,
+            "terraform-version": "1.0.0",
+            "working-directory": "",
+            "global-remote-state": False,
+            "updated-at": "2021-01-01T00:00:00.000Z",
+            "resource-count": index,
+            "apply-duration-average": 12000,
+            "plan-duration-average": 9000,
+            "policy-check-failures": None,
+            "run-failures": 0,
+            "workspace-kpis-runs-count": 10,
+            "latest-change-at": "2021-01-01T00:00:00.000Z",
+            "operations": True,
+            "execution-mode": "remote",
+            "vcs-repo": None,
+            "vcs-repo-identifier": None,
+            "permissions": {
+                "can-update": True,
+                "can-destroy": True,
+                "can-queue-destroy": True,
+                "can-queue-run": True,
+                "can-queue-apply": True,
+                "can-read-state-versions": True,
+                "can-create-state-versions": True,
+                "can-read-variable": True,
+                "can-update-variable": True,
+                "can-lock": True,
+                "can-unlock": True,
+                "can-force-unlock": True,
+                "can-read-settings": True
+            },
+            "actions": {"is-destroyable": True},
+            "description": f"Workspace number {index} of the benchmark.",
+            "file-triggers-enabled": True,
+            "trigger-prefixes": [],
+            "source": "tfe-api",
+            "source-name": None,
+            "source-url": None,
+            "tag-names": ["benchmark", f"shard-{index % 10}"]
+        },
+        "relationships": {
+            "organization": {"data": {"id": "terrasnek", "type": "organizations"}},
+            "current-run": {"data": {"id": f"run-{index:016d}", "type": "runs"}},
+            "latest-run": {"data": {"id": f"run-{index:016d}", "type": "runs"}},
+            "outputs": {"data": []},
+            "remote-state-consumers": {
+                "links": {"related": f"/api/v2/workspaces/ws-{index:016d}/relationships"}
+            },
+            "current-state-version": {
+                "data": {"id": f"sv-{index:016d}", "type": "state-versions"},
+                "links": {"related": f"/api/v2/workspaces/ws-{index:016d}/current-state-version"}
+            },
+            "current-configuration-version": {
+                "data": {"id": f"cv-{index:016d}", "type": "configuration-versions"},
+                "links": {"related": f"/api/v2/runs/run-{index:016d}/configuration-version"}
+            },
+            "agent-pool": {"data": None},
+            "readme": {"data": None}
+        },
+        "links": {"self": f"/api/v2/organizations/terrasnek/workspaces/workspace-{index}"}
+    }
+
+
+def run(index):
+    """
+    Return a run resource like the ones in a page of runs.
+    """
+    return {
+        "id": f"run-{index:016d}",
+        "type": "runs",
+        "attributes": {
+            "actions": {
+                "is-cancelable": False,
+                "is-confirmable": False,
+                "is-discardable": False,
+                "is-force-cancelable": False
+            },
+            "canceled-at": None,
+            "created-at": "2021-01-01T00:00:00.000Z",
+            "has-changes": True,
+            "auto-apply": False,
+            "is-destroy": False,
+            "message": f"Queued manually in the benchmark ({index})",
+            "plan-only": False,
+            "source": "tfe-api",
+            "status-timestamps": {
+                "plan-queueable-at": "2021-01-01T00:00:00+00:00",
+                "planning-at": "2021-01-01T00:00:01+00:00",
+                "planned-at": "2021-01-01T00:00:10+00:00",
+                "applying-at": "2021-01-01T00:00:20+00:00",
+                "applied-at": "2021-01-01T00:00:30+00:00"
+            },
+            "status": "applied",
+            "trigger-reason": "manual",
+            "target-addrs": None,
+            "permissions": {
+                "can-apply": True,
+                "can-cancel": True,
+                "can-comment": True,
+                "can-discard": True,
+                "can-force-execute": True,
+                "can-force-cancel": True,
+                "can-override-policy-check": True
+            },
+            "refresh": False,
+            "refresh-only": False,
+            "replace-addrs": None,
+            "variables": []
+        },
+        "relationships": {
+            "apply": {"data": {"id": f"apply-{index:016d}", "type": "applies"}},
+            "configuration-version": {
+                "data": {"id": f"cv-{index:016d}", "type": "configuration-versions"}
+            },
+            "cost-estimate": {"data": None},
+            "created-by": {"data": {"id": "user-0000000000000000", "type": "users"}},
+            "plan": {"data": {"id": f"plan-{index:016d}", "type": "plans"}},
+            "run-events": {"data": []},
+            "policy-checks": {"data": []},
+            "workspace": {"data": {"id": f"ws-{index:016d}", "type": "workspaces"}},
+            "comments": {"data": []}
+        },
+        "links": {"self": f"/api/v2/runs/run-{index:016d}"}
+    }
+
+
+def page(resource_func):
+    """
+    Return an encoded page of ``PAGE_SIZE`` resources, as the API returns it.
+    """
+    return json.dumps({
+        "data": [resource_func(index) for index in range(PAGE_SIZE)],
+        "links": {},
+        "meta": {
+            "pagination": {
+                "current-page": 1,
+                "prev-page": None,
+                "next-page": 2,
+                "total-pages": 10,
+                "total-count": PAGE_SIZE * 10
+            }
+        }
+    }).encode("utf-8")
+
+
+def load_pages(paths):
+    """
+    Return the recorded pages at ``paths``, or the pages of workspaces and runs
+    built by this script if no path is given.
+    """
+    if not paths:
+        return {"workspaces": page(workspace), "runs": page(run)}
+
+    pages = {}
+    for path in paths:
+        with open(path, "rb") as page_file:
+            pages[os.path.basename(path)] = page_file.read()
+    return pages
+
+
+def serializers():
+    """
+    Return the serializers to compare, leaving out the ones not installed.
+    """
+    available = {"json": TFCJSONSerializer()}
+    try:
+        available["orjson"] = TFCOrjsonSerializer()
+    except ImportError:
+        print("orjson isn't installed, only timing the json serializer.")
+    return available
+
+
+def main():
+    """
+    Time decoding and encoding each page with each serializer.
+    """
+    pages = load_pages(sys.argv[1:])
+    available = serializers()
+
+    for page_name, page_content in pages.items():
+        decoded = json.loads(page_content)
+        print(f"{page_name} ({len(page_content) / 1024:.0f}KB, {len(decoded['data'])} items):")
+
+        for serializer_name, serializer in available.items():
+            decode_ms = min(timeit.repeat(\
+                lambda: serializer.loads(page_content), number=1, repeat=NUM_RUNS)) * 1000
+            encode_ms = min(timeit.repeat(\
+                lambda: serializer.dumps(decoded), number=1, repeat=NUM_RUNS)) * 1000
+            print(f"  {serializer_name:>8}: decode {decode_ms:.2f}ms, encode {encode_ms:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
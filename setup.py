@@ -16,6 +16,10 @@ setuptools.setup(
     install_requires=[
         "requests==2.21.0"
     ],
+    extras_require={
+        "async": ["aiohttp>=3.6.0"],
+        "orjson": ["orjson>=3.0.0"]
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: Mozilla Public License 2.0 (MPL 2.0)",
@@ -10,24 +10,65 @@ TFC_SAAS_HOSTNAME = "app.terraform.io"
 TFC_SAAS_URL = "https://app.terraform.io"
 API_LOG_LEVEL = logging.CRITICAL
 MAX_PAGE_SIZE = 100
+MAX_PAGE_FETCH_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_SEGMENT_SIZE = 32 * 1024 * 1024
+DOWNLOAD_MAX_WORKERS = 4
+SLUG_BLOCK_SIZE = 1024 * 1024
+SLUG_COMPRESS_LEVEL = 6
+SLUG_MANIFEST_PATH = "~/.terrasnek/slug-manifest.json"
+SLUG_MANIFEST_MAX_ENTRIES = 20
+WELL_KNOWN_PATHS_CACHE_TTL = 3600
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+ARTIFACT_CACHE_PATH = "~/.terrasnek/artifacts"
+ARTIFACT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+RESOURCE_CACHE_TTL = 30
+RESOURCE_CACHE_MAX_ENTRIES = 1024
+ENDPOINT_CACHE_MAX_ENTRIES = 256
+
+# Default HTTP Connection Pool Config Items
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 10
+HTTP_KEEP_ALIVE = True
+HTTP_CONNECT_TIMEOUT = 10
+HTTP_READ_TIMEOUT = 60
+HTTP_COALESCE_GETS = False
+
+# Default Rate Limit Config Items
+RATE_LIMIT_REQUESTS_PER_SECOND = 30
+RATE_LIMIT_MAX_RETRIES = 10
+RATE_LIMIT_TOKEN_COOLDOWN = 1
+
+# Default Retry Config Items
+RETRY_MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_MAX_BACKOFF = 30
+RETRY_JITTER = 0.5
+RETRY_DEADLINE = 120
+RETRY_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
 
 # Common TFC API HTTP Codes
 HTTP_OK = 200
 HTTP_CREATED = 201
 HTTP_ACCEPTED = 202
 HTTP_NO_CONTENT = 204
+HTTP_PARTIAL_CONTENT = 206
 HTTP_MOVED_TEMPORARILY = 302
 HTTP_NOT_MODIFIED = 304
 HTTP_TEMPORARY_REDIRECT = 307
-HTTP_NOT_MODIFIED = 304
 HTTP_BAD_REQUEST = 400
 HTTP_UNAUTHORIZED = 401
 HTTP_FORBIDDEN = 403
 HTTP_NOT_FOUND = 404
 HTTP_CONFLICT = 409
 HTTP_PRECONDITION_FAILED = 412
+HTTP_RANGE_NOT_SATISFIABLE = 416
 HTTP_UNPROCESSABLE_ENTITY = 422
+HTTP_TOO_MANY_REQUESTS = 429
 HTTP_INTERNAL_SERVER_ERROR = 500
+HTTP_BAD_GATEWAY = 502
+HTTP_SERVICE_UNAVAILABLE = 503
+HTTP_GATEWAY_TIMEOUT = 504
 
 
 class Entitlements(Enum):
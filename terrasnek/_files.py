@@ -0,0 +1,37 @@
+"""
+Helpers for the JSON files terrasnek keeps on disk, which may be shared by
+several processes at once.
+"""
+
+import json
+import os
+import tempfile
+
+
+def read_json(path, default=None):
+    """
+    Return the decoded contents of a JSON file, or ``default`` if it's missing
+    or isn't valid JSON.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as json_file:
+            return json.load(json_file)
+    except (OSError, ValueError):
+        return default
+
+
+def write_json(path, data):
+    """
+    Write a JSON file by replacing it atomically, so that concurrent readers
+    never see it half written.
+    """
+    json_dir = os.path.dirname(os.path.abspath(path))
+    os.makedirs(json_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=json_dir, prefix=".terrasnek-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            json.dump(data, tmp_file)
+        os.replace(tmp_path, path)
+    except OSError:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,260 @@
+"""
+Helpers for downloads split in byte range segments, which are fetched
+concurrently into a preallocated, memory mapped part file next to the target.
+If a download is interrupted, the part file is kept along with a record of
+its finished segments, so that the next download to the same path only
+fetches the segments still missing, unless the remote file changed since.
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import threading
+
+from ._files import read_json, write_json
+from .exceptions import TFCDownloadVerificationFailed
+
+_CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def parse_content_range(header):
+    """
+    Return the first byte, last byte and total size of a ``Content-Range``
+    header, or ``None`` if it's missing or doesn't describe a byte range.
+    """
+    match = _CONTENT_RANGE_RE.match((header or "").strip())
+    if match is None:
+        return None
+    return tuple(int(group) for group in match.groups())
+
+
+def range_validator(headers):
+    """
+    Return the value identifying the version of a remote file for an
+    ``If-Range`` header, the strong ``ETag`` if there is one, else the
+    ``Last-Modified`` date, or ``None`` if there is neither.
+    """
+    etag = headers.get("ETag")
+    if etag is not None and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified")
+
+
+class Checksum():
+    """
+    Expected checksum of a download, given as ``"<algorithm>:<hex digest>"``,
+    e.g. ``"sha256:9f86d08..."``, with any algorithm ``hashlib`` supports.
+    """
+
+    def __init__(self, checksum):
+        self.algorithm, _, expected = checksum.partition(":")
+        if not expected:
+            raise ValueError(f"Checksum {checksum} isn't of the form <algorithm>:<hex digest>.")
+        self.expected = expected.lower()
+        self._hash = hashlib.new(self.algorithm)
+
+    def update(self, chunk):
+        """
+        Add a chunk of the download to the checksum.
+        """
+        self._hash.update(chunk)
+
+    def update_from_file(self, path):
+        """
+        Add the whole contents of a file to the checksum.
+        """
+        with open(path, "rb") as downloaded_file:
+            for block in iter(lambda: downloaded_file.read(_HASH_BLOCK_SIZE), b""):
+                self._hash.update(block)
+
+    def verify(self):
+        """
+        Raise ``TFCDownloadVerificationFailed`` unless the checksum of the
+        download matches the expected one.
+        """
+        actual = self._hash.hexdigest()
+        if actual != self.expected:
+            raise TFCDownloadVerificationFailed(\
+                f"The {self.algorithm} checksum of the download is {actual}, "
+                f"expected {self.expected}.")
+
+
+class SegmentedDownload():
+    """
+    Part file of a download to ``target_path``, fetched in segments of
+    ``segment_size`` bytes. Segments may be written by several threads at
+    once, since each one covers its own slice of the memory map.
+    """
+
+    def __init__(self, target_path, segment_size):
+        self.target_path = os.fspath(target_path)
+        self.part_path = f"{self.target_path}.part"
+        self._progress_path = f"{self.part_path}.json"
+        self.segment_size = segment_size
+        self.size = None
+        self.validator = None
+        self.done = set()
+        self._lock = threading.Lock()
+        self._map = None
+        self._load_progress()
+
+    def _load_progress(self):
+        # Without a validator, there's no telling whether the remote file changed.
+        progress = read_json(self._progress_path)
+        if not isinstance(progress, dict) or progress.get("validator") is None or \
+            progress.get("segment_size") != self.segment_size:
+            return
+
+        try:
+            if os.path.getsize(self.part_path) != progress.get("size"):
+                return
+        except OSError:
+            return
+
+        self.size = progress["size"]
+        self.validator = progress.get("validator")
+        self.done = set(progress.get("done", []))
+
+    def _save_progress(self):
+        write_json(self._progress_path, {
+            "size": self.size,
+            "validator": self.validator,
+            "segment_size": self.segment_size,
+            "done": sorted(self.done)
+        })
+
+    def pending(self):
+        """
+        Return the indexes of the segments which haven't been downloaded yet.
+        """
+        if self.size is None:
+            return [0]
+        segment_count = -(-self.size // self.segment_size)
+        return [index for index in range(segment_count) if index not in self.done]
+
+    def request_headers(self, index):
+        """
+        Return the headers requesting a segment, only if the remote file is
+        still the version the part file holds.
+        """
+        start = index * self.segment_size
+        end = start + self.segment_size - 1
+        if self.size is not None:
+            end = min(end, self.size - 1)
+
+        headers = {"Range": f"bytes={start}-{end}"}
+        if self.validator is not None:
+            headers["If-Range"] = self.validator
+        return headers
+
+    def open(self, headers):
+        """
+        Open the part file for the remote file described by the ``headers``
+        of the first segment response, starting over unless the part file
+        holds the same version of it.
+        """
+        content_range = parse_content_range(headers.get("Content-Range"))
+        if content_range is None:
+            raise TFCDownloadVerificationFailed(\
+                "The partial response doesn't have a valid Content-Range header.")
+
+        size = content_range[2]
+        validator = range_validator(headers)
+        resumed = (size, validator) == (self.size, self.validator)
+        if not resumed:
+            self.size, self.validator, self.done = size, validator, set()
+
+        # The map keeps its own handle on the part file, which can be closed once it's mapped.
+        with open(self.part_path, "r+b" if resumed else "w+b") as part_file:
+            part_file.truncate(self.size)
+            self._map = mmap.mmap(part_file.fileno(), self.size)
+        self._save_progress()
+
+    def check_segment(self, index, headers):
+        """
+        Return the first and last byte of a segment, after checking that the
+        ``headers`` of its response are for that segment of the same file.
+        """
+        start = index * self.segment_size
+        end = min(start + self.segment_size, self.size) - 1
+
+        if parse_content_range(headers.get("Content-Range")) != (start, end, self.size) or \
+            range_validator(headers) != self.validator:
+            raise TFCDownloadVerificationFailed(\
+                f"The remote file changed while downloading it to {self.target_path}.")
+
+        return start, end
+
+    def write(self, offset, chunk, end):
+        """
+        Write a chunk of a segment at ``offset`` of the part file, unless it
+        overruns ``end``, the last byte of the segment.
+        """
+        if offset + len(chunk) > end + 1:
+            raise TFCDownloadVerificationFailed(\
+                f"A segment of the download to {self.target_path} is longer than requested.")
+        self._map[offset:offset + len(chunk)] = chunk
+
+    def complete(self, index, byte_count):
+        """
+        Record a finished segment, once all of its ``byte_count`` bytes are
+        flushed to the part file, so that it's skipped if the download resumes.
+        """
+        start, end = index * self.segment_size, min((index + 1) * self.segment_size, self.size)
+        if byte_count != end - start:
+            raise TFCDownloadVerificationFailed(\
+                f"Segment {index} of the download to {self.target_path} is {byte_count} bytes "
+                f"long, expected {end - start}.")
+
+        flush_start = start - start % mmap.PAGESIZE
+        self._map.flush(flush_start, end - flush_start)
+        with self._lock:
+            self.done.add(index)
+            self._save_progress()
+
+    def close(self):
+        """
+        Close the part file, keeping it to resume the download later.
+        """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def finish(self, checksum=None):
+        """
+        Check the part file is complete and matches the ``checksum``, if one
+        is given, then move it to the target path.
+        """
+        self.close()
+
+        if self.pending() or os.path.getsize(self.part_path) != self.size:
+            raise TFCDownloadVerificationFailed(\
+                f"The download to {self.target_path} is incomplete.")
+
+        if checksum is not None:
+            checksum.update_from_file(self.part_path)
+            try:
+                checksum.verify()
+            except TFCDownloadVerificationFailed:
+                self.discard()
+                raise
+
+        os.replace(self.part_path, self.target_path)
+        self._remove(self._progress_path)
+
+    def discard(self):
+        """
+        Close and remove the part file and its progress.
+        """
+        self.close()
+        self._remove(self.part_path)
+        self._remove(self._progress_path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
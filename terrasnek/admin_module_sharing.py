@@ -10,8 +10,12 @@ class TFCAdminModuleSharing(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/admin/module-sharing.html#update-an-organization-39-s-module-consumers>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._org_api_v2_base_url = f"{self._api_v2_base_url}/admin/organizations"
 
     def required_entitlements(self):
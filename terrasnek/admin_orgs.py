@@ -10,8 +10,12 @@ class TFCAdminOrgs(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/admin/organizations.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._org_api_v2_base_url = f"{self._api_v2_base_url}/admin/organizations"
 
     def required_entitlements(self):
@@ -33,7 +37,7 @@ class TFCAdminOrgs(TFCEndpoint):
         url = f"{self._org_api_v2_base_url}/{org_name}"
         return self._destroy(url)
 
-    def list(self):
+    def list(self, fields=None):
         """
         ``GET /admin/organizations``
 
@@ -42,7 +46,7 @@ class TFCAdminOrgs(TFCEndpoint):
 
         This endpoint lists all organizations in the Terraform Cloud installation.
         """
-        return self._list(self._org_api_v2_base_url)
+        return self._list(self._org_api_v2_base_url, fields=fields)
 
     def show(self, org_name):
         """
@@ -3,6 +3,7 @@ Module for Terraform Cloud API Endpoint: Admin Terraform Versions.
 """
 
 from .endpoint import TFCEndpoint
+from ._constants import MAX_PAGE_FETCH_WORKERS
 
 class TFCAdminTerraformVersions(TFCEndpoint):
     """
@@ -10,18 +11,34 @@ class TFCAdminTerraformVersions(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/admin/terraform-versions.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/admin/terraform-versions"
 
-    def list(self, page=None, page_size=None):
+    def list(self, page=None, page_size=None, fields=None):
         """
         ``GET /admin/terraform-versions``
 
         `Admin Terraform Versions List API Doc Reference \
             <https://www.terraform.io/docs/cloud/api/admin/terraform-versions.html#list-all-terraform-versions>`_
         """
-        return self._list(self._endpoint_base_url, page=page, page_size=page_size)
+        return self._list(self._endpoint_base_url, page=page, page_size=page_size, fields=fields)
+
+    def iter_all(self, read_ahead=MAX_PAGE_FETCH_WORKERS, fields=None):
+        """
+        This function does not correlate to an endpoint in the TFC API Docs specifically,
+        but rather is a helper function to wrap the `list` endpoint, which lazily
+        enumerates every page so users can stream every Terraform version in the installation
+        without holding every page in memory. Up to ``read_ahead`` pages are fetched
+        ahead of the caller, and breaking out of the loop stops fetching the rest.
+
+        Returns a generator of objects.
+        """
+        return self._iter_all(self._endpoint_base_url, read_ahead=read_ahead, fields=fields)
 
     def required_entitlements(self):
         return []
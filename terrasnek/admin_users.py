@@ -3,6 +3,7 @@ Module for Terraform Cloud API Endpoint: Admin Users.
 """
 
 from .endpoint import TFCEndpoint
+from ._constants import MAX_PAGE_FETCH_WORKERS
 
 class TFCAdminUsers(TFCEndpoint):
     """
@@ -10,8 +11,12 @@ class TFCAdminUsers(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/admin/users.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/admin/users"
 
     def required_entitlements(self):
@@ -63,7 +68,7 @@ class TFCAdminUsers(TFCEndpoint):
         url = f"{self._endpoint_base_url}/{user_id}/actions/impersonate"
         return self._post(url)
 
-    def list(self, query=None, filters=None, page=None, page_size=None):
+    def list(self, query=None, filters=None, page=None, page_size=None, fields=None):
         """
         ``GET /admin/users``
 
@@ -71,7 +76,22 @@ class TFCAdminUsers(TFCEndpoint):
             <https://www.terraform.io/docs/cloud/api/admin/users.html#list-all-users>`_
         """
         return self._list(\
-            self._endpoint_base_url, query=query, filters=filters, page=page, page_size=page_size)
+            self._endpoint_base_url, query=query, filters=filters, page=page, page_size=page_size, \
+                fields=fields)
+
+    def iter_all(self, query=None, filters=None, read_ahead=MAX_PAGE_FETCH_WORKERS, fields=None):
+        """
+        This function does not correlate to an endpoint in the TFC API Docs specifically,
+        but rather is a helper function to wrap the `list` endpoint, which lazily
+        enumerates every page so users can stream every user in the installation
+        without holding every page in memory. Up to ``read_ahead`` pages are fetched
+        ahead of the caller, and breaking out of the loop stops fetching the rest.
+
+        Returns a generator of objects.
+        """
+        return self._iter_all(\
+            self._endpoint_base_url, read_ahead=read_ahead, query=query, filters=filters, \
+                fields=fields)
 
     def revoke_admin(self, user_id):
         """
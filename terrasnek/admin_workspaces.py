@@ -3,6 +3,7 @@ Module for Terraform Cloud API Endpoint: Admin Workspaces.
 """
 
 from .endpoint import TFCEndpoint
+from ._constants import MAX_PAGE_FETCH_WORKERS
 
 class TFCAdminWorkspaces(TFCEndpoint):
     """
@@ -17,8 +18,12 @@ class TFCAdminWorkspaces(TFCEndpoint):
     workspaces.
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/admin/workspaces"
 
     def required_entitlements(self):
@@ -30,7 +35,7 @@ class TFCAdminWorkspaces(TFCEndpoint):
     def terraform_enterprise_only(self):
         return True
 
-    def list(self, filters=None, page=None, page_size=None, sort=None, search=None):
+    def list(self, filters=None, page=None, page_size=None, sort=None, search=None, fields=None):
         """
         ``GET /admin/workspaces``
 
@@ -39,7 +44,22 @@ class TFCAdminWorkspaces(TFCEndpoint):
         """
         return self._list(\
             self._endpoint_base_url, filters=filters, \
-            page=page, page_size=page_size, search=search, sort=sort)
+            page=page, page_size=page_size, search=search, sort=sort, fields=fields)
+
+    def iter_all(\
+        self, filters=None, sort=None, search=None, read_ahead=MAX_PAGE_FETCH_WORKERS, fields=None):
+        """
+        This function does not correlate to an endpoint in the TFC API Docs specifically,
+        but rather is a helper function to wrap the `list` endpoint, which lazily
+        enumerates every page so users can stream every workspace in the installation
+        without holding every page in memory. Up to ``read_ahead`` pages are fetched
+        ahead of the caller, and breaking out of the loop stops fetching the rest.
+
+        Returns a generator of objects.
+        """
+        return self._iter_all(\
+            self._endpoint_base_url, read_ahead=read_ahead, \
+                filters=filters, sort=sort, search=search, fields=fields)
 
     def show(self, ws_id):
         """
@@ -11,8 +11,12 @@ class TFCAgentTokens(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/agent-tokens.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._agent_pools_api_v2_base_url = f"{self._api_v2_base_url}/agent-pools"
         self._auth_tokens_api_v2_base_url = f"{self._api_v2_base_url}/authentication-tokens"
 
@@ -35,7 +39,7 @@ class TFCAgentTokens(TFCEndpoint):
         url = f"{self._agent_pools_api_v2_base_url}/{agent_pool_id}/authentication-tokens"
         return self._create(url, payload)
 
-    def list(self, agent_pool_id):
+    def list(self, agent_pool_id, fields=None):
         """
         ``GET /agent-pools/:agent_pool_id/authentication-tokens``
 
@@ -43,7 +47,7 @@ class TFCAgentTokens(TFCEndpoint):
             <https://www.terraform.io/docs/cloud/api/agent-tokens.html#list-agent-tokens>`_
         """
         url = f"{self._agent_pools_api_v2_base_url}/{agent_pool_id}/authentication-tokens"
-        return self._list(url)
+        return self._list(url, fields=fields)
 
     def show(self, token_id):
         """
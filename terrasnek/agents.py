@@ -11,8 +11,12 @@ class TFCAgents(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/agents.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._agent_pools_api_v2_base_url = f"{self._api_v2_base_url}/agent-pools"
         self._agents_api_v2_base_url = f"{self._api_v2_base_url}/agents"
         self._org_api_v2_base_url = f"{self._api_v2_base_url}/organizations"
@@ -36,7 +40,7 @@ class TFCAgents(TFCEndpoint):
         url = f"{self._org_api_v2_base_url}/{self._org_name}/agent-pools"
         return self._create(url, payload)
 
-    def list_pools(self):
+    def list_pools(self, fields=None):
         """
         ``GET /organizations/:organization_name/agent-pools``
 
@@ -44,9 +48,9 @@ class TFCAgents(TFCEndpoint):
             <https://www.terraform.io/docs/cloud/api/agents.html#list-agent-pools>`_
         """
         url = f"{self._org_api_v2_base_url}/{self._org_name}/agent-pools"
-        return self._list(url)
+        return self._list(url, fields=fields)
 
-    def list(self, agent_pool_id, filters=None):
+    def list(self, agent_pool_id, filters=None, fields=None):
         """
         ``GET /agent-pools/:agent_pool_id/agents``
 
@@ -69,7 +73,7 @@ class TFCAgents(TFCEndpoint):
             ]
         """
         url = f"{self._agent_pools_api_v2_base_url}/{agent_pool_id}/agents"
-        return self._list(url, filters=filters)
+        return self._list(url, filters=filters, fields=fields)
 
     def show_pool(self, agent_pool_id):
         """
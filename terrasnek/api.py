@@ -3,65 +3,129 @@ Module for container class of all TFC endpoints and high level exceptions around
 API access.
 """
 
-import json
+import copy
+import importlib
 import logging
-import requests
+import threading
+from collections import OrderedDict, namedtuple
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
 import urllib3
+from requests.adapters import HTTPAdapter
 
-from ._constants import TFC_SAAS_URL, TFC_SAAS_HOSTNAME, HTTP_OK, API_LOG_LEVEL
+from ._constants import \
+    TFC_SAAS_URL, TFC_SAAS_HOSTNAME, HTTP_OK, API_LOG_LEVEL, \
+        HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_KEEP_ALIVE, HTTP_CONNECT_TIMEOUT, \
+            HTTP_READ_TIMEOUT, HTTP_COALESCE_GETS, RATE_LIMIT_REQUESTS_PER_SECOND, \
+                RATE_LIMIT_MAX_RETRIES, ENDPOINT_CACHE_MAX_ENTRIES
 from .exceptions import TFCHTTPNotFound
-
-from .account import TFCAccount
-from .admin_module_sharing import TFCAdminModuleSharing
-from .admin_orgs import TFCAdminOrgs
-from .admin_runs import TFCAdminRuns
-from .admin_settings import TFCAdminSettings
-from .admin_terraform_versions import TFCAdminTerraformVersions
-from .admin_users import TFCAdminUsers
-from .admin_workspaces import TFCAdminWorkspaces
-from .agents import TFCAgents
-from .agent_tokens import TFCAgentTokens
-from .applies import TFCApplies
-from .audit_trails import TFCAuditTrails
-from .config_versions import TFCConfigVersions
-from .cost_estimates import TFCCostEstimates
-from .ip_ranges import TFCIPRanges
-from .oauth_clients import TFCOAuthClients
-from .oauth_tokens import TFCOAuthTokens
-from .orgs import TFCOrgs
-from .org_memberships import TFCOrgMemberships
-from .org_tokens import TFCOrgTokens
-from .plans import TFCPlans
-from .plan_exports import TFCPlanExports
-from .policies import TFCPolicies
-from .policy_checks import TFCPolicyChecks
-from .policy_sets import TFCPolicySets
-from .policy_set_params import TFCPolicySetParams
-from .notification_configs import TFCNotificationConfigurations
-from .registry_modules import TFCRegistryModules
-from .run_triggers import TFCRunTriggers
-from .runs import TFCRuns
-from .state_versions import TFCStateVersions
-from .state_version_outputs import TFCStateVersionOutputs
-from .ssh_keys import TFCSSHKeys
-from .teams import TFCTeams
-from .team_access import TFCTeamAccess
-from .team_memberships import TFCTeamMemberships
-from .team_tokens import TFCTeamTokens
-from .users import TFCUsers
-from .user_tokens import TFCUserTokens
-from .vars import TFCVars
-from .workspace_vars import TFCWorkspaceVars
-from .workspaces import TFCWorkspaces
-
-# Suppress insecure TLS warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from .discovery import TFCWellKnownPathsCache
+from .serializers import TFCJSONSerializer
+from .transport import \
+    TFCRateLimiter, TFCRetryPolicy, TFCSession, TFCTokenPool, deadline, timeout
+
+if TYPE_CHECKING:
+    from .account import TFCAccount
+    from .admin_module_sharing import TFCAdminModuleSharing
+    from .admin_orgs import TFCAdminOrgs
+    from .admin_runs import TFCAdminRuns
+    from .admin_settings import TFCAdminSettings
+    from .admin_terraform_versions import TFCAdminTerraformVersions
+    from .admin_users import TFCAdminUsers
+    from .admin_workspaces import TFCAdminWorkspaces
+    from .agents import TFCAgents
+    from .agent_tokens import TFCAgentTokens
+    from .applies import TFCApplies
+    from .audit_trails import TFCAuditTrails
+    from .config_versions import TFCConfigVersions
+    from .cost_estimates import TFCCostEstimates
+    from .ip_ranges import TFCIPRanges
+    from .oauth_clients import TFCOAuthClients
+    from .oauth_tokens import TFCOAuthTokens
+    from .orgs import TFCOrgs
+    from .org_memberships import TFCOrgMemberships
+    from .org_tokens import TFCOrgTokens
+    from .plans import TFCPlans
+    from .plan_exports import TFCPlanExports
+    from .policies import TFCPolicies
+    from .policy_checks import TFCPolicyChecks
+    from .policy_sets import TFCPolicySets
+    from .policy_set_params import TFCPolicySetParams
+    from .notification_configs import TFCNotificationConfigurations
+    from .registry_modules import TFCRegistryModules
+    from .run_triggers import TFCRunTriggers
+    from .runs import TFCRuns
+    from .state_versions import TFCStateVersions
+    from .state_version_outputs import TFCStateVersionOutputs
+    from .ssh_keys import TFCSSHKeys
+    from .teams import TFCTeams
+    from .team_access import TFCTeamAccess
+    from .team_memberships import TFCTeamMemberships
+    from .team_tokens import TFCTeamTokens
+    from .users import TFCUsers
+    from .user_tokens import TFCUserTokens
+    from .vars import TFCVars
+    from .workspace_vars import TFCWorkspaceVars
+    from .workspaces import TFCWorkspaces
+
+# Well known paths cache shared by every API object of this process, unless given another one.
+_WELL_KNOWN_PATHS_CACHE = TFCWellKnownPathsCache()
 
 
 class InvalidTFCTokenException(Exception):
     """Cannot instantiate TFC API class without a valid TFC_TOKEN."""
 
 
+# The org and token an API object sends its requests with, along with the headers
+# of the token. It's replaced as a whole rather than updated, so that a thread
+# reading it never sees the org of one configuration and the token of another.
+_TFCConfig = namedtuple("_TFCConfig", ["org", "token", "headers"])
+
+
+def _token_headers(token):
+    """
+    Return the read only headers sent with every request authenticated by
+    ``token``, or by a token of a token pool picked by the session.
+    """
+    return MappingProxyType({
+        "Authorization": \
+            token.authorization if isinstance(token, TFCTokenPool) else f"Bearer {token}",
+        "Content-Type": "application/vnd.api+json"
+    })
+
+
+def _token_pool(api_token, rate_limit, rate_limit_burst):
+    """
+    Return the token pool of the token given to an API object, i.e. a pool of
+    the tokens if it's a list of them, or ``None`` if it's a single token.
+    """
+    if isinstance(api_token, (list, tuple)):
+        return TFCTokenPool(api_token, rate=rate_limit, burst=rate_limit_burst)
+    return api_token if isinstance(api_token, TFCTokenPool) else None
+
+
+class _EndpointDescriptor():
+    """
+    Descriptor for an endpoint attribute of the ``TFC`` class, which builds the
+    endpoint on its first access and caches it for the org and token it was
+    built with, so that switching either is free and endpoints which are never
+    used are never built.
+    """
+
+    def __init__(self, name, endpoint_class_name, org_required):
+        self._name = name
+        self._endpoint_class_name = endpoint_class_name
+        self._org_required = org_required
+
+    def __get__(self, api, owner=None):
+        if api is None:
+            return self
+        # pylint: disable=protected-access
+        return api._get_endpoint(\
+            self._name, _load_endpoint_class(self._endpoint_class_name), self._org_required)
+
+
 class TFC():
     """
     Super class for access to all TFC Endpoints.
@@ -69,57 +133,110 @@ class TFC():
 
     # This dict specifies which class should be used for each attribute of this API class,
     # which simplifies the initialization of each endpoint since they share the same initialization
-    # values.
+    # values. Each class is defined in the module named after its attribute, and only imported
+    # once the attribute is first used.
     _class_for_attr_dict = {
         "org-not-required": {
-            "admin_orgs": TFCAdminOrgs,
-            "admin_module_sharing": TFCAdminModuleSharing,
-            "admin_runs": TFCAdminRuns,
-            "admin_settings": TFCAdminSettings,
-            "admin_terraform_versions": TFCAdminTerraformVersions,
-            "admin_users": TFCAdminUsers,
-            "admin_workspaces": TFCAdminWorkspaces,
-            "audit_trails": TFCAuditTrails,
-            "ip_ranges": TFCIPRanges,
-            "orgs": TFCOrgs
+            "admin_orgs": "TFCAdminOrgs",
+            "admin_module_sharing": "TFCAdminModuleSharing",
+            "admin_runs": "TFCAdminRuns",
+            "admin_settings": "TFCAdminSettings",
+            "admin_terraform_versions": "TFCAdminTerraformVersions",
+            "admin_users": "TFCAdminUsers",
+            "admin_workspaces": "TFCAdminWorkspaces",
+            "audit_trails": "TFCAuditTrails",
+            "ip_ranges": "TFCIPRanges",
+            "orgs": "TFCOrgs"
         },
         "org-required": {
-            "account": TFCAccount,
-            "applies": TFCApplies,
-            "agents": TFCAgents,
-            "agent_tokens": TFCAgentTokens,
-            "config_versions": TFCConfigVersions,
-            "cost_estimates": TFCCostEstimates,
-            "oauth_clients": TFCOAuthClients,
-            "oauth_tokens": TFCOAuthTokens,
-            "org_memberships": TFCOrgMemberships,
-            "org_tokens": TFCOrgTokens,
-            "plans": TFCPlans,
-            "plan_exports": TFCPlanExports,
-            "policies": TFCPolicies,
-            "policy_checks": TFCPolicyChecks,
-            "policy_sets": TFCPolicySets,
-            "policy_set_params": TFCPolicySetParams,
-            "notification_configs": TFCNotificationConfigurations,
-            "registry_modules": TFCRegistryModules,
-            "run_triggers": TFCRunTriggers,
-            "runs": TFCRuns,
-            "state_versions": TFCStateVersions,
-            "state_version_outputs": TFCStateVersionOutputs,
-            "ssh_keys": TFCSSHKeys,
-            "teams": TFCTeams,
-            "team_access": TFCTeamAccess,
-            "team_memberships": TFCTeamMemberships,
-            "team_tokens": TFCTeamTokens,
-            "users": TFCUsers,
-            "user_tokens": TFCUserTokens,
-            "vars": TFCVars,
-            "workspace_vars": TFCWorkspaceVars,
-            "workspaces": TFCWorkspaces
+            "account": "TFCAccount",
+            "applies": "TFCApplies",
+            "agents": "TFCAgents",
+            "agent_tokens": "TFCAgentTokens",
+            "config_versions": "TFCConfigVersions",
+            "cost_estimates": "TFCCostEstimates",
+            "oauth_clients": "TFCOAuthClients",
+            "oauth_tokens": "TFCOAuthTokens",
+            "org_memberships": "TFCOrgMemberships",
+            "org_tokens": "TFCOrgTokens",
+            "plans": "TFCPlans",
+            "plan_exports": "TFCPlanExports",
+            "policies": "TFCPolicies",
+            "policy_checks": "TFCPolicyChecks",
+            "policy_sets": "TFCPolicySets",
+            "policy_set_params": "TFCPolicySetParams",
+            "notification_configs": "TFCNotificationConfigurations",
+            "registry_modules": "TFCRegistryModules",
+            "run_triggers": "TFCRunTriggers",
+            "runs": "TFCRuns",
+            "state_versions": "TFCStateVersions",
+            "state_version_outputs": "TFCStateVersionOutputs",
+            "ssh_keys": "TFCSSHKeys",
+            "teams": "TFCTeams",
+            "team_access": "TFCTeamAccess",
+            "team_memberships": "TFCTeamMemberships",
+            "team_tokens": "TFCTeamTokens",
+            "users": "TFCUsers",
+            "user_tokens": "TFCUserTokens",
+            "vars": "TFCVars",
+            "workspace_vars": "TFCWorkspaceVars",
+            "workspaces": "TFCWorkspaces"
         }
     }
 
-    def __init__(self, api_token, url=TFC_SAAS_URL, verify=True, log_level=API_LOG_LEVEL):
+    # Endpoints are only built on first access, see ``_EndpointDescriptor``.
+    admin_module_sharing: "TFCAdminModuleSharing"
+    admin_orgs: "TFCAdminOrgs"
+    admin_runs: "TFCAdminRuns"
+    admin_settings: "TFCAdminSettings"
+    admin_terraform_versions: "TFCAdminTerraformVersions"
+    admin_users: "TFCAdminUsers"
+    admin_workspaces: "TFCAdminWorkspaces"
+    audit_trails: "TFCAuditTrails"
+    ip_ranges: "TFCIPRanges"
+    orgs: "TFCOrgs"
+    account: "TFCAccount"
+    applies: "TFCApplies"
+    agents: "TFCAgents"
+    agent_tokens: "TFCAgentTokens"
+    config_versions: "TFCConfigVersions"
+    cost_estimates: "TFCCostEstimates"
+    oauth_clients: "TFCOAuthClients"
+    oauth_tokens: "TFCOAuthTokens"
+    org_memberships: "TFCOrgMemberships"
+    org_tokens: "TFCOrgTokens"
+    plans: "TFCPlans"
+    plan_exports: "TFCPlanExports"
+    policies: "TFCPolicies"
+    policy_checks: "TFCPolicyChecks"
+    policy_sets: "TFCPolicySets"
+    policy_set_params: "TFCPolicySetParams"
+    notification_configs: "TFCNotificationConfigurations"
+    registry_modules: "TFCRegistryModules"
+    run_triggers: "TFCRunTriggers"
+    runs: "TFCRuns"
+    state_versions: "TFCStateVersions"
+    state_version_outputs: "TFCStateVersionOutputs"
+    ssh_keys: "TFCSSHKeys"
+    teams: "TFCTeams"
+    team_access: "TFCTeamAccess"
+    team_memberships: "TFCTeamMemberships"
+    team_tokens: "TFCTeamTokens"
+    users: "TFCUsers"
+    user_tokens: "TFCUserTokens"
+    vars: "TFCVars"
+    workspace_vars: "TFCWorkspaceVars"
+    workspaces: "TFCWorkspaces"
+
+    def __init__(self, api_token, url=TFC_SAAS_URL, verify=True, log_level=API_LOG_LEVEL, \
+        pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, \
+            keep_alive=HTTP_KEEP_ALIVE, rate_limit=RATE_LIMIT_REQUESTS_PER_SECOND, \
+                rate_limit_burst=None, rate_limit_max_retries=RATE_LIMIT_MAX_RETRIES, \
+                    retry_policy=None, connect_timeout=HTTP_CONNECT_TIMEOUT, \
+                        read_timeout=HTTP_READ_TIMEOUT, well_known_paths=None, \
+                            well_known_paths_cache=None, serializer=None, response_cache=None, \
+                                artifact_cache=None, resource_cache=None, \
+                                    coalesce_gets=HTTP_COALESCE_GETS):
         if api_token is None:
             raise InvalidTFCTokenException
 
@@ -129,100 +246,148 @@ class TFC():
 
         self._logger.debug("Initializing the TFC API class...")
 
+        # Suppress insecure TLS warnings
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
         self._instance_url = url
-        self._token = api_token
-        self._current_org = None
+        # Each token of a pool has its own rate limiter, instead of one shared by all requests.
+        self._token_pool = _token_pool(api_token, rate_limit, rate_limit_burst)
+        if self._token_pool is not None:
+            api_token = self._token_pool
+        self._config = _TFCConfig(None, api_token, _token_headers(api_token))
         self._verify = verify
-
-        self.admin_module_sharing: TFCAdminModuleSharing = None
-        self.admin_orgs: TFCAdminOrgs = None
-        self.admin_runs: TFCAdminRuns = None
-        self.admin_settings: TFCAdminSettings = None
-        self.admin_terraform_versions: TFCAdminTerraformVersions = None
-        self.admin_users: TFCAdminUsers = None
-        self.admin_workspaces: TFCAdminWorkspaces = None
-        self.audit_trails: TFCAuditTrails = None
-        self.ip_ranges: TFCIPRanges = None
-        self.orgs: TFCOrgs = None
-        self.account: TFCAccount = None
-        self.applies: TFCApplies = None
-        self.agents: TFCAgents = None
-        self.agent_tokens: TFCAgentTokens = None
-        self.config_versions: TFCConfigVersions = None
-        self.cost_estimates: TFCCostEstimates = None
-        self.oauth_clients: TFCOAuthClients = None
-        self.oauth_tokens: TFCOAuthTokens = None
-        self.org_memberships: TFCOrgMemberships = None
-        self.org_tokens: TFCOrgTokens = None
-        self.plans: TFCPlans = None
-        self.plan_exports: TFCPlanExports = None
-        self.policies: TFCPolicies = None
-        self.policy_checks: TFCPolicyChecks = None
-        self.policy_sets: TFCPolicySets = None
-        self.policy_set_params: TFCPolicySetParams = None
-        self.notification_configs: TFCNotificationConfigurations = None
-        self.registry_modules: TFCRegistryModules = None
-        self.run_triggers: TFCRunTriggers = None
-        self.runs: TFCRuns = None
-        self.state_versions: TFCStateVersions = None
-        self.state_version_outputs: TFCStateVersionOutputs = None
-        self.ssh_keys: TFCSSHKeys = None
-        self.teams: TFCTeams = None
-        self.team_access: TFCTeamAccess = None
-        self.team_memberships: TFCTeamMemberships = None
-        self.team_tokens: TFCTeamTokens = None
-        self.users: TFCUsers = None
-        self.user_tokens: TFCUserTokens = None
-        self.vars: TFCVars = None
-        self.workspace_vars: TFCWorkspaceVars = None
-        self.workspaces: TFCWorkspaces = None
-
-        self._token = None
-        self._headers = None
-
-        self._logger.debug("Retrieving TFC API well known paths..")
-        self._well_known_paths = self.well_known_paths()
-        self._logger.debug("TFC API well known paths retrieved.")
-
-        self.set_token(api_token)
-        self._initialize_endpoints()
+        self._rate_limiter = TFCRateLimiter(rate_limit, burst=rate_limit_burst) \
+            if rate_limit and self._token_pool is None else None
+        self._retry_policy = retry_policy if retry_policy is not None else TFCRetryPolicy()
+        self._serializer = serializer if serializer is not None else TFCJSONSerializer()
+        self._response_cache = response_cache
+        self._artifact_cache = artifact_cache
+        self._resource_cache = resource_cache
+        self._session = self._create_session(\
+            pool_connections, pool_maxsize, keep_alive, \
+                self._rate_limiter, rate_limit_max_retries, self._retry_policy, \
+                    connect_timeout, read_timeout, response_cache, resource_cache, coalesce_gets, \
+                        self._token_pool)
+
+        # The well known paths are only discovered once an endpoint is first
+        # used, unless they were given or are already cached.
+        self._well_known_paths = well_known_paths
+        self._well_known_paths_cache = well_known_paths_cache \
+            if well_known_paths_cache is not None else _WELL_KNOWN_PATHS_CACHE
+
+        # Endpoints built so far, keyed by their attribute name, org and token,
+        # which are shared with the views of this API object. Only the most
+        # recently used are kept, so views of many orgs or tokens don't pile up.
+        self._endpoints = OrderedDict()
+        self._endpoints_lock = threading.Lock()
+
+    @staticmethod
+    def _create_session(\
+        pool_connections, pool_maxsize, keep_alive, rate_limiter, rate_limit_max_retries, \
+            retry_policy, connect_timeout, read_timeout, response_cache=None, resource_cache=None, \
+                coalesce_gets=HTTP_COALESCE_GETS, token_pool=None):
+        """
+        Create the connection pooled HTTP session shared by every endpoint of
+        this API class, so that TCP and TLS connections are reused across calls
+        and every request is scheduled through the same rate limiter and retry policy.
+        """
+        session = TFCSession(\
+            rate_limiter=rate_limiter, max_rate_limit_retries=rate_limit_max_retries, \
+                retry_policy=retry_policy, connect_timeout=connect_timeout, \
+                    read_timeout=read_timeout, response_cache=response_cache, \
+                        resource_cache=resource_cache, coalesce_gets=coalesce_gets, \
+                            token_pool=token_pool)
+        adapter = HTTPAdapter(\
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
 
     def _get(self, url):
         """
         Simplified HTTP GET function for usage only with this API module.
         """
+        req = self._session.get(url, headers=self._config.headers, verify=self._verify)
+        return self._get_results(url, req)
+
+    def _get_results(self, url, req):
+        """
+        Return the decoded results of an HTTP GET response, or ``None`` if it failed.
+        """
         results = None
-        req = requests.get(url, headers=self._headers, verify=self._verify)
 
         if req.status_code == HTTP_OK:
-            results = json.loads(req.content)
+            results = self._serializer.loads(req.content)
             self._logger.debug(f"GET to {url} successful")
         else:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
 
         return results
 
-    def _initialize_endpoints(self):
-        self._logger.debug("Initializing endpoints that don't require an org to be set...")
-        # Loop through all the endpoints that don't require an org and initialize them
-        for ep_name in self._class_for_attr_dict["org-not-required"]:
-            class_for_attr = self._class_for_attr_dict["org-not-required"][ep_name]
-            initialized_endpoint_class = class_for_attr(
-                self._instance_url,
-                None,
-                self._headers,
-                self._well_known_paths,
-                self._verify,
-                self._log_level)
-            setattr(self, ep_name, initialized_endpoint_class)
-
-        self._logger.debug("Initialized endpoints that don't require an org to be set.")
-        # Loop through all the endpoints that do require an org and initialize them
-        for ep_name in self._class_for_attr_dict["org-required"]:
-            setattr(self, ep_name, None)
-
-        self._logger.debug("TFC API class initialized.")
+    def _get_well_known_paths(self):
+        """
+        Return the well known paths of the TFC installation, from the cache if
+        they're in it, else discovering and caching them.
+        """
+        if self._well_known_paths is None:
+            self._well_known_paths = self._well_known_paths_cache.get(self._instance_url)
+
+        if self._well_known_paths is None:
+            self._logger.debug("Retrieving TFC API well known paths..")
+            self._well_known_paths = self.well_known_paths()
+            self._logger.debug("TFC API well known paths retrieved.")
+
+            if self._well_known_paths is not None:
+                self._well_known_paths_cache.set(self._instance_url, self._well_known_paths)
+
+        return self._well_known_paths
+
+    def _build_endpoint(self, endpoint_class, org_name, headers):
+        """
+        Initialize an endpoint class with the shared configuration of this API class.
+        """
+        return endpoint_class(
+            self._instance_url,
+            org_name,
+            headers,
+            self._get_well_known_paths(),
+            self._verify,
+            self._log_level,
+            session=self._session,
+            serializer=self._serializer,
+            artifact_cache=self._artifact_cache)
+
+    def _get_endpoint(self, ep_name, endpoint_class, org_required):
+        """
+        Return the endpoint for the current org and token, building it if it
+        hasn't been used with them yet. Endpoints which require an org are
+        ``None`` until one is set.
+        """
+        # Read the configuration once, as it may be replaced by another thread meanwhile.
+        config = self._config
+        org_name = config.org if org_required else None
+        if org_required and org_name is None:
+            return None
+
+        key = (ep_name, org_name, config.token)
+        with self._endpoints_lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is not None:
+                self._endpoints.move_to_end(key)
+                return endpoint
+
+        endpoint = self._build_endpoint(endpoint_class, org_name, config.headers)
+        with self._endpoints_lock:
+            endpoint = self._endpoints.setdefault(key, endpoint)
+            while len(self._endpoints) > ENDPOINT_CACHE_MAX_ENTRIES:
+                self._endpoints.popitem(last=False)
+
+        return endpoint
 
     def get_url(self):
         """
@@ -234,32 +399,106 @@ class TFC():
         """
         Sets the organization to use for org specific endpoints.
         This method must be called for any non-admin endpoint to work.
+
+        This changes the org of every thread using this API object, see ``with_org``
+        to use several orgs at once.
         """
 
-        self._logger.debug("Initializing endpoints that do require an org to be set...")
+        # Replace the configuration, the endpoints which require an org are
+        # built for it on their first use.
+        self._config = self._config._replace(org=org_name)
 
-        # Update the current org attribute
-        self._current_org = org_name
+    def with_org(self, org_name):
+        """
+        Return a view of this API object using another organization, which
+        shares its connection pool, rate limiter, caches and endpoints, while
+        this API object keeps its own org. Views are cheap, so threads working
+        on different orgs can each make their own from one shared API object.
+        """
+        return self._with_config(self._config._replace(org=org_name))
 
-        for ep_name in self._class_for_attr_dict["org-required"]:
-            class_for_attr = self._class_for_attr_dict["org-required"][ep_name]
-            initialized_endpoint_class = class_for_attr(
-                self._instance_url,
-                self._current_org,
-                self._headers,
-                self._well_known_paths,
-                self._verify,
-                self._log_level)
+    def with_token(self, token):
+        """
+        Return a view of this API object using another token, which shares its
+        connection pool, rate limiter, caches and endpoints, while this API
+        object keeps its own token.
+        """
+        if token is None:
+            raise InvalidTFCTokenException
+        return self._with_config(self._token_config(token))
 
-            setattr(self, ep_name, initialized_endpoint_class)
+    def _token_config(self, token):
+        """
+        Return the configuration of this API object using another token, or
+        its token pool again.
+        """
+        if isinstance(token, (list, tuple, TFCTokenPool)) and token is not self._token_pool:
+            raise ValueError("Only the token pool given to the API object can be used by it.")
+        return self._config._replace(token=token, headers=_token_headers(token))
+
+    def _with_config(self, config):
+        """
+        Return a shallow copy of this API object using another configuration.
+        """
+        view = copy.copy(self)
+        view._config = config  # pylint: disable=protected-access
+        return view
+
+    def close(self):
+        """
+        Close the pooled connections held by this API object, its endpoints and its views.
+        """
+        self._session.close()
+
+    @staticmethod
+    def deadline(seconds):
+        """
+        Return a context manager bounding every request sent within it, including
+        the ones of multi-request helpers such as ``list_all``, by an overall
+        deadline of ``seconds``. See ``terrasnek.transport.deadline``.
+        """
+        return deadline(seconds)
+
+    @staticmethod
+    def timeout(connect=None, read=None):
+        """
+        Return a context manager overriding the connect and read timeouts of
+        every request sent within it. See ``terrasnek.transport.timeout``.
+        """
+        return timeout(connect=connect, read=read)
+
+    def get_retry_policy(self):
+        """
+        Allows for the user to retrieve the retry policy, and its retry counts, from the API object.
+        """
+        return self._retry_policy
+
+    def get_response_cache(self):
+        """
+        Allows for the user to retrieve the response cache, and its hit counts, from the
+        API object, or ``None`` if responses aren't cached.
+        """
+        return self._response_cache
 
-        self._logger.debug("Initialized endpoints that do require an org to be set.")
+    def get_artifact_cache(self):
+        """
+        Allows for the user to retrieve the artifact cache from the API object, or ``None``
+        if artifacts aren't cached.
+        """
+        return self._artifact_cache
+
+    def get_resource_cache(self):
+        """
+        Allows for the user to retrieve the resource cache, and its hit counts, from the
+        API object, or ``None`` if resources aren't cached.
+        """
+        return self._resource_cache
 
     def get_org(self):
         """
         Allows for the user to retrieve the current org from the API object.
         """
-        return self._current_org
+        return self._config.org
 
     def get_entitlements(self):
         """
@@ -269,7 +508,7 @@ class TFC():
 
         if self.is_terraform_cloud():
             try:
-                entitlements = self.orgs.entitlements(self._current_org)["data"]["attributes"]
+                entitlements = self.orgs.entitlements(self._config.org)["data"]["attributes"]
             except TFCHTTPNotFound:
                 self._logger.debug("Entitlements API endpoint not found. No entitlements recorded.")
         else:
@@ -281,19 +520,24 @@ class TFC():
         """
         Allows for the user to change the token they are using on the fly if
         they need to change tokens.
+
+        This changes the token of every thread using this API object, see
+        ``with_token`` to use several tokens at once.
         """
-        self._token = token
-        self._headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/vnd.api+json"
-        }
-        self._initialize_endpoints()
+        self._config = self._token_config(token)
 
     def get_token(self):
         """
-        Allows for the user to retrieve the token from the API object.
+        Allows for the user to retrieve the token, or the token pool, from the API object.
+        """
+        return self._config.token
+
+    def get_token_pool(self):
+        """
+        Allows for the user to retrieve the token pool from the API object, or ``None``
+        if it was given a single token.
         """
-        return self._token
+        return self._token_pool
 
     def is_terraform_cloud(self):
         return TFC_SAAS_HOSTNAME in self._instance_url
@@ -305,3 +549,36 @@ class TFC():
         """
         url = f"{self._instance_url}/.well-known/terraform.json"
         return self._get(url)
+
+
+# Module each endpoint class is defined in, keyed by class name.
+_ENDPOINT_MODULES = {}
+
+# Add an endpoint attribute to the API class for each of its endpoints.
+# pylint: disable=protected-access
+for _group, _class_for_attr in TFC._class_for_attr_dict.items():
+    for _ep_name, _endpoint_class_name in _class_for_attr.items():
+        _ENDPOINT_MODULES[_endpoint_class_name] = f".{_ep_name}"
+        setattr(TFC, _ep_name, _EndpointDescriptor(\
+            _ep_name, _endpoint_class_name, _group == "org-required"))
+
+
+def _load_endpoint_class(class_name):
+    """
+    Return an endpoint class, importing its module on first use, since most
+    programs only ever use a few of the endpoints.
+    """
+    endpoint_class = globals().get(class_name)
+    if endpoint_class is None:
+        module = importlib.import_module(_ENDPOINT_MODULES[class_name], __package__)
+        endpoint_class = getattr(module, class_name)
+        globals()[class_name] = endpoint_class
+
+    return endpoint_class
+
+
+def __getattr__(name):
+    # Keep the endpoint classes importable from this module.
+    if name in _ENDPOINT_MODULES:
+        return _load_endpoint_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,900 @@
+"""
+Module for the asyncio container class of all TFC endpoints.
+
+The endpoints of ``AsyncTFC`` are the same classes used by ``TFC``, so they
+share the URL building of each endpoint and the response classification of
+``TFCEndpoint``, but their HTTP verbs are coroutines on an ``aiohttp`` pool.
+"""
+
+import asyncio
+import contextvars
+import copy
+import functools
+import itertools
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict, deque, namedtuple
+from contextlib import ExitStack
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from ._constants import \
+    TFC_SAAS_URL, API_LOG_LEVEL, MAX_PAGE_SIZE, MAX_PAGE_FETCH_WORKERS, \
+        DOWNLOAD_CHUNK_SIZE, HTTP_OK, HTTP_POOL_MAXSIZE, HTTP_KEEP_ALIVE, HTTP_CONNECT_TIMEOUT, \
+            HTTP_READ_TIMEOUT, HTTP_TOO_MANY_REQUESTS, RATE_LIMIT_REQUESTS_PER_SECOND, \
+                RATE_LIMIT_MAX_RETRIES, SLUG_COMPRESS_LEVEL, SLUG_MANIFEST_PATH, \
+                    DOWNLOAD_SEGMENT_SIZE, DOWNLOAD_MAX_WORKERS, HTTP_PARTIAL_CONTENT, \
+                        HTTP_RANGE_NOT_SATISFIABLE, HTTP_NOT_MODIFIED, HTTP_NOT_FOUND, \
+                            HTTP_COALESCE_GETS
+from .api import \
+    TFC, InvalidTFCTokenException, _WELL_KNOWN_PATHS_CACHE, _TFCConfig, _token_headers, _token_pool
+from .endpoint import TFCEndpoint, _SizedIterable, _open_source, _open_target, _segment_headers
+from .documents import TFCResources
+from .exceptions import TFCHTTPNotFound, TFCDownloadVerificationFailed, TFCDeadlineExceeded
+from .config_versions import TFCConfigVersions
+from .policies import TFCPolicies
+from .policy_sets import TFCPolicySets
+from .state_versions import TFCStateVersions
+from .serializers import TFCJSONSerializer
+from .slug import SlugManifest
+from ._segments import Checksum, SegmentedDownload
+from .transport import \
+    TFCRateLimiter, TFCRetryPolicy, _retry_after_seconds, _retry_delay, _request_timeout, \
+        _remaining_time, _deadline_expired, _check_wait, _body_position, _rewind_body, \
+            _coalesce_key, _is_bounded, _is_conditional, _is_pooled, _retry_with_another_token
+
+# The subset of a ``requests.Response`` read by the ``TFCEndpoint._*_results`` methods.
+_AsyncResponse = namedtuple(\
+    "_AsyncResponse", ["status_code", "content", "headers", "history", "url"])
+
+# The coroutines of this module override the blocking methods they mirror.
+# pylint: disable=invalid-overridden-method
+
+# Requests started while the synchronous body of an endpoint method runs, so the
+# coroutine wrapping that method can await the ones the method does not return.
+_PENDING_REQUESTS = contextvars.ContextVar("terrasnek_pending_requests", default=None)
+
+# Public endpoint methods that never hit the API, and so stay synchronous.
+_SYNC_METHOD_NAMES = {name for name in dir(TFCEndpoint) if not name.startswith("_")}
+
+
+async def _async_chunks(iterable):
+    """
+    Adapt an iterable upload body to the async iterable ``aiohttp`` streams,
+    producing each chunk in a thread, since e.g. packing a slug reads, tars and
+    compresses files.
+    """
+    loop = asyncio.get_running_loop()
+    chunks = iter(iterable)
+    while True:
+        chunk = await loop.run_in_executor(None, next, chunks, None)
+        if chunk is None:
+            return
+        yield chunk
+
+
+async def _resolve_url(url):
+    """
+    Return a URL given either as is, or as a function returning it or a
+    coroutine of it, see ``TFCEndpoint._download_immutable``.
+    """
+    if callable(url):
+        url = url()
+        if inspect.isawaitable(url):
+            url = await url
+    return url
+
+
+def _cancel_all(tasks):
+    for task in tasks:
+        task.cancel()
+
+
+def _track(request):
+    pending_requests = _PENDING_REQUESTS.get()
+    if pending_requests is not None:
+        pending_requests.append(request)
+    return request
+
+
+def _coroutine_method(method):
+    """
+    Wrap a synchronous endpoint method so that it becomes a coroutine which
+    awaits every request the method started.
+    """
+    @functools.wraps(method)
+    async def coroutine_method(self, *args, **kwargs):
+        pending_requests = []
+        token = _PENDING_REQUESTS.set(pending_requests)
+        try:
+            results = method(self, *args, **kwargs)
+        except Exception:
+            for request in pending_requests:
+                request.close()
+            raise
+        finally:
+            _PENDING_REQUESTS.reset(token)
+
+        awaited_results = results
+        try:
+            for request in pending_requests:
+                request_results = await request
+                if request is results:
+                    awaited_results = request_results
+        finally:
+            # Closing a coroutine which already ran is a no-op.
+            for request in pending_requests:
+                request.close()
+
+        if awaited_results is results and inspect.isawaitable(results):
+            awaited_results = await results
+
+        return awaited_results
+
+    return coroutine_method
+
+
+class AsyncTFCSession():
+    """
+    Asyncio counterpart of ``TFCSession``, scheduling every request on an
+    ``aiohttp`` session through the rate limiter and retry policy, if set, with
+    the timeouts of the session bounded by the ``deadline`` of the current context.
+    If ``coalesce_gets`` is turned on, a GET sent while an identical one is in
+    flight, e.g. by another task, waits for it and shares its response, unless
+    the session sent a write since the one in flight started. Given a
+    ``token_pool``, requests are spread over its tokens like ``TFCSession`` does.
+    """
+
+    def __init__(\
+        self, client_session, rate_limiter=None, max_rate_limit_retries=RATE_LIMIT_MAX_RETRIES, \
+            retry_policy=None, connect_timeout=HTTP_CONNECT_TIMEOUT, \
+                read_timeout=HTTP_READ_TIMEOUT, response_cache=None, resource_cache=None, \
+                    coalesce_gets=HTTP_COALESCE_GETS, token_pool=None):
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._client_session = client_session
+        self.rate_limiter = rate_limiter
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.retry_policy = retry_policy
+        self.timeout = (connect_timeout, read_timeout)
+        self.response_cache = response_cache
+        self.resource_cache = resource_cache
+        self._in_flight = {} if coalesce_gets else None
+        self._writes = itertools.count(1)
+        self._write_generation = 0
+        self.token_pool = token_pool
+
+    async def request(\
+        self, method, url, on_chunk=None, on_headers=None, chunk_size=DOWNLOAD_CHUNK_SIZE, \
+            **kwargs):
+        """
+        Send a request, returning the fully read response. If ``on_chunk`` is
+        given, the body of a successful response is passed to it in chunks of
+        ``chunk_size`` bytes as they arrive instead, and left out of the response,
+        after passing it without its body to ``on_headers``, if given. Both are
+        coroutine functions, awaited before the next chunk is read.
+        """
+        if method.upper() != "GET":
+            try:
+                return await self._read_through(\
+                    method, url, on_chunk, on_headers, chunk_size, **kwargs)
+            finally:
+                # Later GETs don't share the response of one which may have been read before it.
+                self._write_generation = next(self._writes)
+
+        if self._in_flight is None or on_chunk is not None:
+            return await self._read_through(method, url, on_chunk, on_headers, chunk_size, **kwargs)
+
+        key = _coalesce_key(\
+            method, url, kwargs.get("headers"), kwargs.get("allow_redirects", True), \
+                self._write_generation)
+        leader = key not in self._in_flight
+        if leader:
+            # The call runs in the context of the caller which made it, deadline included.
+            call = asyncio.ensure_future(\
+                self._read_through(method, url, on_chunk, on_headers, chunk_size, **kwargs))
+            self._in_flight[key] = (call, _is_bounded())
+            call.add_done_callback(functools.partial(self._call_done, key))
+        call, bounded = self._in_flight[key]
+
+        # Shield the call, so that cancelling one caller doesn't cancel the others.
+        # Its response is immutable, so it's shared as is, but not its exception.
+        try:
+            return await asyncio.wait_for(asyncio.shield(call), _remaining_time())
+        except asyncio.TimeoutError as err:
+            if not call.done() or _deadline_expired():
+                raise TFCDeadlineExceeded(\
+                    "The deadline ran out while waiting for the response.") from None
+            if leader:
+                raise
+            if not bounded:
+                raise copy.copy(err) from err
+        except TFCDeadlineExceeded as err:
+            if leader:
+                raise
+            if not bounded:
+                raise copy.copy(err) from err
+        except Exception as err:
+            if leader:
+                raise
+            raise copy.copy(err) from err
+
+        # The call ran out of the deadline or timeout of its caller, which this one may not share.
+        return await self._read_through(method, url, on_chunk, on_headers, chunk_size, **kwargs)
+
+    def _call_done(self, key, call):
+        if self._in_flight.get(key, (None,))[0] is call:
+            del self._in_flight[key]
+        if not call.cancelled():
+            # Mark the exception as retrieved, in case every caller was cancelled.
+            call.exception()
+
+    async def _read_through(self, method, url, on_chunk, on_headers, chunk_size, **kwargs):
+        if self.resource_cache is None or on_chunk is not None \
+            or _is_conditional(kwargs.get("headers")):
+            return await self._revalidate(method, url, on_chunk, on_headers, chunk_size, **kwargs)
+
+        if method.upper() != "GET":
+            req = await self._revalidate(method, url, on_chunk, on_headers, chunk_size, **kwargs)
+            self.resource_cache.invalidate(url, req.content)
+            return req
+
+        key = self.resource_cache.key(url, kwargs.get("headers"))
+        generation = self.resource_cache.generation
+        content = self.resource_cache.get(key)
+        if content is not None:
+            return _AsyncResponse(HTTP_OK, content, {}, (), url)
+
+        req = await self._revalidate(method, url, on_chunk, on_headers, chunk_size, **kwargs)
+        if req.status_code == HTTP_OK:
+            self.resource_cache.set(key, url, req.content, generation)
+        return req
+
+    async def _revalidate(self, method, url, on_chunk, on_headers, chunk_size, **kwargs):
+        if self.response_cache is None or method.upper() != "GET" or on_chunk is not None \
+            or _is_conditional(kwargs.get("headers")):
+            return await self._send(method, url, on_chunk, on_headers, chunk_size, **kwargs)
+
+        key = self.response_cache.key(url, kwargs.get("headers"))
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            kwargs["headers"] = dict(\
+                kwargs.get("headers") or {}, **self.response_cache.conditional_headers(cached))
+
+        req = await self._send(method, url, on_chunk, on_headers, chunk_size, **kwargs)
+        self.response_cache.record(cached is not None and req.status_code == HTTP_NOT_MODIFIED)
+        if cached is not None and req.status_code == HTTP_NOT_MODIFIED:
+            # A 304 has no body, so answer with the cached one as if it was sent again.
+            req = req._replace(status_code=HTTP_OK, content=cached.content)
+        elif req.status_code == HTTP_OK:
+            self.response_cache.set(key, req.headers, req.content)
+        elif req.status_code == HTTP_NOT_FOUND:
+            self.response_cache.discard(key)
+
+        return req
+
+    async def _send(self, method, url, on_chunk, on_headers, chunk_size, **kwargs):
+        rate_limit_retries = 0
+        retries = 0
+        started_at = time.monotonic()
+        streamed = False
+        body = kwargs.get("data")
+        body_position = _body_position(body)
+        headers = kwargs.get("headers")
+        pooled = _is_pooled(self.token_pool, headers)
+
+        while True:
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve()
+                _check_wait(wait)
+                await asyncio.sleep(wait)
+
+            if pooled:
+                token, wait = self.token_pool.acquire()
+                _check_wait(wait)
+                await asyncio.sleep(wait)
+                kwargs["headers"] = dict(headers, Authorization=f"Bearer {token}")
+
+            connect_read_timeouts = _request_timeout(*self.timeout)
+            request_timeout = aiohttp.ClientTimeout(total=_remaining_time(), \
+                sock_connect=connect_read_timeouts[0], sock_read=connect_read_timeouts[1])
+
+            try:
+                async with self._client_session.request(\
+                    method, url, timeout=request_timeout, **kwargs) as resp:
+                    if on_chunk is not None and resp.status in (HTTP_OK, HTTP_PARTIAL_CONTENT):
+                        streamed = True
+                        if on_headers is not None:
+                            await on_headers(_AsyncResponse(\
+                                resp.status, b"", resp.headers, resp.history, str(resp.url)))
+                        async for chunk in resp.content.iter_chunked(chunk_size):
+                            await on_chunk(chunk)
+                        content = b""
+                    else:
+                        content = await resp.read()
+                    req = _AsyncResponse(\
+                        resp.status, content, resp.headers, resp.history, str(resp.url))
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+                if isinstance(err, asyncio.TimeoutError) and _deadline_expired():
+                    raise TFCDeadlineExceeded(\
+                        "The deadline ran out while waiting for the response.") from err
+                # Part of the body may have been passed on already, so it can't be retried.
+                delay = None if streamed else self._retry_delay(method, retries, started_at)
+                if delay is None or not _rewind_body(body, body_position):
+                    raise
+                retries += 1
+                self._record_retry(method, url, type(err).__name__, retries, delay)
+                await asyncio.sleep(delay)
+                continue
+
+            if pooled:
+                self.token_pool.update(token, req.status_code, req.headers)
+                if _retry_with_another_token(self.token_pool, req.status_code, \
+                    rate_limit_retries, self.max_rate_limit_retries) and \
+                        _rewind_body(body, body_position):
+                    rate_limit_retries += req.status_code == HTTP_TOO_MANY_REQUESTS
+                    self._logger.debug(\
+                        f"HTTP {method} to {url} was refused with HTTP {req.status_code}, "
+                        "retrying with another token...")
+                    continue
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(req.status_code, req.headers)
+                if req.status_code == HTTP_TOO_MANY_REQUESTS and \
+                    rate_limit_retries < self.max_rate_limit_retries and \
+                        _rewind_body(body, body_position):
+                    rate_limit_retries += 1
+                    self._logger.debug(\
+                        f"HTTP {method} to {url} was rate limited, retrying "
+                        f"({rate_limit_retries})...")
+                    continue
+
+            if self.retry_policy is not None and \
+                req.status_code in self.retry_policy.status_codes:
+                delay = self._retry_delay(\
+                    method, retries, started_at, _retry_after_seconds(req.headers))
+                if delay is not None and _rewind_body(body, body_position):
+                    retries += 1
+                    self._record_retry(method, url, f"HTTP {req.status_code}", retries, delay)
+                    await asyncio.sleep(delay)
+                    continue
+
+            return req
+
+    def _retry_delay(self, method, retries, started_at, retry_after=None):
+        return _retry_delay(self.retry_policy, method, retries, started_at, retry_after)
+
+    def _record_retry(self, method, url, reason, retries, delay):
+        self.retry_policy.record_retry(reason)
+        self._logger.debug(\
+            f"HTTP {method} to {url} failed ({reason}), retry {retries} in {delay:.2f}s...")
+
+    async def close(self):
+        """
+        Close the pooled connections of the session.
+        """
+        await self._client_session.close()
+
+
+class AsyncTFCEndpoint(TFCEndpoint): # pylint: disable=abstract-method
+    """
+    Base class replacing the blocking HTTP verbs of a ``TFCEndpoint`` with
+    coroutines on an ``aiohttp`` session. The endpoints of ``AsyncTFC`` derive
+    from it and the ``TFCEndpoint`` subclass they mirror.
+    """
+
+    async def _request(\
+        self, method, url, results_func, headers=None, data=None, allow_redirects=True, \
+            **results_kwargs):
+        self._logger.debug(f"Trying HTTP {method} to URL: {url} ...")
+        req = await self._session.request(\
+            method, url, data=data, headers=self._headers if headers is None else headers, \
+                ssl=None if self._verify else False, allow_redirects=allow_redirects)
+        return results_func(url, req, **results_kwargs)
+
+    def _delete(self, url, data=None):
+        return _track(self._request(\
+            "DELETE", url, self._delete_results, data=self._serializer.dumps(data)))
+
+    def _get(self, url, return_raw=False, allow_redirects=False, headers=None):
+        headers = None if headers is None else dict(self._headers, **headers)
+        return _track(self._request(\
+            "GET", url, self._get_results, headers=headers, allow_redirects=allow_redirects, \
+                return_raw=return_raw))
+
+    def _patch(self, url, data=None):
+        return _track(self._request(\
+            "PATCH", url, self._patch_results, data=self._serializer.dumps(data)))
+
+    def _post(self, url, data=None):
+        return _track(self._request(\
+            "POST", url, self._post_results, data=self._serializer.dumps(data)))
+
+    def _put(self, url, octet=False, data=None):
+        headers = self._headers
+        if octet is True:
+            headers = dict(self._headers, **{"Content-Type": "application/octet-stream"})
+            data = bytes(data, "utf-8")
+        elif isinstance(data, _SizedIterable):
+            headers = dict(self._headers, **{"Content-Length": str(len(data))})
+            data = _async_chunks(data)
+        elif data is not None and not isinstance(data, (bytes, bytearray, str)) and \
+            not hasattr(data, "read"):
+            data = _async_chunks(data)
+
+        return _track(self._request(\
+            "PUT", url, self._put_results, headers=headers, data=data, octet=octet))
+
+    def _destroy(self, url):
+        return _track(self._request("DELETE", url, self._destroy_results))
+
+    async def _iter_all(\
+        self, url, read_ahead=MAX_PAGE_FETCH_WORKERS, model=None, include=None, resources=None, \
+            **list_kwargs):
+        def fetch_page(page_number):
+            return self._list(\
+                url, page=page_number, page_size=MAX_PAGE_SIZE, include=include, **list_kwargs)
+
+        page = await fetch_page(1)
+        total_pages = self._total_pages(page)
+        next_page_number = 2
+
+        pending_pages = deque()
+        try:
+            while page is not None:
+                while next_page_number <= total_pages and len(pending_pages) < read_ahead:
+                    pending_pages.append(asyncio.ensure_future(fetch_page(next_page_number)))
+                    next_page_number += 1
+
+                for record in self._page_records(page, model, resources):
+                    yield record
+
+                if pending_pages:
+                    page = await pending_pages.popleft()
+                elif next_page_number <= total_pages:
+                    page = await fetch_page(next_page_number)
+                    next_page_number += 1
+                else:
+                    page = None
+        finally:
+            for pending_page in pending_pages:
+                pending_page.cancel()
+
+    async def _list_all(\
+        self, url, max_workers=MAX_PAGE_FETCH_WORKERS, include=None, **list_kwargs):
+        if include is None:
+            return [record async for record in self._iter_all(\
+                url, read_ahead=max_workers, **list_kwargs)]
+
+        resources = TFCResources()
+        async for record in self._iter_all(\
+            url, read_ahead=max_workers, include=include, resources=resources, **list_kwargs):
+            resources.append(record)
+        return resources
+
+    async def _upload(self, url, source, content_length=None):
+        with _open_source(source, content_length=content_length) as data:
+            return await self._put(url, data=data)
+
+    async def _download_immutable(\
+        self, url, target_path, cache_key, checksum=None, **download_kwargs):
+        if self._artifact_cache is None:
+            url = await _resolve_url(url)
+            return await self._download(url, target_path, checksum=checksum, **download_kwargs)
+
+        cache_key = self._artifact_key(cache_key)
+        # Copying and hashing whole files would block the event loop, so run them in a thread.
+        loop = asyncio.get_running_loop()
+        started_at = time.monotonic()
+        byte_count = await loop.run_in_executor(\
+            None, self._artifact_cache.copy_to, cache_key, target_path)
+        if byte_count is not None:
+            if checksum is not None and not hasattr(target_path, "write"):
+                digest = Checksum(checksum)
+                await loop.run_in_executor(None, digest.update_from_file, target_path)
+                digest.verify()
+            self._logger.debug(f"GET of {cache_key} served from the artifact cache")
+            return self._download_results(cache_key, byte_count, started_at)
+
+        url = await _resolve_url(url)
+        results = await self._download(url, target_path, checksum=checksum, **download_kwargs)
+        if not hasattr(target_path, "write"):
+            await loop.run_in_executor(None, self._artifact_cache.put_file, cache_key, target_path)
+        return results
+
+    async def _download(\
+        self, url, target_path, header_with_url=None, allow_redirects=False, \
+            chunk_size=DOWNLOAD_CHUNK_SIZE, checksum=None, max_workers=DOWNLOAD_MAX_WORKERS, \
+                segment_size=DOWNLOAD_SEGMENT_SIZE):
+        if header_with_url is not None:
+            response = await self._get(url, allow_redirects=allow_redirects)
+            if "redirect-url" in response:
+                response = await self._get(response["redirect-url"])
+            url = response[header_with_url]
+            allow_redirects = False
+
+        # Reading and writing files would block the event loop, so do it in threads.
+        loop = asyncio.get_running_loop()
+        segmented = None
+        headers = self._headers
+        if max_workers > 1 and not hasattr(target_path, "write"):
+            segmented = await loop.run_in_executor(\
+                None, SegmentedDownload, target_path, segment_size)
+            if not segmented.pending():
+                # Every segment was written, but the part file wasn't moved to the target.
+                started_at = time.monotonic()
+                digest = Checksum(checksum) if checksum is not None else None
+                try:
+                    await loop.run_in_executor(None, segmented.finish, digest)
+                except TFCDownloadVerificationFailed:
+                    await loop.run_in_executor(None, segmented.discard)
+                    return await self._download(\
+                        url, target_path, allow_redirects=allow_redirects, chunk_size=chunk_size, \
+                            checksum=checksum, max_workers=max_workers, segment_size=segment_size)
+                return self._download_results(url, 0, started_at)
+
+            first_index = segmented.pending()[0]
+            headers = dict(self._headers, **segmented.request_headers(first_index))
+
+        self._logger.debug(f"Trying HTTP GET to URL: {url} ...")
+        started_at = time.monotonic()
+        digest = Checksum(checksum) if checksum is not None else None
+        byte_count = 0
+        first_segment = {}
+        fetches = []
+
+        with ExitStack() as stack:
+            # Only open the target once the download succeeds, like ``TFCEndpoint._download``.
+            target_files = []
+
+            async def read_headers(head):
+                if head.status_code == HTTP_PARTIAL_CONTENT and segmented is not None:
+                    stack.callback(segmented.close)
+                    await loop.run_in_executor(None, segmented.open, head.headers)
+                    first_segment["start"], first_segment["end"] = \
+                        segmented.check_segment(first_index, head.headers)
+                    # Fetch the other segments while the first one is being read.
+                    fetches.extend(self._fetch_segments(\
+                        url, head, first_index, segmented, chunk_size, max_workers))
+                    stack.callback(_cancel_all, fetches)
+                elif segmented is not None:
+                    # The server doesn't support byte ranges, or the remote file
+                    # changed since the part file was downloaded.
+                    await loop.run_in_executor(None, segmented.discard)
+
+            def write_target(chunk):
+                if not target_files:
+                    target_files.append(stack.enter_context(_open_target(target_path)))
+                target_files[0].write(chunk)
+                if digest is not None:
+                    digest.update(chunk)
+
+            async def write_chunk(chunk):
+                nonlocal byte_count
+                if first_segment:
+                    await loop.run_in_executor(None, segmented.write, \
+                        first_segment["start"] + byte_count, chunk, first_segment["end"])
+                else:
+                    await loop.run_in_executor(None, write_target, chunk)
+                byte_count += len(chunk)
+
+            req = await self._session.request(\
+                "GET", url, headers=headers, ssl=None if self._verify else False, \
+                    allow_redirects=allow_redirects, on_chunk=write_chunk, \
+                        on_headers=read_headers, chunk_size=chunk_size)
+
+            if req.status_code == HTTP_PARTIAL_CONTENT and segmented is not None:
+                await loop.run_in_executor(None, segmented.complete, first_index, byte_count)
+                byte_count += sum(await asyncio.gather(*fetches))
+                stack.close()
+                await loop.run_in_executor(None, segmented.finish, digest)
+                return self._download_results(url, byte_count, started_at)
+
+            if segmented is not None and req.status_code == HTTP_RANGE_NOT_SATISFIABLE:
+                await loop.run_in_executor(None, segmented.discard)
+                return await self._download(\
+                    url, target_path, allow_redirects=allow_redirects, chunk_size=chunk_size, \
+                        checksum=checksum, max_workers=1)
+
+            if req.status_code != HTTP_OK:
+                return self._get_results(url, req, return_raw=True)
+
+            if not target_files:
+                await write_chunk(b"")
+
+        if digest is not None:
+            digest.verify()
+
+        return self._download_results(url, byte_count, started_at)
+
+    def _fetch_segments(self, url, first_req, first_index, segmented, chunk_size, max_workers):
+        """
+        Start fetching the segments of ``segmented`` still missing, other than
+        the one at ``first_index`` which ``first_req`` is reading, and return
+        their tasks. Together with it, at most ``max_workers`` are read at once.
+        """
+        segment_url = first_req.url
+        headers = _segment_headers(self._headers, url, first_req)
+        semaphore = asyncio.Semaphore(max(max_workers - 1, 1))
+        loop = asyncio.get_running_loop()
+
+        async def fetch_segment(index):
+            segment = {}
+
+            async def read_headers(head):
+                if head.status_code != HTTP_PARTIAL_CONTENT:
+                    raise TFCDownloadVerificationFailed(\
+                        f"The remote file changed while downloading it to {segmented.target_path}.")
+                segment["start"], segment["end"] = segmented.check_segment(index, head.headers)
+                segment["offset"] = segment["start"]
+
+            async def write_chunk(chunk):
+                await loop.run_in_executor(\
+                    None, segmented.write, segment["offset"], chunk, segment["end"])
+                segment["offset"] += len(chunk)
+
+            async with semaphore:
+                req = await self._session.request(\
+                    "GET", segment_url, headers=dict(headers, **segmented.request_headers(index)), \
+                        ssl=None if self._verify else False, allow_redirects=False, \
+                            on_chunk=write_chunk, on_headers=read_headers, chunk_size=chunk_size)
+
+            if req.status_code != HTTP_PARTIAL_CONTENT:
+                return self._get_results(segment_url, req, return_raw=True)
+
+            await loop.run_in_executor(\
+                None, segmented.complete, index, segment["offset"] - segment["start"])
+            return segment["offset"] - segment["start"]
+
+        return [\
+            asyncio.ensure_future(fetch_segment(index)) \
+                for index in segmented.pending() if index != first_index]
+
+
+class _AsyncTFCPolicies(AsyncTFCEndpoint, TFCPolicies):
+
+    async def get_policy_text(self, policy_id):
+        url = f"{self._endpoint_base_url}/{policy_id}/download"
+        byte_results = await self._get(url, return_raw=True, allow_redirects=True)
+        return byte_results.decode("utf-8")
+
+
+class _AsyncTFCConfigVersions(AsyncTFCEndpoint, TFCConfigVersions):
+
+    async def create_from_directory(\
+        self, workspace_id, path, payload=None, exclude=None, dedupe=True, \
+            manifest_path=SLUG_MANIFEST_PATH, compress_level=SLUG_COMPRESS_LEVEL, \
+                max_workers=None):
+        payload = payload if payload is not None else self._default_create_payload()
+        manifest = SlugManifest(manifest_path)
+        # Hashing reads the whole directory, and the manifest is a file, so keep
+        # them off the event loop, like the packing of the slug.
+        loop = asyncio.get_running_loop()
+        slug_hash = await loop.run_in_executor(None, self._slug_hash, path, payload, exclude)
+
+        if dedupe:
+            config_version = await self._find_uploaded(await loop.run_in_executor(\
+                None, manifest.get, workspace_id, slug_hash))
+            if config_version is not None:
+                return config_version
+
+        config_version = await self.create(workspace_id, payload)
+        await self.upload_from_directory(\
+            path, config_version["data"]["attributes"]["upload-url"], exclude=exclude, \
+                compress_level=compress_level, max_workers=max_workers)
+        await loop.run_in_executor(\
+            None, manifest.set, workspace_id, slug_hash, config_version["data"]["id"])
+
+        return config_version
+
+    async def _find_uploaded(self, config_version_id):
+        if config_version_id is None:
+            return None
+
+        try:
+            config_version = await self.show(config_version_id)
+        except TFCHTTPNotFound:
+            return None
+
+        return self._uploaded_or_none(config_version)
+
+
+class _AsyncTFCPolicySets(AsyncTFCEndpoint, TFCPolicySets):
+
+    async def upload(self, path_to_tarball, policy_set_version_id, content_length=None):
+        policy_set_version = await self.show_policy_set_version(policy_set_version_id)
+        url = policy_set_version["data"]["links"]["upload"]
+        return await self._upload(url, path_to_tarball, content_length=content_length)
+
+
+class _AsyncTFCStateVersions(AsyncTFCEndpoint, TFCStateVersions):
+
+    async def download(\
+        self, state_version_id, target_path, checksum=None, max_workers=DOWNLOAD_MAX_WORKERS):
+        async def download_url():
+            return self._download_url(await self.show(state_version_id))
+
+        return await self._download_immutable(\
+            download_url, target_path, f"state-versions/{state_version_id}", \
+                allow_redirects=True, checksum=checksum, max_workers=max_workers)
+
+
+# Mixins for endpoint methods that post-process their responses, and so can't be
+# wrapped by ``_coroutine_method``.
+_ASYNC_MIXIN_FOR_CLASS = {
+    TFCConfigVersions: _AsyncTFCConfigVersions,
+    TFCPolicies: _AsyncTFCPolicies,
+    TFCPolicySets: _AsyncTFCPolicySets,
+    TFCStateVersions: _AsyncTFCStateVersions
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _async_endpoint_class(endpoint_class):
+    """
+    Build the asyncio counterpart of an endpoint class, whose public methods are
+    coroutines, except for ``iter_all`` helpers which return async generators.
+    """
+    mixin = _ASYNC_MIXIN_FOR_CLASS.get(endpoint_class, AsyncTFCEndpoint)
+    # The methods the mixin defines itself, rather than inherits from the endpoint class.
+    async_names = {name for mixin_class in mixin.__mro__ \
+        if mixin_class not in endpoint_class.__mro__ for name in vars(mixin_class)}
+    namespace = {}
+    for name, method in inspect.getmembers(endpoint_class, inspect.isfunction):
+        if name.startswith("_") or name.startswith("iter_all") \
+            or name in _SYNC_METHOD_NAMES or name in async_names:
+            continue
+        namespace[name] = _coroutine_method(method)
+
+    return type(f"Async{endpoint_class.__name__}", (mixin, endpoint_class), namespace)
+
+
+class AsyncTFC(TFC):
+    """
+    Asyncio counterpart of ``TFC``, whose endpoint methods are coroutines sharing
+    one ``aiohttp`` connection pool. Requires the ``aiohttp`` package.
+
+    .. code-block:: python
+
+        async with AsyncTFC(TFC_TOKEN, url=TFC_URL) as api:
+            api.set_org("YOUR_ORGANIZATION")
+            workspace = await api.workspaces.show(workspace_name="foo")
+    """
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, api_token, url=TFC_SAAS_URL, verify=True, log_level=API_LOG_LEVEL, \
+        pool_maxsize=HTTP_POOL_MAXSIZE, keep_alive=HTTP_KEEP_ALIVE, \
+            rate_limit=RATE_LIMIT_REQUESTS_PER_SECOND, rate_limit_burst=None, \
+                rate_limit_max_retries=RATE_LIMIT_MAX_RETRIES, retry_policy=None, \
+                    connect_timeout=HTTP_CONNECT_TIMEOUT, read_timeout=HTTP_READ_TIMEOUT, \
+                        well_known_paths=None, well_known_paths_cache=None, serializer=None, \
+                            response_cache=None, artifact_cache=None, resource_cache=None, \
+                                coalesce_gets=HTTP_COALESCE_GETS):
+        if api_token is None:
+            raise InvalidTFCTokenException
+
+        if aiohttp is None:
+            raise ImportError(\
+                "AsyncTFC requires the aiohttp package: pip install terrasnek[async]")
+
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._log_level = log_level
+        self._logger.setLevel(self._log_level)
+
+        self._instance_url = url
+        self._token_pool = _token_pool(api_token, rate_limit, rate_limit_burst)
+        if self._token_pool is not None:
+            api_token = self._token_pool
+        self._config = _TFCConfig(None, api_token, _token_headers(api_token))
+        self._verify = verify
+        self._pool_maxsize = pool_maxsize
+        self._keep_alive = keep_alive
+        self._rate_limiter = TFCRateLimiter(rate_limit, burst=rate_limit_burst) \
+            if rate_limit and self._token_pool is None else None
+        self._rate_limit_max_retries = rate_limit_max_retries
+        self._retry_policy = retry_policy if retry_policy is not None else TFCRetryPolicy()
+        self._serializer = serializer if serializer is not None else TFCJSONSerializer()
+        self._timeout = (connect_timeout, read_timeout)
+        self._response_cache = response_cache
+        self._artifact_cache = artifact_cache
+        self._resource_cache = resource_cache
+        self._coalesce_gets = coalesce_gets
+
+        # The aiohttp session must be created on the event loop, see ``open``.
+        self._session = None
+        self._well_known_paths = well_known_paths
+        self._well_known_paths_cache = well_known_paths_cache \
+            if well_known_paths_cache is not None else _WELL_KNOWN_PATHS_CACHE
+
+        self._endpoints = OrderedDict()
+        self._endpoints_lock = threading.Lock()
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def open(self):
+        """
+        Open the connection pool and retrieve the well known paths, unless they
+        were given or are cached, after which the endpoints of this API object
+        can be used.
+        """
+        connector = aiohttp.TCPConnector(\
+            limit=self._pool_maxsize, force_close=not self._keep_alive)
+        self._session = AsyncTFCSession(\
+            aiohttp.ClientSession(connector=connector), rate_limiter=self._rate_limiter, \
+                max_rate_limit_retries=self._rate_limit_max_retries, \
+                    retry_policy=self._retry_policy, connect_timeout=self._timeout[0], \
+                        read_timeout=self._timeout[1], response_cache=self._response_cache, \
+                            resource_cache=self._resource_cache, \
+                                coalesce_gets=self._coalesce_gets, \
+                                    token_pool=self._token_pool)
+
+        if self._well_known_paths is None:
+            self._well_known_paths = self._well_known_paths_cache.get(self._instance_url)
+
+        if self._well_known_paths is None:
+            self._logger.debug("Retrieving TFC API well known paths..")
+            self._well_known_paths = await self.well_known_paths()
+            self._logger.debug("TFC API well known paths retrieved.")
+
+            if self._well_known_paths is not None:
+                self._well_known_paths_cache.set(self._instance_url, self._well_known_paths)
+
+    async def close(self):
+        """
+        Close the pooled connections held by this API object and its endpoints.
+        """
+        if self._session is not None:
+            await self._session.close()
+
+    async def _get(self, url):
+        req = await self._session.request(\
+            "GET", url, headers=self._config.headers, ssl=None if self._verify else False)
+        return self._get_results(url, req)
+
+    def _get_well_known_paths(self):
+        # Discovery is a coroutine here, so it happens in ``open`` instead.
+        if self._session is None:
+            raise RuntimeError("AsyncTFC must be opened before its endpoints are used.")
+        return self._well_known_paths
+
+    def _with_config(self, config):
+        # Views share the connection pool, so it must be opened first.
+        if self._session is None:
+            raise RuntimeError("AsyncTFC must be opened before views of it are made.")
+        return super()._with_config(config)
+
+    def _build_endpoint(self, endpoint_class, org_name, headers):
+        return super()._build_endpoint(_async_endpoint_class(endpoint_class), org_name, headers)
+
+    async def get_entitlements(self):
+        """
+        Allows for the user to retrieve the entitlements to the API for the current org.
+        """
+        entitlements = None
+
+        if self.is_terraform_cloud():
+            try:
+                entitlements = \
+                    (await self.orgs.entitlements(self._config.org))["data"]["attributes"]
+            except TFCHTTPNotFound:
+                self._logger.debug("Entitlements API endpoint not found. No entitlements recorded.")
+        else:
+            self._logger.debug("Not Terraform Cloud, so entitlements API is not supported.")
+
+        return entitlements
+
+    async def well_known_paths(self):
+        """
+        Retrieve all the well known paths from the Terraform Cloud installation.
+        """
+        url = f"{self._instance_url}/.well-known/terraform.json"
+        return await self._get(url)
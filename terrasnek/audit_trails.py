@@ -3,7 +3,7 @@ Module for Terraform Cloud API Endpoint: Audit Trails.
 """
 
 from .endpoint import TFCEndpoint
-from ._constants import MAX_PAGE_SIZE
+from ._constants import MAX_PAGE_FETCH_WORKERS
 
 class TFCAuditTrails(TFCEndpoint):
     """
@@ -11,8 +11,12 @@ class TFCAuditTrails(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/audit-trails.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._audit_trail_api_v2_base_url = f"{self._api_v2_base_url}/organization/audit-trail"
 
     def required_entitlements(self):
@@ -24,7 +28,7 @@ class TFCAuditTrails(TFCEndpoint):
     def terraform_enterprise_only(self):
         return False
 
-    def list(self, since=None, page=None, page_size=None):
+    def list(self, since=None, page=None, page_size=None, fields=None):
         """
         ``GET /organization/audit-trail``
 
@@ -39,9 +43,9 @@ class TFCAuditTrails(TFCEndpoint):
         """
 
         return self._list(self._audit_trail_api_v2_base_url, \
-            page=page, page_size=page_size, since=since)
+            page=page, page_size=page_size, since=since, fields=fields)
 
-    def list_all(self):
+    def list_all(self, fields=None):
         """
         This function does not correlate to an endpoint in the TFC API Docs specifically,
         but rather is a helper function to wrap the `list` endpoint, which enumerates out
@@ -50,17 +54,17 @@ class TFCAuditTrails(TFCEndpoint):
 
         Returns an array of objects.
         """
-        current_page_number = 1
-        audit_trails_resp = \
-            self.list(page=current_page_number, page_size=MAX_PAGE_SIZE)
-        total_pages = audit_trails_resp["pagination"]["total_pages"]
+        return self._list_all(self._audit_trail_api_v2_base_url, fields=fields)
 
-        audit_trails = []
-        while current_page_number <= total_pages:
-            audit_trails_resp = \
-                self._list(self._audit_trail_api_v2_base_url, \
-                    page=current_page_number, page_size=MAX_PAGE_SIZE)
-            audit_trails += audit_trails_resp["data"]
-            current_page_number += 1
+    def iter_all(self, read_ahead=MAX_PAGE_FETCH_WORKERS, fields=None):
+        """
+        This function does not correlate to an endpoint in the TFC API Docs specifically,
+        but rather is a helper function to wrap the `list` endpoint, which lazily
+        enumerates every page so users can stream every audit trail in an organization
+        without holding every page in memory. Up to ``read_ahead`` pages are fetched
+        ahead of the caller, and breaking out of the loop stops fetching the rest.
 
-        return audit_trails
+        Returns a generator of objects.
+        """
+        return self._iter_all(\
+            self._audit_trail_api_v2_base_url, read_ahead=read_ahead, fields=fields)
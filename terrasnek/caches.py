@@ -0,0 +1,436 @@
+"""
+Module containing the opt-in caches of API responses, which save polling loops
+and repeated reads from downloading the same resources over and over.
+"""
+
+import hashlib
+import os
+import shutil
+import re
+import tempfile
+import threading
+import time
+from collections import Counter, OrderedDict, namedtuple
+from urllib.parse import urlparse
+
+from ._constants import \
+    RESPONSE_CACHE_MAX_BYTES, ARTIFACT_CACHE_PATH, ARTIFACT_CACHE_MAX_BYTES, RESOURCE_CACHE_TTL, \
+        RESOURCE_CACHE_MAX_ENTRIES
+from .serializers import TFCJSONSerializer
+
+# Body of a cached response, along with the validators it was served with.
+_CachedResponse = namedtuple("_CachedResponse", ["content", "etag", "last_modified"])
+
+# Body of a cached resource, along with where it was read from and what it holds.
+_CachedResource = namedtuple("_CachedResource", ["content", "path", "tags", "expires_at"])
+
+# Suffix of the URLs acting on a resource rather than being one, e.g. ``/actions/lock``.
+_ACTION_PATH_RE = re.compile(r"/(actions|relationships)/[^/]+$")
+
+
+class TFCResponseCache():
+    """
+    Thread safe in-memory cache of the bodies of GET responses which carry an
+    ``ETag`` or ``Last-Modified`` validator, keyed by URL and token.
+
+    Once a response is cached, the same GET is sent with ``If-None-Match`` and
+    ``If-Modified-Since`` headers, and a ``304 Not Modified`` answer, which has
+    an empty body, is served the cached body instead. The least recently used
+    bodies are evicted once they take more than ``max_bytes`` in total. Cache
+    hits, misses and evictions are counted in ``counts``. GETs sent with the
+    caller's own validators bypass the cache.
+    """
+
+    def __init__(self, max_bytes=RESPONSE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.counts = Counter()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(url, headers):
+        """
+        Return the key of the response to a GET of ``url`` sent with ``headers``,
+        which differs per token, since a response is only valid for its token.
+        """
+        return (url, (headers or {}).get("Authorization"))
+
+    def get(self, key):
+        """
+        Return the cached response of a key, or ``None`` if it isn't cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    @staticmethod
+    def conditional_headers(entry):
+        """
+        Return the headers revalidating a cached response with the server.
+        """
+        headers = {}
+        if entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def set(self, key, headers, content):
+        """
+        Cache the body of a successful response given its ``headers``, unless
+        it has no validator, mustn't be stored, or is larger than the cache.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if (etag is None and last_modified is None) or len(content) > self.max_bytes or \
+            "no-store" in headers.get("Cache-Control", ""):
+            self.discard(key)
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous.content)
+
+            self._entries[key] = _CachedResponse(bytes(content), etag, last_modified)
+            self.size += len(content)
+
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted.content)
+                self.counts["evictions"] += 1
+
+    def record(self, hit):
+        """
+        Count a GET as a hit if it was answered with a ``304 Not Modified`` and
+        served from the cache, else as a miss.
+        """
+        with self._lock:
+            self.counts["hits" if hit else "misses"] += 1
+
+    def discard(self, key):
+        """
+        Remove the cached response of a key, if there is one.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= len(entry.content)
+
+    def clear(self):
+        """
+        Remove every cached response.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class TFCArtifactCache():
+    """
+    On-disk cache of the artifacts which never change once they exist, such
+    as finished plan exports, state versions and published registry module
+    versions, so that reading them again doesn't go to the network. Only their
+    content belongs in it, not API responses, which hold short lived signed URLs.
+
+    Artifacts are stored once per content hash under ``objects``, and looked
+    up by a key naming the resource, e.g. ``"plan-exports/pe-123/download"``,
+    under ``keys``. API objects scope those keys to their token, so that a
+    cache shared by several tokens never serves one the artifacts of another,
+    which it may not be allowed to read. The least recently used artifacts are
+    evicted once they take more than ``max_bytes`` in total, which is tracked
+    as artifacts are written rather than by scanning the directory on every
+    write. Every file is written to a temporary file which is then renamed
+    into place, so several processes can share the same cache directory, and
+    an artifact evicted by another process is simply a cache miss.
+    """
+
+    def __init__(self, path=ARTIFACT_CACHE_PATH, max_bytes=ARTIFACT_CACHE_MAX_BYTES):
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self._objects_path = os.path.join(self.path, "objects")
+        self._keys_path = os.path.join(self.path, "keys")
+        self._lock = threading.Lock()
+        # Size of the artifacts as of the last scan, plus the ones written since.
+        self._size = None
+
+    def _key_path(self, key):
+        return os.path.join(self._keys_path, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+    def _object_path(self, digest):
+        return os.path.join(self._objects_path, digest[:2], digest)
+
+    def _lookup(self, key):
+        """
+        Return the path of the artifact of a key, marking it as recently
+        used, or ``None`` if it isn't cached.
+        """
+        try:
+            with open(self._key_path(key), "r", encoding="utf-8") as key_file:
+                digest = key_file.read().strip()
+            object_path = self._object_path(digest)
+            os.utime(object_path)
+        except (OSError, ValueError):
+            return None
+        return object_path
+
+    def get_bytes(self, key):
+        """
+        Return the cached artifact of a key, or ``None`` if it isn't cached.
+        """
+        object_path = self._lookup(key)
+        if object_path is None:
+            return None
+        try:
+            with open(object_path, "rb") as object_file:
+                return object_file.read()
+        except FileNotFoundError:
+            return None
+
+    def copy_to(self, key, target_path):
+        """
+        Copy the cached artifact of a key to ``target_path``, a file path or a
+        writable binary file object, returning its size, or ``None`` without
+        touching the target if it isn't cached.
+        """
+        object_path = self._lookup(key)
+        if object_path is None:
+            return None
+        try:
+            object_file = open(object_path, "rb")
+        except FileNotFoundError:
+            return None
+
+        # Once open, the artifact stays readable even if another process evicts it.
+        with object_file:
+            if hasattr(target_path, "write"):
+                shutil.copyfileobj(object_file, target_path)
+            else:
+                with open(target_path, "wb") as target_file:
+                    shutil.copyfileobj(object_file, target_file)
+            return object_file.tell()
+
+    def put_bytes(self, key, data):
+        """
+        Cache an artifact given as ``bytes`` under a key.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        added_size = 0
+        if not os.path.exists(self._object_path(digest)):
+            self._write(self._object_path(digest), lambda tmp_file: tmp_file.write(data))
+            added_size = len(data)
+        self._put_key(key, digest, added_size)
+
+    def put_file(self, key, source_path):
+        """
+        Cache a copy of the artifact at ``source_path`` under a key.
+        """
+        file_hash = hashlib.sha256()
+        with open(source_path, "rb") as source_file:
+            for block in iter(lambda: source_file.read(1024 * 1024), b""):
+                file_hash.update(block)
+        digest = file_hash.hexdigest()
+
+        added_size = 0
+        if not os.path.exists(self._object_path(digest)):
+            def copy(tmp_file):
+                with open(source_path, "rb") as source_file:
+                    shutil.copyfileobj(source_file, tmp_file)
+            self._write(self._object_path(digest), copy)
+            added_size = os.path.getsize(self._object_path(digest))
+        self._put_key(key, digest, added_size)
+
+    def _put_key(self, key, digest, added_size):
+        """
+        Point a key at an artifact, ``added_size`` bytes of which were just
+        written, and evict artifacts if the cache may now be over its size.
+        The directory is only scanned the first time, and whenever the tracked
+        size passes ``max_bytes``, which also catches up with what other
+        processes wrote and evicted meanwhile.
+        """
+        self._write(self._key_path(key), lambda tmp_file: tmp_file.write(digest.encode("utf-8")))
+        with self._lock:
+            if self._size is not None:
+                self._size += added_size
+            over_size = self._size is None or self._size > self.max_bytes
+        if over_size:
+            self.evict()
+
+    @staticmethod
+    def _write(path, write_func):
+        """
+        Write a file by replacing it atomically, so that concurrent readers
+        never see it half written.
+        """
+        file_dir = os.path.dirname(path)
+        os.makedirs(file_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=file_dir, prefix=".terrasnek-")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                write_func(tmp_file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def evict(self):
+        """
+        Remove the least recently used artifacts until the rest take at most
+        ``max_bytes``. Keys of evicted artifacts are left behind as misses.
+        """
+        with self._lock:
+            artifacts = []
+            for dir_path, _, file_names in os.walk(self._objects_path):
+                for file_name in file_names:
+                    object_path = os.path.join(dir_path, file_name)
+                    if file_name.startswith(".terrasnek-"):
+                        continue
+                    try:
+                        stat = os.stat(object_path)
+                    except FileNotFoundError:
+                        continue
+                    artifacts.append((stat.st_mtime, stat.st_size, object_path))
+
+            total_size = sum(size for _, size, _ in artifacts)
+            for _, size, object_path in sorted(artifacts):
+                if total_size <= self.max_bytes:
+                    break
+                try:
+                    os.remove(object_path)
+                except FileNotFoundError:
+                    pass
+                total_size -= size
+            self._size = total_size
+
+
+class TFCResourceCache():
+    """
+    Thread safe in-memory cache of the bodies of successful GET responses,
+    e.g. of ``show`` and ``list`` calls, which are served without going to the
+    network for ``ttl`` seconds. At most ``max_entries`` are kept, evicting
+    the least recently used ones first.
+
+    Every other request sent by the same ``TFC`` object, e.g. ``update``,
+    ``destroy`` or ``lock``, invalidates the cached responses it may affect:
+    those under the URL it was sent to, those holding a resource named in
+    that URL or returned by it, and the lists of resources of that type. Its
+    writes are then read back fresh, while changes made by anyone else show
+    up within ``ttl`` seconds. Cache hits, misses and invalidations are
+    counted in ``counts``.
+    """
+
+    def __init__(self, ttl=RESOURCE_CACHE_TTL, max_entries=RESOURCE_CACHE_MAX_ENTRIES, \
+        serializer=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.counts = Counter()
+        self._serializer = serializer if serializer is not None else TFCJSONSerializer()
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(url, headers):
+        """
+        Return the key of the response to a GET of ``url`` sent with ``headers``,
+        which differs per token, since a response is only valid for its token.
+        """
+        return (url, (headers or {}).get("Authorization"))
+
+    @property
+    def generation(self):
+        """
+        Number of invalidations so far, to be read before sending a GET and
+        given back to ``set``, so that a response which may have been read
+        before a write completed isn't cached.
+        """
+        return self._generation
+
+    def get(self, key):
+        """
+        Return the cached body of a key, or ``None`` if it isn't cached or has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.counts["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.counts["hits"] += 1
+            return entry.content
+
+    def set(self, key, url, content, generation):
+        """
+        Cache the body of a successful GET of ``url``, unless a request sent since
+        ``generation`` was read may have changed it.
+        """
+        tags = self._tags(content, url)
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            self._entries[key] = _CachedResource(\
+                bytes(content), urlparse(url).path, tags, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url, content=None):
+        """
+        Remove the cached bodies a request to ``url``, which returned ``content``,
+        may have changed.
+        """
+        resource_path = _ACTION_PATH_RE.sub("", urlparse(url).path)
+        tags = set(segment for segment in resource_path.split("/") if segment)
+        tags.update(self._tags(content))
+
+        with self._lock:
+            self._generation += 1
+            for key, entry in list(self._entries.items()):
+                if entry.tags & tags or entry.path == resource_path or \
+                    entry.path.startswith(f"{resource_path}/"):
+                    del self._entries[key]
+                    self.counts["invalidations"] += 1
+
+    def clear(self):
+        """
+        Remove every cached body.
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def _tags(self, content, url=None):
+        """
+        Return the IDs of the resources in a response body, along with their
+        type if it's a list of them read from ``url``.
+        """
+        try:
+            data = self._serializer.loads(content).get("data") if content else None
+        except (ValueError, AttributeError):
+            return set()
+
+        if isinstance(data, dict):
+            return {data.get("id")} - {None}
+
+        tags = set()
+        if isinstance(data, list):
+            for resource in data:
+                if isinstance(resource, dict):
+                    tags.update((resource.get("id"), resource.get("type")))
+            # Type the list by its URL too, so that an empty list is invalidated by a create.
+            if url is not None:
+                tags.add(urlparse(url).path.rstrip("/").rsplit("/", 1)[-1])
+        return tags - {None}
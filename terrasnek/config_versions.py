@@ -2,9 +2,12 @@
 Module for Terraform Cloud API Endpoint: Config Versions.
 """
 import io
+import json
 import tarfile
 from .endpoint import TFCEndpoint
-from ._constants import MAX_PAGE_SIZE
+from .exceptions import TFCHTTPNotFound
+from .slug import SlugManifest, content_hash, pack
+from ._constants import MAX_PAGE_FETCH_WORKERS, SLUG_COMPRESS_LEVEL, SLUG_MANIFEST_PATH
 
 class TFCConfigVersions(TFCEndpoint):
     """
@@ -12,8 +15,12 @@ class TFCConfigVersions(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/configuration-versions.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._ws_api_v2_base_url = f"{self._api_v2_base_url}/workspaces"
         self._config_version_api_v2_base_url = f"{self._api_v2_base_url}/configuration-versions"
 
@@ -26,7 +33,7 @@ class TFCConfigVersions(TFCEndpoint):
     def terraform_enterprise_only(self):
         return False
 
-    def list(self, workspace_id, page=None, page_size=None):
+    def list(self, workspace_id, page=None, page_size=None, fields=None):
         """
         ``GET /workspaces/:workspace_id/configuration-versions``
 
@@ -39,9 +46,9 @@ class TFCConfigVersions(TFCEndpoint):
             - ``page_size`` (Optional)
         """
         url = f"{self._ws_api_v2_base_url}/{workspace_id}/configuration-versions"
-        return self._list(url, page=page, page_size=page_size)
+        return self._list(url, page=page, page_size=page_size, fields=fields)
 
-    def list_all(self, workspace_id):
+    def list_all(self, workspace_id, fields=None):
         """
         This function does not correlate to an endpoint in the TFC API Docs specifically,
         but rather is a helper function to wrap the `list` endpoint, which enumerates out
@@ -50,19 +57,21 @@ class TFCConfigVersions(TFCEndpoint):
 
         Returns an array of objects.
         """
-        current_page_number = 1
-        config_versions_resp = \
-            self.list(workspace_id, page=current_page_number, page_size=MAX_PAGE_SIZE)
-        total_pages = config_versions_resp["meta"]["pagination"]["total-pages"]
+        url = f"{self._ws_api_v2_base_url}/{workspace_id}/configuration-versions"
+        return self._list_all(url, fields=fields)
 
-        config_versions = []
-        while current_page_number <= total_pages:
-            config_versions_resp = \
-                self.list(workspace_id, page=current_page_number, page_size=MAX_PAGE_SIZE)
-            config_versions += config_versions_resp["data"]
-            current_page_number += 1
+    def iter_all(self, workspace_id, read_ahead=MAX_PAGE_FETCH_WORKERS, fields=None):
+        """
+        This function does not correlate to an endpoint in the TFC API Docs specifically,
+        but rather is a helper function to wrap the `list` endpoint, which lazily
+        enumerates every page so users can stream every config version in a workspace
+        without holding every page in memory. Up to ``read_ahead`` pages are fetched
+        ahead of the caller, and breaking out of the loop stops fetching the rest.
 
-        return config_versions
+        Returns a generator of objects.
+        """
+        url = f"{self._ws_api_v2_base_url}/{workspace_id}/configuration-versions"
+        return self._iter_all(url, read_ahead=read_ahead, fields=fields)
 
     def show(self, config_version_id):
         """
@@ -87,19 +96,17 @@ class TFCConfigVersions(TFCEndpoint):
         url = f"{self._ws_api_v2_base_url}/{workspace_id}/configuration-versions"
         return self._create(url, payload)
 
-    def upload(self, path_to_tarball, upload_url):
+    def upload(self, path_to_tarball, upload_url, content_length=None):
         """
         ``PUT https://archivist.terraform.io/v1/object/<UNIQUE OBJECT ID>``
 
         `Config Versions Upload API Doc Reference \
             <https://www.terraform.io/docs/cloud/api/configuration-versions.html#upload-configuration-files>`_
-        """
-        data = None
-
-        with open(path_to_tarball, 'rb') as data_bytes:
-            data = data_bytes.read()
 
-        return self._put(upload_url, data=data)
+        The tarball can be a path, an open binary file or an iterable of bytes,
+        and is streamed rather than read into memory.
+        """
+        return self._upload(upload_url, path_to_tarball, content_length=content_length)
 
     def upload_from_string(self, template_string, upload_url):
         """
@@ -137,4 +144,99 @@ class TFCConfigVersions(TFCEndpoint):
         targz_io.seek(0)
 
         # upload the template
-        return self._put(upload_url, data=targz_io.read())
+        return self._upload(upload_url, targz_io)
+
+    def upload_from_directory(\
+        self, path, upload_url, exclude=None, compress_level=SLUG_COMPRESS_LEVEL, \
+            max_workers=None):
+        """
+        ``PUT https://archivist.terraform.io/v1/object/<UNIQUE OBJECT ID>``
+
+        `Config Versions Upload API Doc Reference \
+            <https://www.terraform.io/docs/cloud/api/configuration-versions.html#upload-configuration-files>`_
+
+        Set configuration version from a directory, rather than pre-existing tarball.
+
+        The directory is packaged into a deterministic tar.gz, leaving out the
+        paths excluded by its ``.terraformignore`` and by ``exclude``, which is
+        compressed on ``max_workers`` threads and streamed straight into the
+        upload, without a temporary file.
+
+        NOTE: this does not map to typical API usage, but for ease of use in some use cases,
+        it's fine.
+        """
+        return self._upload(upload_url, pack(\
+            path, exclude=exclude, compress_level=compress_level, max_workers=max_workers))
+
+    def create_from_directory(\
+        self, workspace_id, path, payload=None, exclude=None, dedupe=True, \
+            manifest_path=SLUG_MANIFEST_PATH, compress_level=SLUG_COMPRESS_LEVEL, \
+                max_workers=None):
+        """
+        ``POST /workspaces/:workspace_id/configuration-versions``
+        ``PUT https://archivist.terraform.io/v1/object/<UNIQUE OBJECT ID>``
+
+        Create a configuration version from a directory and upload it, see
+        ``upload_from_directory``. Returns the configuration version.
+
+        With ``dedupe``, the content hash of the directory, along with the
+        create ``payload``, is looked up in the manifest at ``manifest_path``
+        of the slugs already uploaded to the workspace. If the same slug was
+        already uploaded, and its configuration version still exists, that
+        configuration version is returned instead of creating and uploading a
+        new one.
+
+        NOTE: this does not map to typical API usage, but for ease of use in some use cases,
+        it's fine.
+        """
+        payload = payload if payload is not None else self._default_create_payload()
+        manifest = SlugManifest(manifest_path)
+        slug_hash = self._slug_hash(path, payload, exclude)
+
+        if dedupe:
+            config_version = self._find_uploaded(manifest.get(workspace_id, slug_hash))
+            if config_version is not None:
+                self._logger.debug(\
+                    f"Reusing config version {config_version['data']['id']} for {path}.")
+                return config_version
+
+        config_version = self.create(workspace_id, payload)
+        self.upload_from_directory(\
+            path, config_version["data"]["attributes"]["upload-url"], exclude=exclude, \
+                compress_level=compress_level, max_workers=max_workers)
+        manifest.set(workspace_id, slug_hash, config_version["data"]["id"])
+
+        return config_version
+
+    @staticmethod
+    def _default_create_payload():
+        return {"data": {"type": "configuration-versions"}}
+
+    @staticmethod
+    def _slug_hash(path, payload, exclude):
+        """
+        Return the content hash of a directory, along with the payload its
+        config version is created with, since it changes how it's used.
+        """
+        return content_hash(\
+            path, exclude=exclude, extra=json.dumps(payload, sort_keys=True).encode("utf-8"))
+
+    def _find_uploaded(self, config_version_id):
+        """
+        Return the config version if it exists and its upload finished, else ``None``.
+        """
+        if config_version_id is None:
+            return None
+
+        try:
+            config_version = self.show(config_version_id)
+        except TFCHTTPNotFound:
+            return None
+
+        return self._uploaded_or_none(config_version)
+
+    @staticmethod
+    def _uploaded_or_none(config_version):
+        if config_version["data"]["attributes"]["status"] != "uploaded":
+            return None
+        return config_version
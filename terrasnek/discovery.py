@@ -0,0 +1,82 @@
+"""
+Module containing the caches of the well known paths discovery document of a
+Terraform Cloud installation, so that creating a ``TFC`` object doesn't cost a
+network round trip each time.
+"""
+
+import os
+import threading
+import time
+
+from ._constants import WELL_KNOWN_PATHS_CACHE_TTL
+from ._files import read_json, write_json
+
+
+class TFCWellKnownPathsCache():
+    """
+    Thread safe in-memory cache of the well known paths of each TFC installation,
+    keyed by the installation URL.
+
+    Any object with the same ``get`` and ``set`` methods can be given to the
+    ``TFC`` object instead, e.g. to share the paths through another store.
+    """
+
+    def __init__(self, ttl=WELL_KNOWN_PATHS_CACHE_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _is_fresh(self, fetched_at):
+        return self.ttl is None or time.time() - fetched_at < self.ttl
+
+    def get(self, url):
+        """
+        Return the cached well known paths of the installation at ``url``, or
+        ``None`` if they are not cached or have expired.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+
+        if entry is None or not self._is_fresh(entry["fetched_at"]):
+            return None
+
+        return entry["paths"]
+
+    def set(self, url, paths):
+        """
+        Cache the well known paths of the installation at ``url``.
+        """
+        with self._lock:
+            self._entries[url] = {"fetched_at": time.time(), "paths": paths}
+
+
+class TFCWellKnownPathsFileCache(TFCWellKnownPathsCache):
+    """
+    Cache of the well known paths stored in a JSON file, so that they are
+    shared between processes, e.g. short lived workers creating a ``TFC``
+    object per job. The file is replaced atomically on every write, so
+    concurrent writers never leave it half written.
+    """
+
+    def __init__(self, path, ttl=WELL_KNOWN_PATHS_CACHE_TTL):
+        super().__init__(ttl=ttl)
+        self.path = os.path.expanduser(path)
+
+    def _read_entries(self):
+        entries = read_json(self.path, default={})
+        return entries if isinstance(entries, dict) else {}
+
+    def get(self, url):
+        entry = self._read_entries().get(url)
+
+        if not isinstance(entry, dict) or "paths" not in entry or \
+            not self._is_fresh(entry.get("fetched_at", 0)):
+            return None
+
+        return entry["paths"]
+
+    def set(self, url, paths):
+        with self._lock:
+            entries = self._read_entries()
+            entries[url] = {"fetched_at": time.time(), "paths": paths}
+            write_json(self.path, entries)
@@ -0,0 +1,69 @@
+"""
+Module containing the resolver of JSON:API compound documents, i.e. responses
+which side-load the resources related to the ones listed through ``include``,
+so that a related resource is looked up by its type and ID instead of scanning
+the ``included`` array of every page.
+"""
+
+from .models import TFCModel
+
+
+class TFCResources(list):
+    """
+    List of the primary resources of one or more JSON:API documents, e.g. the
+    pages of a list call, along with the resources they side-loaded, indexed
+    by type and ID.
+
+    ``list_all`` helpers return one when given ``include``. A single response
+    can be wrapped with ``TFCResources(api.workspaces.list(include="organization"))``.
+    """
+
+    def __init__(self, document=None):
+        super().__init__()
+        self._included = {}
+        if document is not None:
+            self.add_document(document)
+
+    def add_document(self, document):
+        """
+        Add the primary and included resources of a JSON:API document.
+        """
+        data = document.get("data")
+        if isinstance(data, list):
+            self.extend(data)
+        elif data is not None:
+            self.append(data)
+        self.add_included(document.get("included"))
+
+    def add_included(self, included):
+        """
+        Index side-loaded resources by their type and ID.
+        """
+        for resource in included or []:
+            self._included[(resource["type"], resource["id"])] = resource
+
+    def get_included(self, resource_type, resource_id):
+        """
+        Return the side-loaded resource of a type and ID, or ``None`` if it
+        wasn't included.
+        """
+        return self._included.get((resource_type, resource_id))
+
+    def resolve(self, resource, relationship):
+        """
+        Return the side-loaded resource a relationship of ``resource`` points
+        to, e.g. ``resolve(workspace, "current-run")``, or a list of them for
+        to-many relationships. Related resources which weren't included, and
+        empty relationships, resolve to ``None``.
+        """
+        if isinstance(resource, TFCModel):
+            relationships = resource.relationships
+        else:
+            relationships = resource.get("relationships", {})
+
+        linkage = (relationships.get(relationship) or {}).get("data")
+        if linkage is None:
+            return None
+        if isinstance(linkage, list):
+            return [self.get_included(related["type"], related["id"]) for related in linkage]
+        return self.get_included(linkage["type"], linkage["id"])
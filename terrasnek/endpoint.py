@@ -3,20 +3,93 @@ Module containing class for common endpoint implementations across all TFC Endpo
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import copy_context
 
-import json
+import hashlib
 import logging
+import os
+import time
+from urllib.parse import urlencode, urlparse
 import requests
 
 from .exceptions import \
     TFCHTTPBadRequest, TFCHTTPUnauthorized, TFCHTTPForbidden, TFCHTTPNotFound, \
         TFCHTTPConflict, TFCHTTPPreconditionFailed, TFCHTTPUnprocessableEntity, \
-            TFCHTTPInternalServerError, TFCHTTPUnclassified
+            TFCHTTPInternalServerError, TFCHTTPTooManyRequests, TFCHTTPUnclassified, \
+                TFCDownloadVerificationFailed
 
 from ._constants import \
     HTTP_OK, HTTP_CREATED, HTTP_ACCEPTED, HTTP_NO_CONTENT, HTTP_BAD_REQUEST, HTTP_UNAUTHORIZED, \
         HTTP_FORBIDDEN, HTTP_NOT_FOUND, HTTP_CONFLICT, HTTP_PRECONDITION_FAILED, \
-            HTTP_UNPROCESSABLE_ENTITY, HTTP_INTERNAL_SERVER_ERROR
+            HTTP_UNPROCESSABLE_ENTITY, HTTP_TOO_MANY_REQUESTS, HTTP_INTERNAL_SERVER_ERROR, \
+                MAX_PAGE_SIZE, MAX_PAGE_FETCH_WORKERS, DOWNLOAD_CHUNK_SIZE, DOWNLOAD_SEGMENT_SIZE, \
+                    DOWNLOAD_MAX_WORKERS, HTTP_PARTIAL_CONTENT, HTTP_RANGE_NOT_SATISFIABLE, \
+                        HTTP_NOT_MODIFIED
+from ._segments import Checksum, SegmentedDownload
+from .documents import TFCResources
+from .serializers import TFCJSONSerializer
+
+
+@contextmanager
+def _open_target(target_path):
+    """
+    Open a download target for writing, unless it's already a writable file
+    object, which is left open for the caller.
+    """
+    if hasattr(target_path, "write"):
+        yield target_path
+    else:
+        with open(target_path, "wb") as target_file:
+            yield target_file
+
+
+def _segment_headers(headers, url, response):
+    """
+    Return the headers to request the other segments of a download from the
+    URL ``response`` ended up at. Like ``requests`` does when following
+    redirects, the token isn't sent on if it redirected to another host.
+    """
+    if response.history and urlparse(response.url).hostname != urlparse(url).hostname:
+        return {name: value for name, value in headers.items() if name != "Authorization"}
+    return headers
+
+
+class _SizedIterable():
+    """
+    Iterable upload body of a known length, so that it's sent with a
+    ``Content-Length`` header rather than with chunked transfer encoding.
+    """
+
+    def __init__(self, iterable, length):
+        self._iterable = iterable
+        self._length = length
+
+    def __iter__(self):
+        return iter(self._iterable)
+
+    def __len__(self):
+        return self._length
+
+
+@contextmanager
+def _open_source(source, content_length=None):
+    """
+    Open an upload source for streaming. The source is either a file path,
+    which is opened and closed here, a readable binary file object, or an
+    iterable of ``bytes`` chunks, sent chunked unless its ``content_length``
+    is given.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as source_file:
+            yield source_file
+    elif content_length is None or isinstance(source, (bytes, bytearray)) or \
+        hasattr(source, "read"):
+        yield source
+    else:
+        yield _SizedIterable(source, content_length)
 
 
 class TFCEndpoint(ABC):
@@ -24,7 +97,9 @@ class TFCEndpoint(ABC):
     Base class providing common CRUD operation implementations across all TFC Endpoints.
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
         self._logger = logging.getLogger(self.__class__.__name__)
         self._logger.setLevel(log_level)
 
@@ -38,6 +113,12 @@ class TFCEndpoint(ABC):
         self._org_name = org_name
         self._verify = verify
 
+        # Share the connection pool of the API class if one was given, so that
+        # TCP and TLS connections to the TFC host are reused across requests.
+        self._session = session if session is not None else requests.Session()
+        self._serializer = serializer if serializer is not None else TFCJSONSerializer()
+        self._artifact_cache = artifact_cache
+
     @abstractmethod
     def required_entitlements(self):
         """
@@ -60,147 +141,207 @@ class TFCEndpoint(ABC):
         return False
 
     def _delete(self, url, data=None):
+        req = self._session.delete(\
+            url, data=self._serializer.dumps(data), headers=self._headers, verify=self._verify)
+        return self._delete_results(url, req)
+
+    def _delete_results(self, url, req):
+        """
+        Return the results of an HTTP DELETE response, raising the exception matching
+        its status code if it failed.
+        """
         results = None
-        req = requests.delete(\
-            url, data=json.dumps(data), headers=self._headers, verify=self._verify)
 
         if req.status_code == HTTP_NO_CONTENT:
-            pass
+            self._logger.debug(f"DELETE to {url} successful")
         elif req.status_code == HTTP_NOT_FOUND:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPNotFound(err)
         elif req.status_code == HTTP_FORBIDDEN:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPForbidden(err)
+        elif req.status_code == HTTP_TOO_MANY_REQUESTS:
+            err = self._serializer.loads(req.content)
+            self._logger.debug(err)
+            raise TFCHTTPTooManyRequests(err)
         else:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPUnclassified(err)
 
         return results
 
-    def _get(self, url, return_raw=False, allow_redirects=False):
-        results = None
-
+    def _get(self, url, return_raw=False, allow_redirects=False, headers=None):
         self._logger.debug(f"Trying HTTP GET to URL: {url} ...")
-        req = requests.get(\
-            url, headers=self._headers, verify=self._verify, allow_redirects=allow_redirects)
+        headers = self._headers if headers is None else dict(self._headers, **headers)
+        req = self._session.get(\
+            url, headers=headers, verify=self._verify, allow_redirects=allow_redirects)
+        return self._get_results(url, req, return_raw=return_raw)
+
+    def _get_results(self, url, req, return_raw=False):
+        """
+        Return the results of an HTTP GET response, raising the exception matching
+        its status code if it failed.
+        """
+        results = None
 
         if req.status_code == HTTP_OK and not return_raw:
-            results = json.loads(req.content)
+            results = self._serializer.loads(req.content)
             self._logger.debug(f"GET to {url} successful")
         elif req.status_code == HTTP_OK and return_raw:
             results = req.content
         elif req.status_code == HTTP_NO_CONTENT:
             results = req.headers
+        elif req.status_code == HTTP_NOT_MODIFIED:
+            # Only sent for the caller's own ``If-Modified-Since`` or ``If-None-Match``.
+            self._logger.debug(f"GET to {url} not modified")
         elif req.history:
             # NOTE: If we got redirected, run the get on the new URL, and fix the
             # URL to match the private module registry URL schema.
             url = req.url.replace("/v1/modules/", "/api/registry/v1/modules/")
             results = {"redirect-url": url}
         elif req.status_code == HTTP_UNAUTHORIZED:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPUnauthorized(err)
         elif req.status_code == HTTP_NOT_FOUND:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPNotFound(err)
+        elif req.status_code == HTTP_TOO_MANY_REQUESTS:
+            err = self._serializer.loads(req.content)
+            self._logger.debug(err)
+            raise TFCHTTPTooManyRequests(err)
         else:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPUnclassified(err)
 
         return results
 
     def _patch(self, url, data=None):
-        results = None
-
         self._logger.debug(f"Trying HTTP PATCH to URL: {url} ...")
-        req = requests.patch(url, data=json.dumps(data), headers=self._headers, verify=self._verify)
+        req = self._session.patch(\
+            url, data=self._serializer.dumps(data), headers=self._headers, verify=self._verify)
+        return self._patch_results(url, req)
+
+    def _patch_results(self, url, req):
+        """
+        Return the results of an HTTP PATCH response, raising the exception matching
+        its status code if it failed.
+        """
+        results = None
 
         if req.status_code == HTTP_OK:
-            results = json.loads(req.content)
+            results = self._serializer.loads(req.content)
+            self._logger.debug(f"PATCH to {url} successful")
         elif req.status_code == HTTP_BAD_REQUEST:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPBadRequest(err)
         elif req.status_code == HTTP_UNAUTHORIZED:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPUnauthorized(err)
         elif req.status_code == HTTP_UNPROCESSABLE_ENTITY:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPUnprocessableEntity(err)
+        elif req.status_code == HTTP_TOO_MANY_REQUESTS:
+            err = self._serializer.loads(req.content)
+            self._logger.debug(err)
+            raise TFCHTTPTooManyRequests(err)
         else:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPUnclassified(err)
 
         return results
 
     def _post(self, url, data=None):
-        results = None
-
         self._logger.debug(f"Trying HTTP POST to URL: {url} ...")
-        req = requests.post(url, data=json.dumps(data), headers=self._headers, verify=self._verify)
+        req = self._session.post(\
+            url, data=self._serializer.dumps(data), headers=self._headers, verify=self._verify)
+        return self._post_results(url, req)
+
+    def _post_results(self, url, req):
+        """
+        Return the results of an HTTP POST response, raising the exception matching
+        its status code if it failed.
+        """
+        results = None
 
         if req.status_code in [HTTP_OK, HTTP_CREATED]:
-            results = json.loads(req.content)
+            results = self._serializer.loads(req.content)
             self._logger.debug(f"POST to {url} successful")
         elif req.status_code in [HTTP_ACCEPTED, HTTP_NO_CONTENT]:
             self._logger.debug(f"POST to {url} successful")
         elif req.status_code == HTTP_BAD_REQUEST:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPBadRequest(err)
         elif req.status_code == HTTP_NOT_FOUND:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPNotFound(err)
         elif req.status_code == HTTP_CONFLICT:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPConflict(err)
         elif req.status_code == HTTP_PRECONDITION_FAILED:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPPreconditionFailed(err)
         elif req.status_code == HTTP_UNPROCESSABLE_ENTITY:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPUnprocessableEntity(err)
         elif req.status_code == HTTP_INTERNAL_SERVER_ERROR:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPInternalServerError(err)
+        elif req.status_code == HTTP_TOO_MANY_REQUESTS:
+            err = self._serializer.loads(req.content)
+            self._logger.debug(err)
+            raise TFCHTTPTooManyRequests(err)
         else:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPUnclassified(err)
 
         return results
 
     def _put(self, url, octet=False, data=None):
-        results = None
-
-        headers = dict.copy(self._headers)
+        # NOTE: data may also be a file object or an iterable of bytes, which
+        # are streamed, see ``_upload``.
+        headers = self._headers
         if octet is True:
-            headers["Content-Type"] = "application/octet-stream"
+            headers = dict(self._headers, **{"Content-Type": "application/octet-stream"})
             data = bytes(data, "utf-8")
 
         self._logger.debug(f"Trying HTTP PUT to URL: {url} ...")
-        req = requests.put(url, data=data, headers=headers, verify=self._verify)
+        req = self._session.put(url, data=data, headers=headers, verify=self._verify)
+        return self._put_results(url, req, octet=octet)
+
+    def _put_results(self, url, req, octet=False):
+        """
+        Return the results of an HTTP PUT response, raising the exception matching
+        its status code if it failed.
+        """
+        results = None
 
         if req.status_code == HTTP_OK:
             if octet:
-                results = json.loads(req.content)
+                results = self._serializer.loads(req.content)
             self._logger.debug(f"PUT to {url} successful")
+        elif req.status_code == HTTP_TOO_MANY_REQUESTS:
+            err = self._serializer.loads(req.content)
+            self._logger.debug(err)
+            raise TFCHTTPTooManyRequests(err)
         else:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPUnclassified(err)
 
@@ -216,107 +357,399 @@ class TFCEndpoint(ABC):
         """
         Implementation of the common destroy resource pattern for the TFC API.
         """
-        req = requests.delete(url, headers=self._headers, verify=self._verify)
+        req = self._session.delete(url, headers=self._headers, verify=self._verify)
+        self._destroy_results(url, req)
 
+    def _destroy_results(self, url, req):
+        """
+        Check the response of a destroy request, raising an exception if it failed.
+        """
         valid_status_codes = [HTTP_OK, HTTP_NO_CONTENT]
         if req.status_code in valid_status_codes:
             self._logger.debug(f"Terraform Cloud resource at URL [{url}] destroyed.")
+        elif req.status_code == HTTP_TOO_MANY_REQUESTS:
+            err = self._serializer.loads(req.content)
+            self._logger.debug(err)
+            raise TFCHTTPTooManyRequests(err)
         else:
-            err = json.loads(req.content.decode("utf-8"))
+            err = self._serializer.loads(req.content)
             self._logger.debug(err)
             raise TFCHTTPUnclassified(err)
 
     def _list(self, url, query=None, filters=None, \
         page=None, page_size=None, search=None, include=None, sort=None, \
         offset=None, limit=None, provider=None, namespace=None, verified=None, \
-        since=None):
+        since=None, fields=None):
         """
         Implementation of the common list resources pattern for the TFC API.
+
+        ``fields`` limits the attributes returned for each resource type to the
+        ones given, e.g. ``{"workspaces": ["name"]}``, which is known as a sparse
+        fieldset in JSON:API, to trim the responses down to what's used.
         """
 
         q_options = []
 
         if query is not None:
-            q_options.append(f"q={query}")
+            q_options.append(("q", query))
 
         if filters is not None:
             for fil in filters:
                 filter_string = "filter"
                 for k in fil["keys"]:
                     filter_string += f"[{k}]"
-                filter_string += f"={fil['value']}"
-                q_options.append(filter_string)
+                q_options.append((filter_string, fil["value"]))
 
         if page is not None:
-            q_options.append(f"page[number]={page}")
+            q_options.append(("page[number]", page))
 
         if page_size is not None:
-            q_options.append(f"page[size]={page_size}")
-
-        if search is not None:
-            q_options.append(f"page[name]={page_size}")
+            q_options.append(("page[size]", page_size))
 
         if include is not None:
-            q_options.append(f"include={include}")
+            q_options.append(("include", include))
 
         if sort is not None:
-            q_options.append(f"sort={sort}")
+            q_options.append(("sort", sort))
 
         if search is not None:
-            q_options.append(f"search[name]={search}")
+            q_options.append(("search[name]", search))
 
         if since is not None:
-            q_options.append(f"since={since}")
+            q_options.append(("since", since))
+
+        if fields is not None:
+            for resource_type, type_fields in fields.items():
+                if not isinstance(type_fields, str):
+                    type_fields = ",".join(type_fields)
+                q_options.append((f"fields[{resource_type}]", type_fields))
 
         # V1 Modules API options
         if offset is not None:
-            q_options.append(f"offset={offset}")
+            q_options.append(("offset", offset))
 
         if limit is not None:
-            q_options.append(f"limit={limit}")
+            q_options.append(("limit", limit))
 
         if provider is not None:
-            q_options.append(f"provider={provider}")
+            q_options.append(("provider", provider))
 
         if namespace is not None:
-            q_options.append(f"namespace={namespace}")
+            q_options.append(("namespace", namespace))
 
         if verified is not None:
-            q_options.append(f"verified={verified}")
+            q_options.append(("verified", verified))
 
         if q_options:
-            url += "?" + "&".join(q_options)
+            # Keep the brackets and commas of the JSON:API parameters readable in the logs.
+            url += "?" + urlencode(q_options, safe="[],")
 
         return self._get(url)
 
+    def _iter_all(\
+        self, url, read_ahead=MAX_PAGE_FETCH_WORKERS, model=None, include=None, resources=None, \
+            **list_kwargs):
+        """
+        Implementation of the common lazy pagination pattern for the TFC API.
+
+        Records are yielded as each page arrives. The first page reports the
+        total page count, after which up to ``read_ahead`` of the following pages
+        are fetched concurrently. Closing the generator early cancels the pages
+        which have not been fetched yet. If a ``model`` class is given, each
+        record is yielded as an object of it instead, see ``terrasnek.models``.
+        The related resources side-loaded with ``include`` are added to
+        ``resources``, a ``TFCResources``, if given, before the records of their
+        page are yielded.
+        """
+        def fetch_page(page_number):
+            return self._list(\
+                url, page=page_number, page_size=MAX_PAGE_SIZE, include=include, **list_kwargs)
+
+        page = fetch_page(1)
+        total_pages = self._total_pages(page)
+        next_page_number = 2
+
+        if read_ahead < 1 or total_pages < next_page_number:
+            yield from self._page_records(page, model, resources)
+            while next_page_number <= total_pages:
+                yield from self._page_records(fetch_page(next_page_number), model, resources)
+                next_page_number += 1
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(read_ahead, total_pages - 1))
+        pending_pages = deque()
+        try:
+            while page is not None:
+                # Keep the read ahead window full before handing records back.
+                while next_page_number <= total_pages and len(pending_pages) < read_ahead:
+                    # Run each page in a copy of the caller's context, so the pages
+                    # fetched on the pool stay bounded by the caller's deadline.
+                    pending_pages.append(\
+                        executor.submit(copy_context().run, fetch_page, next_page_number))
+                    next_page_number += 1
+
+                yield from self._page_records(page, model, resources)
+                page = pending_pages.popleft().result() if pending_pages else None
+        finally:
+            for pending_page in pending_pages:
+                pending_page.cancel()
+            executor.shutdown(wait=False)
+
+    def _list_all(self, url, max_workers=MAX_PAGE_FETCH_WORKERS, include=None, **list_kwargs):
+        """
+        Implementation of the common list all resources pattern for the TFC API.
+
+        If related resources are side-loaded with ``include``, the records are
+        returned as ``TFCResources``, which resolves their relationships.
+        """
+        if include is None:
+            return list(self._iter_all(url, read_ahead=max_workers, **list_kwargs))
+
+        resources = TFCResources()
+        resources.extend(self._iter_all(\
+            url, read_ahead=max_workers, include=include, resources=resources, **list_kwargs))
+        return resources
+
+    def _page_records(self, page, model=None, resources=None):
+        """
+        Return the records of a page, as objects of the ``model`` class if one
+        is given, after adding the resources it side-loaded to ``resources``, if given.
+        """
+        if resources is not None:
+            resources.add_included(page.get("included"))
+        if model is None:
+            return page["data"]
+        return [model.from_record(record, self._serializer) for record in page["data"]]
+
+    @staticmethod
+    def _total_pages(list_resp):
+        """
+        Return the total page count from a list response, which is reported under
+        ``meta.pagination`` for most endpoints and under ``pagination`` for others.
+        """
+        if "meta" in list_resp:
+            return list_resp["meta"]["pagination"]["total-pages"]
+        return list_resp["pagination"]["total_pages"]
+
     def _show(self, url):
         """
         Implementation of the common show resource pattern for the TFC API.
         """
         return self._get(url)
 
+    def _artifact_key(self, cache_key):
+        """
+        Return the key of an artifact in the artifact cache, scoped to the TFC
+        installation, since the same IDs and module names may exist on several,
+        and to the token, since another one may not be allowed to read it.
+        """
+        identity = hashlib.sha256(self._headers.get("Authorization", "").encode("utf-8"))
+        return f"{self._instance_url}/{identity.hexdigest()}/{cache_key}"
+
+    def _download_immutable(self, url, target_path, cache_key, checksum=None, **download_kwargs):
+        """
+        Download a file which never changes once it exists, copying it from the
+        artifact cache, if there is one and it holds the file, instead.
+        Downloads to a file object aren't added to the cache.
+
+        ``url`` can be a function returning it instead, which is only called
+        when the file isn't cached, for files whose URL must be looked up first.
+        """
+        if self._artifact_cache is None:
+            url = url() if callable(url) else url
+            return self._download(url, target_path, checksum=checksum, **download_kwargs)
+
+        cache_key = self._artifact_key(cache_key)
+        started_at = time.monotonic()
+        byte_count = self._artifact_cache.copy_to(cache_key, target_path)
+        if byte_count is not None:
+            if checksum is not None and not hasattr(target_path, "write"):
+                digest = Checksum(checksum)
+                digest.update_from_file(target_path)
+                digest.verify()
+            self._logger.debug(f"GET of {cache_key} served from the artifact cache")
+            return self._download_results(cache_key, byte_count, started_at)
+
+        url = url() if callable(url) else url
+        results = self._download(url, target_path, checksum=checksum, **download_kwargs)
+        if not hasattr(target_path, "write"):
+            self._artifact_cache.put_file(cache_key, target_path)
+        return results
+
     def _update(self, url, payload):
         """
         Implementation of the common update resource pattern for the TFC API.
         """
         return self._patch(url, data=payload)
 
-    def _download(self, url, target_path, header_with_url=None, allow_redirects=False):
+    def _upload(self, url, source, content_length=None):
+        """
+        Implementation of a common upload pattern to the TFC API.
+
+        The ``source`` is a file path, a readable binary file object or an
+        iterable of ``bytes`` chunks, and is streamed to ``url`` rather than
+        read into memory first. Iterables are sent with chunked transfer
+        encoding, unless their ``content_length`` is given.
+        """
+        with _open_source(source, content_length=content_length) as data:
+            return self._put(url, data=data)
+
+    def _download(\
+        self, url, target_path, header_with_url=None, allow_redirects=False, \
+            chunk_size=DOWNLOAD_CHUNK_SIZE, checksum=None, max_workers=DOWNLOAD_MAX_WORKERS, \
+                segment_size=DOWNLOAD_SEGMENT_SIZE):
         """
         Implementation of a common download pattern from the TFC API.
+
+        The response body is streamed in chunks of ``chunk_size`` bytes to
+        ``target_path``, which is either a file path or a writable binary file
+        object, so the download never has to fit in memory. Returns the number
+        of bytes downloaded, and the time and throughput of the transfer.
+
+        If ``target_path`` is a file path and the server supports byte ranges,
+        the file is downloaded in segments of ``segment_size`` bytes, by up to
+        ``max_workers`` concurrent requests, into a preallocated
+        ``<target_path>.part`` file which replaces ``target_path`` once it's
+        complete. If the download is interrupted, downloading to the same path
+        again only fetches the missing segments, unless the remote file changed.
+
+        If a ``checksum`` of the form ``"<algorithm>:<hex digest>"`` is given,
+        e.g. ``"sha256:9f86d08..."``, ``TFCDownloadVerificationFailed`` is
+        raised if the downloaded file doesn't match it.
         """
-        results = None
-        if header_with_url is None:
-            results = self._get(url, return_raw=True, allow_redirects=allow_redirects)
-        else:
+        if header_with_url is not None:
             response = self._get(url, allow_redirects=allow_redirects)
             if "redirect-url" in response:
                 response = self._get(response["redirect-url"])
-            download_url = response[header_with_url]
-            results = self._get(download_url, return_raw=True)
+            url = response[header_with_url]
+            allow_redirects = False
+
+        segmented = None
+        headers = self._headers
+        if max_workers > 1 and not hasattr(target_path, "write"):
+            segmented = SegmentedDownload(target_path, segment_size)
+            if not segmented.pending():
+                # Every segment was written, but the part file wasn't moved to the target.
+                started_at = time.monotonic()
+                try:
+                    segmented.finish(Checksum(checksum) if checksum is not None else None)
+                except TFCDownloadVerificationFailed:
+                    segmented.discard()
+                    return self._download(\
+                        url, target_path, allow_redirects=allow_redirects, chunk_size=chunk_size, \
+                            checksum=checksum, max_workers=max_workers, segment_size=segment_size)
+                return self._download_results(url, 0, started_at)
+
+            first_index = segmented.pending()[0]
+            headers = dict(self._headers, **segmented.request_headers(first_index))
 
-        with open(target_path, 'wb') as target_file:
-            target_file.write(results)
+        self._logger.debug(f"Trying HTTP GET to URL: {url} ...")
+        started_at = time.monotonic()
+        req = self._session.get(\
+            url, headers=headers, verify=self._verify, allow_redirects=allow_redirects, \
+                stream=True)
+
+        with req:
+            if segmented is not None and req.status_code == HTTP_PARTIAL_CONTENT:
+                byte_count = self._download_segments(\
+                    url, req, first_index, segmented, chunk_size, max_workers, checksum)
+                return self._download_results(url, byte_count, started_at)
+
+            if segmented is not None and req.status_code == HTTP_RANGE_NOT_SATISFIABLE:
+                # Some servers can't serve a range of an empty file at all.
+                segmented.discard()
+                return self._download(\
+                    url, target_path, allow_redirects=allow_redirects, chunk_size=chunk_size, \
+                        checksum=checksum, max_workers=1)
+
+            if req.status_code != HTTP_OK:
+                return self._get_results(url, req, return_raw=True)
+
+            # The server doesn't support byte ranges, or the remote file changed
+            # since the part file was downloaded, so stream the whole file.
+            if segmented is not None:
+                segmented.discard()
+
+            digest = Checksum(checksum) if checksum is not None else None
+            byte_count = 0
+            with _open_target(target_path) as target_file:
+                for chunk in req.iter_content(chunk_size=chunk_size):
+                    target_file.write(chunk)
+                    if digest is not None:
+                        digest.update(chunk)
+                    byte_count += len(chunk)
+
+            if digest is not None:
+                digest.verify()
+
+        return self._download_results(url, byte_count, started_at)
+
+    def _download_segments(\
+        self, url, first_req, first_index, segmented, chunk_size, max_workers, checksum):
+        """
+        Download the segments of ``segmented`` still missing, the first of
+        which, at ``first_index``, is the body of ``first_req``. Returns the
+        number of bytes downloaded.
+        """
+        def write_segment(index, req):
+            start, end = segmented.check_segment(index, req.headers)
+            offset = start
+            for chunk in req.iter_content(chunk_size=chunk_size):
+                segmented.write(offset, chunk, end)
+                offset += len(chunk)
+            segmented.complete(index, offset - start)
+            return offset - start
+
+        def fetch_segment(index):
+            with self._session.get(\
+                segment_url, headers=dict(headers, **segmented.request_headers(index)), \
+                    verify=self._verify, allow_redirects=False, stream=True) as req:
+                if req.status_code == HTTP_OK:
+                    raise TFCDownloadVerificationFailed(\
+                        f"The remote file changed while downloading it to {segmented.target_path}.")
+                if req.status_code != HTTP_PARTIAL_CONTENT:
+                    return self._get_results(segment_url, req, return_raw=True)
+                return write_segment(index, req)
+
+        segment_url = first_req.url
+        headers = _segment_headers(self._headers, url, first_req)
+
+        try:
+            segmented.open(first_req.headers)
+            pending = segmented.pending()
+            self._logger.debug(\
+                f"Downloading {len(pending)} segments of {segmented.size} bytes to "
+                f"{segmented.target_path} ...")
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # The first segment is read alongside the others rather than before them.
+                futures = [executor.submit(write_segment, first_index, first_req)] + [\
+                    executor.submit(copy_context().run, fetch_segment, index) \
+                        for index in pending if index != first_index]
+                try:
+                    byte_count = sum(future.result() for future in futures)
+                finally:
+                    for future in futures:
+                        future.cancel()
+        finally:
+            segmented.close()
+
+        segmented.finish(Checksum(checksum) if checksum is not None else None)
+        return byte_count
+
+    def _download_results(self, url, byte_count, started_at):
+        """
+        Return the size, duration and throughput of a finished download.
+        """
+        seconds = time.monotonic() - started_at
+        results = {
+            "bytes": byte_count,
+            "seconds": seconds,
+            "bytes_per_second": byte_count / seconds if seconds > 0 else None
+        }
+        self._logger.debug(\
+            f"GET to {url} successful, downloaded {byte_count} bytes in {seconds:.2f}s")
+        return results
 
     def get_current_org(self):
         """
@@ -15,6 +15,12 @@ class InvalidTFCTokenException(TFCException):
 class TFCDeprecatedWontFix(TFCException):
     """Terraform Cloud deprecated endpoint. Won't be fixed, use another endpoint."""
 
+class TFCDeadlineExceeded(TFCException):
+    """The deadline set for a call ran out before or while sending its next request."""
+
+class TFCDownloadVerificationFailed(TFCException):
+    """A download didn't match its expected size or checksum, or the file changed mid-download."""
+
 # HTTP Exceptions
 class TFCHTTPBadRequest(TFCException):
     """Terraform Cloud bad request. (HTTP 400)
@@ -89,3 +95,12 @@ class TFCHTTPUnclassified(TFCException):
     This is a catch-all class to manage any HTTP exceptions that are not
     enumerated.
     """
+
+class TFCHTTPTooManyRequests(TFCHTTPUnclassified):
+    """Terraform Cloud too many requests. (HTTP 429)
+
+    The HTTP 429 Too Many Requests response status code indicates the user has
+    sent too many requests in a given amount of time ("rate limiting"). It is
+    only raised once the rate limiter has run out of retries for a request, and
+    extends ``TFCHTTPUnclassified`` since that is how it used to be raised.
+    """
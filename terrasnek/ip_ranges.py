@@ -2,6 +2,9 @@
 Module for Terraform Cloud API Endpoint: IP Ranges.
 """
 
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
 from .endpoint import TFCEndpoint
 
 class TFCIPRanges(TFCEndpoint):
@@ -10,8 +13,12 @@ class TFCIPRanges(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/ip-ranges.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._meta_base_url}/ip-ranges"
 
     def required_entitlements(self):
@@ -23,11 +30,25 @@ class TFCIPRanges(TFCEndpoint):
     def terraform_enterprise_only(self):
         return False
 
-    def list(self):
+    def list(self, modified_since=None):
         """
         ``GET /meta/ip-ranges``
 
         `IP Ranges List API Doc Reference \
             <https://www.terraform.io/docs/cloud/api/ip-ranges.html#get-ip-ranges>`_
+
+        Request Header(s) (`details \
+            <https://www.terraform.io/docs/cloud/api/ip-ranges.html#request-headers>`_):
+            - ``If-Modified-Since`` (Optional)
+
+        ``modified_since`` sets ``If-Modified-Since``, as a ``datetime`` or an
+        HTTP date string, in which case ``None`` is returned if the IP ranges
+        haven't changed since.
         """
-        return self._list(self._endpoint_base_url)
+        if modified_since is None:
+            return self._list(self._endpoint_base_url)
+
+        if isinstance(modified_since, datetime):
+            modified_since = format_datetime(modified_since.astimezone(timezone.utc), usegmt=True)
+        return self._get(\
+            self._endpoint_base_url, headers={"If-Modified-Since": modified_since})
@@ -0,0 +1,199 @@
+"""
+Module containing compact, typed objects for the resources which are typically
+listed by the thousands, as an alternative to the raw JSON:API dicts.
+
+Each object only holds the ID of its resource and the record encoded as JSON
+``bytes``, which take a fraction of the memory of the nested dicts it decodes
+to. The first access to one of its typed attributes decodes the record once,
+and keeps the values of those attributes only, so they're read without decoding
+it again while the object stays compact. ``to_dict`` decodes the whole record
+again on every call, so hold on to its result when reading much of it.
+"""
+
+from .serializers import TFCJSONSerializer
+
+_DEFAULT_SERIALIZER = TFCJSONSerializer()
+
+
+class _Field():
+    """
+    Descriptor for a value read from the record of the resource, decoded on
+    the first access to any field of the object.
+    """
+
+    def __init__(self, key):
+        self._key = key
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, model, owner=None):
+        if model is None:
+            return self
+        # pylint: disable=protected-access
+        return model._field_values()[model._field_indexes[self._name]]
+
+    def read(self, record):
+        """
+        Return the value of the field in a decoded record.
+        """
+        raise NotImplementedError
+
+
+class _Attribute(_Field):
+    """
+    Descriptor for an attribute of the resource.
+    """
+
+    def read(self, record):
+        return (record.get("attributes") or {}).get(self._key)
+
+
+class _RelatedID(_Field):
+    """
+    Descriptor for the ID of a resource related to the resource.
+    """
+
+    def read(self, record):
+        related = ((record.get("relationships") or {}).get(self._key) or {}).get("data")
+        return related["id"] if isinstance(related, dict) else None
+
+
+class TFCModel():
+    """
+    Base class of the compact objects of a resource record.
+    """
+
+    __slots__ = ("id", "_raw", "_values", "_serializer")
+
+    def __init__(self, resource_id, raw, serializer=None):
+        self.id = resource_id  # pylint: disable=invalid-name
+        self._raw = raw
+        self._values = None
+        self._serializer = serializer if serializer is not None else _DEFAULT_SERIALIZER
+
+    @classmethod
+    def from_record(cls, record, serializer=None):
+        """
+        Return the object of a decoded resource record, i.e. an item of the
+        ``data`` of a response, which it keeps encoded as JSON ``bytes``.
+        """
+        serializer = serializer if serializer is not None else _DEFAULT_SERIALIZER
+        raw = serializer.dumps(record)
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        else:
+            # Copy the bytes, since some encoders over-allocate their output buffer.
+            raw = bytes(memoryview(raw))
+        return cls(record["id"], raw, serializer=serializer)
+
+    # Field descriptors of the class, and the index of each in its values, by attribute name.
+    _fields = ()
+    _field_indexes = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = {name: field for klass in reversed(cls.__mro__) \
+            for name, field in vars(klass).items() if isinstance(field, _Field)}
+        cls._fields = tuple(fields.values())
+        cls._field_indexes = {name: index for index, name in enumerate(fields)}
+
+    def _field_values(self):
+        """
+        Return the values of the fields of the object, decoding the record once.
+        """
+        if self._values is None:
+            record = self.to_dict()
+            self._values = tuple(field.read(record) for field in self._fields)
+        return self._values
+
+    def to_dict(self):
+        """
+        Return the decoded resource record, decoded again on every call.
+        """
+        return self._serializer.loads(self._raw)
+
+    @property
+    def attributes(self):
+        """
+        Return the decoded attributes of the resource.
+        """
+        return self.to_dict().get("attributes", {})
+
+    @property
+    def relationships(self):
+        """
+        Return the decoded relationships of the resource.
+        """
+        return self.to_dict().get("relationships", {})
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._raw == other._raw
+
+    def __hash__(self):
+        return hash((type(self), self.id))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(id={self.id!r})"
+
+
+class TFCWorkspace(TFCModel):
+    """
+    Compact object of a workspace record.
+    """
+
+    __slots__ = ()
+
+    name = _Attribute("name")
+    description = _Attribute("description")
+    auto_apply = _Attribute("auto-apply")
+    locked = _Attribute("locked")
+    execution_mode = _Attribute("execution-mode")
+    terraform_version = _Attribute("terraform-version")
+    working_directory = _Attribute("working-directory")
+    resource_count = _Attribute("resource-count")
+    tag_names = _Attribute("tag-names")
+    created_at = _Attribute("created-at")
+    updated_at = _Attribute("updated-at")
+    current_run_id = _RelatedID("current-run")
+    current_state_version_id = _RelatedID("current-state-version")
+
+
+class TFCRun(TFCModel):
+    """
+    Compact object of a run record.
+    """
+
+    __slots__ = ()
+
+    status = _Attribute("status")
+    message = _Attribute("message")
+    source = _Attribute("source")
+    trigger_reason = _Attribute("trigger-reason")
+    has_changes = _Attribute("has-changes")
+    is_destroy = _Attribute("is-destroy")
+    plan_only = _Attribute("plan-only")
+    created_at = _Attribute("created-at")
+    status_timestamps = _Attribute("status-timestamps")
+    workspace_id = _RelatedID("workspace")
+    plan_id = _RelatedID("plan")
+    apply_id = _RelatedID("apply")
+    configuration_version_id = _RelatedID("configuration-version")
+
+
+class TFCStateVersion(TFCModel):
+    """
+    Compact object of a state version record.
+    """
+
+    __slots__ = ()
+
+    serial = _Attribute("serial")
+    size = _Attribute("size")
+    created_at = _Attribute("created-at")
+    vcs_commit_sha = _Attribute("vcs-commit-sha")
+    resources_processed = _Attribute("resources-processed")
+    hosted_state_download_url = _Attribute("hosted-state-download-url")
+    hosted_json_state_download_url = _Attribute("hosted-json-state-download-url")
+    run_id = _RelatedID("run")
@@ -9,8 +9,12 @@ class TFCNotificationConfigurations(TFCEndpoint):
     `Notification Configurations API Docs \
         <https://www.terraform.io/docs/cloud/api/notification-configurations.html>`_
     """
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/notification-configurations"
         self._ws_base_url = f"{self._api_v2_base_url}/workspaces"
 
@@ -36,7 +40,7 @@ class TFCNotificationConfigurations(TFCEndpoint):
         url = f"{self._ws_base_url}/{workspace_id}/notification-configurations"
         return self._create(url, payload)
 
-    def list(self, workspace_id):
+    def list(self, workspace_id, fields=None):
         """
         ``GET /workspaces/:workspace_id/notification-configurations``
 
@@ -44,7 +48,7 @@ class TFCNotificationConfigurations(TFCEndpoint):
             <https://www.terraform.io/docs/cloud/api/notification-configurations.html#list-notification-configurations>`_
         """
         url = f"{self._ws_base_url}/{workspace_id}/notification-configurations"
-        return self._list(url)
+        return self._list(url, fields=fields)
 
     def show(self, notification_config_id):
         """
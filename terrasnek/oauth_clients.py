@@ -11,8 +11,12 @@ class TFCOAuthClients(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/oauth-clients.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._org_api_v2_base_url = \
             f"{self._api_v2_base_url}/organizations/{org_name}/oauth-clients"
         self._oauth_clients_api_v2_base_url = f"{self._api_v2_base_url}/oauth-clients"
@@ -26,14 +30,14 @@ class TFCOAuthClients(TFCEndpoint):
     def terraform_enterprise_only(self):
         return False
 
-    def list(self):
+    def list(self, fields=None):
         """
         ``GET /organizations/:organization_name/oauth-clients``
 
         `OAuth Clients List API Doc Reference \
             <https://www.terraform.io/docs/cloud/api/oauth-clients.html#list-oauth-clients>`_
         """
-        return self._list(self._org_api_v2_base_url)
+        return self._list(self._org_api_v2_base_url, fields=fields)
 
     def show(self, client_id):
         """
@@ -11,8 +11,12 @@ class TFCOAuthTokens(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/oauth-tokens.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._oauth_clients_api_v2_base_url = f"{self._api_v2_base_url}/oauth-clients"
         self._oauth_tokens_api_v2_base_url = f"{self._api_v2_base_url}/oauth-tokens"
 
@@ -25,7 +29,7 @@ class TFCOAuthTokens(TFCEndpoint):
     def terraform_enterprise_only(self):
         return False
 
-    def list(self, oauth_client_id):
+    def list(self, oauth_client_id, fields=None):
         """
         ``GET /oauth-clients/:oauth_client_id/oauth-tokens``
 
@@ -33,7 +37,7 @@ class TFCOAuthTokens(TFCEndpoint):
             <https://www.terraform.io/docs/cloud/api/oauth-tokens.html#list-oauth-tokens>`_
         """
         url = f"{self._oauth_clients_api_v2_base_url}/{oauth_client_id}/oauth-tokens"
-        return self._list(url)
+        return self._list(url, fields=fields)
 
     def show(self, token_id):
         """
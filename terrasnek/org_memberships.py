@@ -3,7 +3,7 @@ Module for Terraform Cloud API Endpoint: Org Memberships.
 """
 
 from .endpoint import TFCEndpoint
-from ._constants import MAX_PAGE_SIZE
+from ._constants import MAX_PAGE_FETCH_WORKERS
 
 class TFCOrgMemberships(TFCEndpoint):
     """
@@ -11,8 +11,12 @@ class TFCOrgMemberships(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/organization-memberships.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/organization-memberships"
         self._org_base_url = \
             f"{self._api_v2_base_url}/organizations/{org_name}/organization-memberships"
@@ -38,7 +42,7 @@ class TFCOrgMemberships(TFCEndpoint):
         """
         return self._create(self._org_base_url, payload)
 
-    def list_for_org(self, query=None, filters=None, page=None, page_size=None):
+    def list_for_org(self, query=None, filters=None, page=None, page_size=None, fields=None):
         """
         ``GET /organizations/:organization_name/organization-memberships``
 
@@ -65,9 +69,10 @@ class TFCOrgMemberships(TFCEndpoint):
 
         """
         return self._list(\
-            self._org_base_url, query=query, filters=filters, page=page, page_size=page_size)
+            self._org_base_url, query=query, filters=filters, page=page, page_size=page_size, \
+                fields=fields)
 
-    def list_all_for_org(self, query=None, filters=None):
+    def list_all_for_org(self, query=None, filters=None, fields=None):
         """
         This function does not correlate to an endpoint in the TFC API Docs specifically,
         but rather is a helper function to wrap the `list` endpoint, which enumerates out
@@ -76,30 +81,30 @@ class TFCOrgMemberships(TFCEndpoint):
 
         Returns an array of objects.
         """
-        current_page_number = 1
-        org_memberships_resp = \
-            self._list(self._org_base_url, \
-                page=current_page_number, page_size=MAX_PAGE_SIZE, query=query, filters=filters)
-        total_pages = org_memberships_resp["meta"]["pagination"]["total-pages"]
-
-        org_memberships = []
-        while current_page_number <= total_pages:
-            org_memberships_resp = \
-                self._list(self._org_base_url, \
-                    page=current_page_number, page_size=MAX_PAGE_SIZE, query=query, filters=filters)
-            org_memberships += org_memberships_resp["data"]
-            current_page_number += 1
-
-        return org_memberships
-
-    def list_for_user(self):
+        return self._list_all(self._org_base_url, query=query, filters=filters, fields=fields)
+
+    def iter_all_for_org(\
+        self, query=None, filters=None, read_ahead=MAX_PAGE_FETCH_WORKERS, fields=None):
+        """
+        This function does not correlate to an endpoint in the TFC API Docs specifically,
+        but rather is a helper function to wrap the `list_for_org` endpoint, which lazily
+        enumerates every page so users can stream every org membership for an organization
+        without holding every page in memory. Up to ``read_ahead`` pages are fetched
+        ahead of the caller, and breaking out of the loop stops fetching the rest.
+
+        Returns a generator of objects.
+        """
+        return self._iter_all(\
+            self._org_base_url, read_ahead=read_ahead, query=query, filters=filters, fields=fields)
+
+    def list_for_user(self, fields=None):
         """
         ``GET /organization-memberships``
 
         `Org Memberships List for User API Doc Reference \
             <https://www.terraform.io/docs/cloud/api/organization-memberships.html#list-user-39-s-own-memberships>`_
         """
-        return self._list(self._endpoint_base_url)
+        return self._list(self._endpoint_base_url, fields=fields)
 
     def show(self, org_membership_id):
         """
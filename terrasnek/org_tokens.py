@@ -10,8 +10,12 @@ class TFCOrgTokens(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/organization-tokens.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = \
             f"{self._api_v2_base_url}/organizations/{org_name}/authentication-token"
 
@@ -10,8 +10,12 @@ class TFCOrgs(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/organizations.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._org_api_v2_base_url = f"{self._api_v2_base_url}/organizations"
 
     def required_entitlements(self):
@@ -65,14 +69,14 @@ class TFCOrgs(TFCEndpoint):
         url = f"{self._org_api_v2_base_url}/{org_name}/subscription"
         return self._get(url)
 
-    def list(self):
+    def list(self, fields=None):
         """
         ``GET /organizations``
 
         `Orgs List API Doc Reference \
             <https://www.terraform.io/docs/cloud/api/organizations.html#list-organizations>`_
         """
-        return self._list(self._org_api_v2_base_url)
+        return self._list(self._org_api_v2_base_url, fields=fields)
 
     def show(self, org_name):
         """
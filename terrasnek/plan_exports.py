@@ -3,6 +3,7 @@ Module for Terraform Cloud API Endpoint: Plan Exports.
 """
 
 from .endpoint import TFCEndpoint
+from ._constants import DOWNLOAD_MAX_WORKERS
 
 class TFCPlanExports(TFCEndpoint):
     """
@@ -10,8 +11,12 @@ class TFCPlanExports(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/plan-exports.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/plan-exports"
 
     def required_entitlements(self):
@@ -46,17 +51,24 @@ class TFCPlanExports(TFCEndpoint):
         url = f"{self._endpoint_base_url}/{plan_export_id}"
         return self._show(url)
 
-    def download(self, plan_export_id, target_path):
+    def download(\
+        self, plan_export_id, target_path, checksum=None, max_workers=DOWNLOAD_MAX_WORKERS):
         """
         ``GET /plan-exports/:id/download``
 
         `Plan Exports Download API Doc Reference \
             <https://www.terraform.io/docs/cloud/api/plan-exports.html#download-exported-plan-data>`_
+
+        When the server supports byte ranges, the file is downloaded by up to
+        ``max_workers`` concurrent requests, and resumed if interrupted. It's
+        checked against ``checksum`` (e.g. ``"sha256:<hex digest>"``), if given.
+        Exported plan data is copied from the artifact cache of the API object,
+        if there is one and it holds the export.
         """
         url = f"{self._endpoint_base_url}/{plan_export_id}/download"
-        results = self._get(url, return_raw=True, allow_redirects=True)
-        with open(target_path, 'wb') as target_file:
-            target_file.write(results)
+        return self._download_immutable(\
+            url, target_path, f"plan-exports/{plan_export_id}/download", allow_redirects=True, \
+                checksum=checksum, max_workers=max_workers)
 
     def destroy(self, plan_export_id):
         """
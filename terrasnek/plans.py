@@ -3,7 +3,7 @@ Module for Terraform Cloud API Endpoint: Plans.
 """
 
 from .endpoint import TFCEndpoint
-from ._constants import Entitlements
+from ._constants import Entitlements, DOWNLOAD_MAX_WORKERS
 
 class TFCPlans(TFCEndpoint):
     """
@@ -11,8 +11,12 @@ class TFCPlans(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/plans.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/plans"
         self._runs_base_url = f"{self._api_v2_base_url}/runs"
 
@@ -35,13 +39,19 @@ class TFCPlans(TFCEndpoint):
         url = f"{self._endpoint_base_url}/{plan_id}"
         return self._show(url)
 
-    def download_json(self, target_path, plan_id=None, run_id=None):
+    def download_json(\
+        self, target_path, plan_id=None, run_id=None, checksum=None, \
+            max_workers=DOWNLOAD_MAX_WORKERS):
         """
         ``GET /plans/:id/json-output``
         ``GET /runs/:id/plan/json-output``
 
         `Plans Download JSON API Doc Reference \
             <https://www.terraform.io/docs/cloud/api/plans.html#retrieve-the-json-execution-plan>`_
+
+        When the server supports byte ranges, the file is downloaded by up to
+        ``max_workers`` concurrent requests, and resumed if interrupted. It's
+        checked against ``checksum`` (e.g. ``"sha256:<hex digest>"``), if given.
         """
         # TODO: should this log an error or raise an exception?
         if plan_id is not None:
@@ -52,7 +62,5 @@ class TFCPlans(TFCEndpoint):
         else:
             self._logger.error("Arguments plan_id or run_id must be defined")
 
-        results = self._get(url, return_raw=True, allow_redirects=True)
-
-        with open(target_path, 'wb') as target_file:
-            target_file.write(results)
+        return self._download(\
+            url, target_path, allow_redirects=True, checksum=checksum, max_workers=max_workers)
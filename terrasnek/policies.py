@@ -3,15 +3,19 @@ Module for Terraform Cloud API Endpoint: Policies.
 """
 
 from .endpoint import TFCEndpoint
-from ._constants import Entitlements, MAX_PAGE_SIZE
+from ._constants import Entitlements, MAX_PAGE_FETCH_WORKERS
 
 class TFCPolicies(TFCEndpoint):
     """
     `Policies API Docs \
         <https://www.terraform.io/docs/cloud/api/policies.html>`_
     """
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/policies"
         self._org_api_v2_base_url = f"{self._api_v2_base_url}/organizations/{org_name}/policies"
 
@@ -36,7 +40,7 @@ class TFCPolicies(TFCEndpoint):
         """
         return self._create(self._org_api_v2_base_url, payload)
 
-    def list(self, page=None, page_size=None, search=None):
+    def list(self, page=None, page_size=None, search=None, fields=None):
         """
         ``GET /organizations/:organization_name/policies``
 
@@ -50,9 +54,9 @@ class TFCPolicies(TFCEndpoint):
             - ``search`` (Optional)
         """
         return self._list(\
-            self._org_api_v2_base_url, page=page, page_size=page_size, search=search)
+            self._org_api_v2_base_url, page=page, page_size=page_size, search=search, fields=fields)
 
-    def list_all(self, search=None):
+    def list_all(self, search=None, fields=None):
         """
         This function does not correlate to an endpoint in the TFC API Docs specifically,
         but rather is a helper function to wrap the `list` endpoint, which enumerates out
@@ -61,19 +65,20 @@ class TFCPolicies(TFCEndpoint):
 
         Returns an array of objects.
         """
-        current_page_number = 1
-        policies_resp = \
-            self.list(page=current_page_number, page_size=MAX_PAGE_SIZE, search=search)
-        total_pages = policies_resp["meta"]["pagination"]["total-pages"]
+        return self._list_all(self._org_api_v2_base_url, search=search, fields=fields)
 
-        policies = []
-        while current_page_number <= total_pages:
-            policies_resp = \
-                self.list(page=current_page_number, page_size=MAX_PAGE_SIZE, search=search)
-            policies += policies_resp["data"]
-            current_page_number += 1
+    def iter_all(self, search=None, read_ahead=MAX_PAGE_FETCH_WORKERS, fields=None):
+        """
+        This function does not correlate to an endpoint in the TFC API Docs specifically,
+        but rather is a helper function to wrap the `list` endpoint, which lazily
+        enumerates every page so users can stream every policy for an organization
+        without holding every page in memory. Up to ``read_ahead`` pages are fetched
+        ahead of the caller, and breaking out of the loop stops fetching the rest.
 
-        return policies
+        Returns a generator of objects.
+        """
+        return self._iter_all(\
+            self._org_api_v2_base_url, read_ahead=read_ahead, search=search, fields=fields)
 
     def show(self, policy_id):
         """
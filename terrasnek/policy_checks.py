@@ -11,8 +11,12 @@ class TFCPolicyChecks(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/policy-checks.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/policy-checks"
         self._runs_api_v2_base_url = f"{self._api_v2_base_url}/runs"
 
@@ -25,7 +29,7 @@ class TFCPolicyChecks(TFCEndpoint):
     def terraform_enterprise_only(self):
         return False
 
-    def list(self, run_id):
+    def list(self, run_id, fields=None):
         """
         ``GET /runs/:run_id/policy-checks``
 
@@ -33,7 +37,7 @@ class TFCPolicyChecks(TFCEndpoint):
             <https://www.terraform.io/docs/cloud/api/policy-checks.html#list-policy-checks>`_
         """
         url = f"{self._runs_api_v2_base_url}/{run_id}/policy-checks"
-        return self._list(url)
+        return self._list(url, fields=fields)
 
     def override(self, policy_check_id):
         """
@@ -11,8 +11,12 @@ class TFCPolicySetParams(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/policy-set-params.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/policy-sets"
 
     def required_entitlements(self):
@@ -37,7 +41,7 @@ class TFCPolicySetParams(TFCEndpoint):
         url = f"{self._endpoint_base_url}/{policy_set_id}/parameters"
         return self._create(url, payload)
 
-    def list(self, policy_set_id):
+    def list(self, policy_set_id, fields=None):
         """
         ``GET /policy-sets/:policy_set_id/parameters``
 
@@ -45,7 +49,7 @@ class TFCPolicySetParams(TFCEndpoint):
             <https://www.terraform.io/docs/cloud/api/policy-set-params.html#list-parameters>`_
         """
         url = f"{self._endpoint_base_url}/{policy_set_id}/parameters"
-        return self._list(url)
+        return self._list(url, fields=fields)
 
     def update(self, policy_set_id, parameter_id, payload):
         """
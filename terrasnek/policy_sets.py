@@ -3,7 +3,7 @@ Module for Terraform Cloud API Endpoint: Policy Sets.
 """
 
 from .endpoint import TFCEndpoint
-from ._constants import Entitlements, MAX_PAGE_SIZE
+from ._constants import Entitlements, MAX_PAGE_FETCH_WORKERS
 
 class TFCPolicySets(TFCEndpoint):
     """
@@ -11,8 +11,12 @@ class TFCPolicySets(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/policy-sets.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/policy-sets"
         self._pol_set_version_api_v2_base_url = f"{self._api_v2_base_url}/policy-set-versions"
         self._org_api_v2_base_url = f"{self._api_v2_base_url}/organizations/{org_name}/policy-sets"
@@ -38,7 +42,7 @@ class TFCPolicySets(TFCEndpoint):
         """
         return self._create(self._org_api_v2_base_url, payload)
 
-    def list(self, filters=None, include=None, page=None, page_size=None, search=None):
+    def list(self, filters=None, include=None, page=None, page_size=None, search=None, fields=None):
         """
         ``GET /organizations/:organization_name/policy-sets``
 
@@ -67,9 +71,9 @@ class TFCPolicySets(TFCEndpoint):
         return self._list(\
             self._org_api_v2_base_url, \
             filters=filters, include=include, \
-            page=page, page_size=page_size, search=search)
+            page=page, page_size=page_size, search=search, fields=fields)
 
-    def list_all(self, search=None, filters=None, include=None):
+    def list_all(self, search=None, filters=None, include=None, fields=None):
         """
         This function does not correlate to an endpoint in the TFC API Docs specifically,
         but rather is a helper function to wrap the `list` endpoint, which enumerates out
@@ -78,22 +82,31 @@ class TFCPolicySets(TFCEndpoint):
 
         Returns an array of objects.
         """
-        current_page_number = 1
-        policy_sets_resp = \
-            self._list(self._org_api_v2_base_url, \
-                page=current_page_number, page_size=MAX_PAGE_SIZE, search=search)
-        total_pages = policy_sets_resp["meta"]["pagination"]["total-pages"]
+        return self._list_all(\
+            self._org_api_v2_base_url, search=search, filters=filters, include=include, \
+                fields=fields)
 
-        policy_sets = []
-        while current_page_number <= total_pages:
-            policy_sets_resp = \
-                self._list(\
-                    self._org_api_v2_base_url, page=current_page_number, page_size=MAX_PAGE_SIZE, \
-                        include=include, filters=filters, search=search)
-            policy_sets += policy_sets_resp["data"]
-            current_page_number += 1
+    def iter_all(\
+        self, search=None, filters=None, include=None, read_ahead=MAX_PAGE_FETCH_WORKERS, \
+            fields=None, resources=None):
+        """
+        This function does not correlate to an endpoint in the TFC API Docs specifically,
+        but rather is a helper function to wrap the `list` endpoint, which lazily
+        enumerates every page so users can stream every policy set for an organization
+        without holding every page in memory. Up to ``read_ahead`` pages are fetched
+        ahead of the caller, and breaking out of the loop stops fetching the rest.
+
+        With ``include``, the related resources are side-loaded, and added to
+        ``resources``, a ``TFCResources``, if one is given, as their pages
+        arrive, so it resolves the relationships of the policy sets yielded so far,
+        see ``terrasnek.documents``.
 
-        return policy_sets
+        Returns a generator of objects.
+        """
+        return self._iter_all(\
+            self._org_api_v2_base_url, read_ahead=read_ahead, \
+                search=search, filters=filters, include=include, resources=resources, \
+                    fields=fields)
 
     def show(self, policy_set_id):
         """
@@ -200,17 +213,16 @@ class TFCPolicySets(TFCEndpoint):
         url = f"{self._pol_set_version_api_v2_base_url}/{policy_set_version_id}"
         return self._get(url)
 
-    def upload(self, path_to_tarball, policy_set_version_id):
+    def upload(self, path_to_tarball, policy_set_version_id, content_length=None):
         """
         ``PUT {derived_policy_set_upload_url}``
         ``PUT https://archivist.terraform.io/v1/object/<UNIQUE OBJECT ID>``
 
         `Policy Sets Upload API Doc Reference \
             <https://www.terraform.io/docs/cloud/api/policy-sets.html#upload-policy-set-versions>`_
+
+        The tarball can be a path, an open binary file or an iterable of bytes,
+        and is streamed rather than read into memory.
         """
         url = self.show_policy_set_version(policy_set_version_id)["data"]["links"]["upload"]
-        data = None
-        with open(path_to_tarball, 'rb') as data_bytes:
-            data = data_bytes.read()
-
-        return self._put(url, data=data)
+        return self._upload(url, path_to_tarball, content_length=content_length)
@@ -3,7 +3,7 @@ Module for Terraform Cloud API Endpoint: Registry Modules.
 """
 
 from .endpoint import TFCEndpoint
-from ._constants import Entitlements
+from ._constants import Entitlements, DOWNLOAD_MAX_WORKERS
 
 class TFCRegistryModules(TFCEndpoint):
     """
@@ -14,8 +14,12 @@ class TFCRegistryModules(TFCEndpoint):
         <https://www.terraform.io/docs/registry/api.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._modules_v2_base_url = f"{self._api_v2_base_url}/registry-modules"
         self._modules_v1_base_url = f"{self._modules_v1_base_url}"
         self._org_api_v2_base_url = f"{self._api_v2_base_url}/organizations"
@@ -106,26 +110,42 @@ class TFCRegistryModules(TFCEndpoint):
         url = f"{self._modules_v1_base_url}/{self._org_name}/{name}/{provider}/{version}"
         return self._get(url)
 
-    def download_version_source(self, name, provider, version, target_path):
+    def download_version_source(\
+        self, name, provider, version, target_path, checksum=None, \
+            max_workers=DOWNLOAD_MAX_WORKERS):
         """
         ``GET <base_url>/:namespace/:name/:provider/:version/download``
 
         `Registry Modules Download Version Source API Doc Reference \
             <https://www.terraform.io/docs/registry/api.html#download-source-code-for-a-specific-module-version>`_
+
+        When the server supports byte ranges, the file is downloaded by up to
+        ``max_workers`` concurrent requests, and resumed if interrupted. It's
+        checked against ``checksum`` (e.g. ``"sha256:<hex digest>"``), if given.
+        Published versions are copied from the artifact cache of the API object,
+        if there is one and it holds the version.
         """
         url = f"{self._modules_v1_base_url}/{self._org_name}/{name}/{provider}/{version}/download"
-        return self._download(url, target_path, header_with_url="X-Terraform-Get")
+        return self._download_immutable(\
+            url, target_path, f"registry-modules/{self._org_name}/{name}/{provider}/{version}", \
+                header_with_url="X-Terraform-Get", checksum=checksum, max_workers=max_workers)
 
-    def download_latest_source(self, name, provider, target_path):
+    def download_latest_source(\
+        self, name, provider, target_path, checksum=None, max_workers=DOWNLOAD_MAX_WORKERS):
         """
         ``GET <base_url>/:namespace/:name/:provider/download``
 
         `Registry Modules Download Latest Source API Doc Reference \
             <https://www.terraform.io/docs/registry/api.html#download-the-latest-version-of-a-module>`_
+
+        When the server supports byte ranges, the file is downloaded by up to
+        ``max_workers`` concurrent requests, and resumed if interrupted. It's
+        checked against ``checksum`` (e.g. ``"sha256:<hex digest>"``), if given.
         """
         url = f"{self._modules_v1_base_url}/{self._org_name}/{name}/{provider}/download"
         return self._download(\
-            url, target_path, header_with_url="X-Terraform-Get", allow_redirects=True)
+            url, target_path, header_with_url="X-Terraform-Get", allow_redirects=True, \
+                checksum=checksum, max_workers=max_workers)
 
     # Private Registry API Endpoints
     def publish_from_vcs(self, payload):
@@ -187,16 +207,14 @@ class TFCRegistryModules(TFCEndpoint):
         url = f"{self._modules_v2_base_url}/{self._org_name}/{module_name}/{provider}/versions"
         return self._post(url, data=payload)
 
-    def upload_version(self, path_to_tarball, upload_url):
+    def upload_version(self, path_to_tarball, upload_url, content_length=None):
         """
         ``PUT https://archivist.terraform.io/v1/object/<UNIQUE OBJECT ID>``
 
         `Registry Modules Upload Version API Doc Reference \
             <https://www.terraform.io/docs/cloud/api/modules.html#upload-a-module-version>`_
-        """
-        data = None
 
-        with open(path_to_tarball, 'rb') as data_bytes:
-            data = data_bytes.read()
-
-        return self._put(upload_url, data=data)
+        The tarball can be a path, an open binary file or an iterable of bytes,
+        and is streamed rather than read into memory.
+        """
+        return self._upload(upload_url, path_to_tarball, content_length=content_length)
@@ -3,15 +3,19 @@ Module for Terraform Cloud API Endpoint: Run Triggers.
 """
 
 from .endpoint import TFCEndpoint
-from ._constants import Entitlements, MAX_PAGE_SIZE
+from ._constants import Entitlements, MAX_PAGE_FETCH_WORKERS
 
 class TFCRunTriggers(TFCEndpoint):
     """
     `Run Triggers API Docs \
         <https://www.terraform.io/docs/cloud/api/run-triggers.html>`_
     """
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/run-triggers"
         self._ws_api_v2_base_url = f"{self._api_v2_base_url}/workspaces"
 
@@ -37,7 +41,7 @@ class TFCRunTriggers(TFCEndpoint):
         url = f"{self._ws_api_v2_base_url}/{workspace_id}/run-triggers"
         return self._create(url, payload)
 
-    def list(self, workspace_id, filters=None, page=None, page_size=None):
+    def list(self, workspace_id, filters=None, page=None, page_size=None, fields=None):
         """
         ``GET /workspaces/:workspace_id/run-triggers``
 
@@ -61,9 +65,9 @@ class TFCRunTriggers(TFCEndpoint):
             ]
         """
         url = f"{self._ws_api_v2_base_url}/{workspace_id}/run-triggers"
-        return self._list(url, filters=filters, page=page, page_size=page_size)
+        return self._list(url, filters=filters, page=page, page_size=page_size, fields=fields)
 
-    def list_all(self, workspace_id, filters=None):
+    def list_all(self, workspace_id, filters=None, fields=None):
         """
         This function does not correlate to an endpoint in the TFC API Docs specifically,
         but rather is a helper function to wrap the `list` endpoint, which enumerates out
@@ -73,20 +77,20 @@ class TFCRunTriggers(TFCEndpoint):
         Returns an array of objects.
         """
         url = f"{self._ws_api_v2_base_url}/{workspace_id}/run-triggers"
+        return self._list_all(url, filters=filters, fields=fields)
 
-        current_page_number = 1
-        run_triggers_resp = \
-            self._list(url, page=current_page_number, page_size=MAX_PAGE_SIZE, filters=filters)
-        total_pages = run_triggers_resp["meta"]["pagination"]["total-pages"]
-
-        run_triggers = []
-        while current_page_number <= total_pages:
-            run_triggers_resp = \
-                self._list(url, page=current_page_number, page_size=MAX_PAGE_SIZE, filters=filters)
-            run_triggers += run_triggers_resp["data"]
-            current_page_number += 1
+    def iter_all(self, workspace_id, filters=None, read_ahead=MAX_PAGE_FETCH_WORKERS, fields=None):
+        """
+        This function does not correlate to an endpoint in the TFC API Docs specifically,
+        but rather is a helper function to wrap the `list` endpoint, which lazily
+        enumerates every page so users can stream every run trigger for a workspace
+        without holding every page in memory. Up to ``read_ahead`` pages are fetched
+        ahead of the caller, and breaking out of the loop stops fetching the rest.
 
-        return run_triggers
+        Returns a generator of objects.
+        """
+        url = f"{self._ws_api_v2_base_url}/{workspace_id}/run-triggers"
+        return self._iter_all(url, read_ahead=read_ahead, filters=filters, fields=fields)
 
     def show(self, run_trigger_id):
         """
@@ -3,7 +3,8 @@ Module for Terraform Cloud API Endpoint: Runs.
 """
 
 from .endpoint import TFCEndpoint
-from ._constants import Entitlements, MAX_PAGE_SIZE
+from .models import TFCRun
+from ._constants import Entitlements, MAX_PAGE_FETCH_WORKERS
 
 class TFCRuns(TFCEndpoint):
     """
@@ -11,8 +12,12 @@ class TFCRuns(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/run.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._ws_api_v2_base_url = f"{self._api_v2_base_url}/workspaces"
         self._runs_api_v2_base_url = f"{self._api_v2_base_url}/runs"
 
@@ -25,7 +30,7 @@ class TFCRuns(TFCEndpoint):
     def terraform_enterprise_only(self):
         return False
 
-    def list(self, workspace_id, page=None, page_size=None):
+    def list(self, workspace_id, page=None, page_size=None, include=None, fields=None):
         """
         ``GET /workspaces/:workspace_id/runs``
 
@@ -36,34 +41,56 @@ class TFCRuns(TFCEndpoint):
             <https://www.terraform.io/docs/cloud/api/run.html#query-parameters>`_):
             - ``page`` (Optional)
             - ``page_size`` (Optional)
+            - ``include`` (Optional)
         """
 
         url = f"{self._ws_api_v2_base_url}/{workspace_id}/runs"
-        return self._list(url, page=page, page_size=page_size)
+        return self._list(url, page=page, page_size=page_size, include=include, fields=fields)
 
-    def list_all(self, workspace_id):
+    def list_all(self, workspace_id, include=None, as_models=False, fields=None):
         """
         This function does not correlate to an endpoint in the TFC API Docs specifically,
         but rather is a helper function to wrap the `list` endpoint, which enumerates out
         every page so users do not have to implement the paging logic every time they just
         want to list every run for a workspace.
 
+        With ``include``, the related resources are side-loaded, and the
+        runs are returned as ``TFCResources``, which resolves their
+        relationships, see ``terrasnek.documents``.
+
+        With ``as_models``, each run is returned as a compact ``TFCRun``
+        object instead, see ``terrasnek.models``.
+
         Returns an array of objects.
         """
         url = f"{self._ws_api_v2_base_url}/{workspace_id}/runs"
+        return self._list_all(\
+            url, include=include, model=TFCRun if as_models else None, fields=fields)
 
-        current_page_number = 1
-        runs_resp = self._list(url, page=current_page_number, page_size=MAX_PAGE_SIZE)
-        total_pages = runs_resp["meta"]["pagination"]["total-pages"]
+    def iter_all(\
+        self, workspace_id, read_ahead=MAX_PAGE_FETCH_WORKERS, as_models=False, fields=None, \
+            include=None, resources=None):
+        """
+        This function does not correlate to an endpoint in the TFC API Docs specifically,
+        but rather is a helper function to wrap the `list` endpoint, which lazily
+        enumerates every page so users can stream every run for a workspace
+        without holding every page in memory. Up to ``read_ahead`` pages are fetched
+        ahead of the caller, and breaking out of the loop stops fetching the rest.
 
-        runs = []
-        while current_page_number <= total_pages:
-            runs_resp = \
-                self._list(url, page=current_page_number, page_size=MAX_PAGE_SIZE)
-            runs += runs_resp["data"]
-            current_page_number += 1
+        With ``include``, the related resources are side-loaded, and added to
+        ``resources``, a ``TFCResources``, if one is given, as their pages
+        arrive, so it resolves the relationships of the runs yielded so far,
+        see ``terrasnek.documents``.
 
-        return runs
+        With ``as_models``, each run is returned as a compact ``TFCRun``
+        object instead, see ``terrasnek.models``.
+
+        Returns a generator of objects.
+        """
+        url = f"{self._ws_api_v2_base_url}/{workspace_id}/runs"
+        return self._iter_all(\
+            url, read_ahead=read_ahead, include=include, resources=resources, \
+                model=TFCRun if as_models else None, fields=fields)
 
 
     def show(self, run_id):
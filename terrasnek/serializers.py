@@ -0,0 +1,54 @@
+"""
+Module containing the JSON serializers used to encode request payloads and
+decode response bodies. Decoding large pages of results is a noticeable share
+of the CPU time of listing many resources, so a faster backend can be given to
+the ``TFC`` object instead of the standard library one.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class TFCJSONSerializer():
+    """
+    JSON serializer backed by the standard library ``json`` module, which is
+    used by default.
+
+    Any object with the same ``loads`` and ``dumps`` methods can be given to
+    the ``TFC`` object instead, e.g. to use another JSON library.
+    """
+
+    def loads(self, data):
+        """
+        Decode a JSON document given as ``bytes`` or ``str``.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj):
+        """
+        Encode an object as a JSON document, as ``bytes`` or ``str``.
+        """
+        return json.dumps(obj)
+
+
+class TFCOrjsonSerializer(TFCJSONSerializer):
+    """
+    JSON serializer backed by ``orjson``, which decodes and encodes several
+    times faster than the standard library. Install it with
+    ``pip install terrasnek[orjson]``.
+    """
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError(\
+                "TFCOrjsonSerializer requires the orjson package: pip install terrasnek[orjson]")
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, obj):
+        return orjson.dumps(obj)
@@ -0,0 +1,372 @@
+"""
+Module for packaging a directory of Terraform configuration into a tar.gz
+archive (a "slug") which can be uploaded as a configuration version.
+
+The archive is deterministic, so the same files always produce the same bytes,
+and it is produced as a stream of chunks, so it never has to be written to a
+temporary file or held in memory. Gzip compression is split into blocks which
+are compressed concurrently on a thread pool, like ``pigz`` does, since
+``zlib`` releases the GIL while it compresses.
+"""
+
+import hashlib
+import os
+import posixpath
+import re
+import stat
+import struct
+import tarfile
+import threading
+import zlib
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from ._constants import SLUG_BLOCK_SIZE, SLUG_COMPRESS_LEVEL, SLUG_MANIFEST_MAX_ENTRIES
+from ._files import read_json, write_json
+
+TERRAFORM_IGNORE_FILE = ".terraformignore"
+
+# Rules which always apply before the ones of the directory, as in Terraform.
+BASE_IGNORE_RULES = [".terraform/", "!.terraform/modules/"]
+
+# Rules used when a directory has no ``.terraformignore``, as in Terraform.
+DEFAULT_IGNORE_RULES = [".git/"]
+
+# Size of the window of previous data each compressed block may refer back to.
+_DEFLATE_WINDOW_SIZE = 32 * 1024
+
+_IgnoreRule = namedtuple("_IgnoreRule", ["pattern", "regex", "negated", "dir_only", "anchored"])
+
+
+def _translate_pattern(pattern, anchored):
+    """
+    Translate a ``.terraformignore`` pattern into a regex matching relative
+    POSIX paths. ``*`` and ``?`` never match a ``/``, while ``**`` does.
+    """
+    regex = ""
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+        elif pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+        elif pattern[i] == "*":
+            regex += "[^/]*"
+            i += 1
+        elif pattern[i] == "?":
+            regex += "[^/]"
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 1:]:
+            end = pattern.index("]", i + 1)
+            char_class = pattern[i + 1:end].replace("\\", "\\\\")
+            if char_class.startswith("!"):
+                char_class = "^" + char_class[1:]
+            regex += f"[{char_class}]"
+            i = end + 1
+        else:
+            regex += re.escape(pattern[i])
+            i += 1
+
+    # Patterns without a slash match at any depth, like in a .gitignore.
+    if not anchored:
+        regex = "(?:.*/)?" + regex
+
+    return re.compile(regex + "$")
+
+
+def _parse_ignore_rules(lines):
+    """
+    Parse ``.terraformignore`` lines into rules, skipping blank lines and comments.
+    """
+    rules = []
+    for line in lines:
+        pattern = line.strip()
+        if not pattern or pattern.startswith("#"):
+            continue
+
+        negated = pattern.startswith("!")
+        if negated:
+            pattern = pattern[1:]
+
+        dir_only = pattern.endswith("/")
+        pattern = pattern.strip("/")
+        if not pattern:
+            continue
+
+        anchored = line.strip().lstrip("!").startswith("/") or "/" in pattern
+        rules.append(_IgnoreRule(\
+            pattern, _translate_pattern(pattern, anchored), negated, dir_only, anchored))
+
+    return rules
+
+
+def read_ignore_rules(path, exclude=None):
+    """
+    Return the ignore rules of the directory at ``path``, read from its
+    ``.terraformignore`` if it has one, or else Terraform's default rules,
+    followed by the extra ``exclude`` patterns, if any.
+    """
+    ignore_file_path = os.path.join(path, TERRAFORM_IGNORE_FILE)
+    if os.path.isfile(ignore_file_path):
+        with open(ignore_file_path, "r", encoding="utf-8") as ignore_file:
+            lines = ignore_file.read().splitlines()
+    else:
+        lines = DEFAULT_IGNORE_RULES
+
+    return _parse_ignore_rules(BASE_IGNORE_RULES + lines + list(exclude or []))
+
+
+def _is_excluded(rules, rel_path, is_dir, parent_excluded):
+    """
+    Return whether a path is excluded. The last matching rule wins, and paths
+    under an excluded directory are excluded unless a rule includes them again.
+    """
+    excluded = parent_excluded
+    for rule in rules:
+        if rule.dir_only and not is_dir:
+            continue
+        if rule.regex.match(rel_path):
+            excluded = not rule.negated
+
+    return excluded
+
+
+def _may_include_under(rules, rel_dir):
+    """
+    Return whether any rule could include a path under an excluded directory,
+    so that it has to be walked anyway.
+    """
+    for rule in rules:
+        if not rule.negated:
+            continue
+        if not rule.anchored or rule.pattern.startswith(rel_dir + "/") or \
+            any(char in rule.pattern for char in "*?["):
+            return True
+
+    return False
+
+
+def walk(path, rules):
+    """
+    Yield the relative POSIX path and ``os.DirEntry`` of every directory, file
+    and symlink under ``path`` which isn't excluded by ``rules``, in a stable
+    order.
+    """
+    def walk_dir(rel_dir, parent_excluded):
+        with os.scandir(os.path.join(path, rel_dir)) as dir_entries:
+            entries = sorted(dir_entries, key=lambda entry: entry.name)
+
+        for entry in entries:
+            rel_path = posixpath.join(rel_dir, entry.name) if rel_dir else entry.name
+            is_dir = entry.is_dir(follow_symlinks=False)
+            excluded = _is_excluded(rules, rel_path, is_dir, parent_excluded)
+
+            if not excluded:
+                yield rel_path, entry
+            if is_dir and (not excluded or _may_include_under(rules, rel_path)):
+                yield from walk_dir(rel_path, excluded)
+
+    return walk_dir("", False)
+
+
+def _tar_info(rel_path, entry):
+    """
+    Return the tar header of an entry, leaving out everything which would make
+    the archive differ between machines or checkouts, like owners and mtimes.
+    """
+    tar_info = tarfile.TarInfo(rel_path)
+    tar_info.mtime = 0
+    tar_info.uid = tar_info.gid = 0
+    tar_info.uname = tar_info.gname = ""
+
+    if entry.is_symlink():
+        tar_info.type = tarfile.SYMTYPE
+        tar_info.linkname = os.readlink(entry.path)
+        tar_info.mode = 0o777
+    elif entry.is_dir(follow_symlinks=False):
+        tar_info.type = tarfile.DIRTYPE
+        tar_info.mode = 0o755
+    elif entry.is_file(follow_symlinks=False):
+        entry_stat = entry.stat(follow_symlinks=False)
+        tar_info.size = entry_stat.st_size
+        tar_info.mode = 0o755 if entry_stat.st_mode & stat.S_IXUSR else 0o644
+    else:
+        # Sockets, FIFOs and devices aren't configuration.
+        return None
+
+    return tar_info
+
+
+def iter_tar(path, exclude=None, chunk_size=SLUG_BLOCK_SIZE):
+    """
+    Yield the uncompressed, deterministic tar archive of the directory at
+    ``path`` in chunks of at most ``chunk_size`` bytes.
+    """
+    rules = read_ignore_rules(path, exclude=exclude)
+    archive_size = 0
+
+    for rel_path, entry in walk(path, rules):
+        tar_info = _tar_info(rel_path, entry)
+        if tar_info is None:
+            continue
+
+        header = tar_info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+        archive_size += len(header)
+        yield header
+
+        if tar_info.isreg():
+            remaining = tar_info.size
+            with open(entry.path, "rb") as source_file:
+                while remaining > 0:
+                    chunk = source_file.read(min(chunk_size, remaining))
+                    if not chunk:
+                        raise OSError(f"{entry.path} was truncated while it was archived.")
+                    remaining -= len(chunk)
+                    yield chunk
+
+            archive_size += tar_info.size
+            padding = -tar_info.size % tarfile.BLOCKSIZE
+            archive_size += padding
+            yield tarfile.NUL * padding
+
+    # End of archive marker, padded to a full record like ``tarfile`` does.
+    end_size = 2 * tarfile.BLOCKSIZE
+    end_size += -(archive_size + end_size) % tarfile.RECORDSIZE
+    yield tarfile.NUL * end_size
+
+
+def _blocks(chunks, block_size):
+    """
+    Regroup chunks of bytes into blocks of ``block_size`` bytes, except the last.
+    """
+    buf = bytearray()
+    for chunk in chunks:
+        buf += chunk
+        while len(buf) >= block_size:
+            yield bytes(buf[:block_size])
+            del buf[:block_size]
+
+    if buf:
+        yield bytes(buf)
+
+
+def _deflate_block(block, zdict, compress_level):
+    """
+    Compress a block into raw deflate data which can be concatenated with the
+    other blocks, priming it with the end of the previous block so the
+    compression ratio is close to compressing the whole stream at once.
+    """
+    compress_args = [compress_level, zlib.DEFLATED, -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL, 0]
+    if zdict:
+        compress_args.append(zdict)
+
+    compressor = zlib.compressobj(*compress_args)
+    return compressor.compress(block) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+def gzip_chunks(\
+    chunks, compress_level=SLUG_COMPRESS_LEVEL, block_size=SLUG_BLOCK_SIZE, max_workers=None):
+    """
+    Yield a single member gzip stream of the given chunks of bytes, which are
+    compressed in blocks of ``block_size`` bytes on up to ``max_workers``
+    threads (the number of CPUs by default).
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+
+    # Gzip header without a file name or mtime, so the output is deterministic.
+    yield struct.pack("<BBBBIBB", 0x1f, 0x8b, zlib.DEFLATED, 0, 0, 0, 255)
+
+    crc = 0
+    size = 0
+    zdict = b""
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending_blocks = deque()
+    try:
+        for block in _blocks(chunks, block_size):
+            crc = zlib.crc32(block, crc)
+            size += len(block)
+            pending_blocks.append(\
+                executor.submit(_deflate_block, block, zdict, compress_level))
+            zdict = (zdict + block)[-_DEFLATE_WINDOW_SIZE:]
+
+            # Keep every worker busy, without buffering the whole archive.
+            while len(pending_blocks) > 2 * max_workers:
+                yield pending_blocks.popleft().result()
+
+        while pending_blocks:
+            yield pending_blocks.popleft().result()
+    finally:
+        for pending_block in pending_blocks:
+            pending_block.cancel()
+        executor.shutdown(wait=False)
+
+    # An empty final block ends the deflate stream.
+    yield zlib.compressobj(compress_level, zlib.DEFLATED, -zlib.MAX_WBITS).flush()
+    yield struct.pack("<II", crc & 0xffffffff, size & 0xffffffff)
+
+
+def pack(path, exclude=None, compress_level=SLUG_COMPRESS_LEVEL, max_workers=None):
+    """
+    Yield the deterministic tar.gz archive of the Terraform configuration in
+    the directory at ``path``, leaving out the paths excluded by its
+    ``.terraformignore`` and by the extra ``exclude`` patterns.
+    """
+    return gzip_chunks(\
+        iter_tar(path, exclude=exclude), compress_level=compress_level, max_workers=max_workers)
+
+
+def content_hash(path, exclude=None, extra=None):
+    """
+    Return the SHA256 hex digest of the deterministic tar archive of the
+    directory at ``path``, which only changes when the packaged files do,
+    followed by the ``extra`` bytes, if any.
+    """
+    digest = hashlib.sha256()
+    for chunk in iter_tar(path, exclude=exclude):
+        digest.update(chunk)
+
+    if extra:
+        digest.update(extra)
+
+    return digest.hexdigest()
+
+
+class SlugManifest():
+    """
+    Manifest of the content hashes of the slugs uploaded to each workspace,
+    and the config versions they were uploaded as, stored in a JSON file.
+
+    Only the last ``max_entries`` hashes of each workspace are kept. The file
+    is replaced atomically, so concurrent processes never corrupt it, at
+    worst one of them forgets an upload and makes it again.
+    """
+
+    def __init__(self, path, max_entries=SLUG_MANIFEST_MAX_ENTRIES):
+        self.path = os.path.expanduser(path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def _read_workspaces(self):
+        workspaces = read_json(self.path, default={})
+        return workspaces if isinstance(workspaces, dict) else {}
+
+    def get(self, workspace_id, slug_hash):
+        """
+        Return the ID of the config version the slug was uploaded to the
+        workspace as, or ``None`` if it wasn't.
+        """
+        return self._read_workspaces().get(workspace_id, {}).get(slug_hash)
+
+    def set(self, workspace_id, slug_hash, config_version_id):
+        """
+        Record that the slug was uploaded to the workspace as a config version.
+        """
+        with self._lock:
+            workspaces = self._read_workspaces()
+            uploads = workspaces.get(workspace_id, {})
+            uploads.pop(slug_hash, None)
+            uploads[slug_hash] = config_version_id
+            workspaces[workspace_id] = dict(list(uploads.items())[-self.max_entries:])
+            write_json(self.path, workspaces)
@@ -10,8 +10,12 @@ class TFCSSHKeys(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/ssh-keys.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/ssh-keys"
         self._org_api_v2_base_url = f"{self._api_v2_base_url}/organizations/{org_name}/ssh-keys"
 
@@ -36,14 +40,14 @@ class TFCSSHKeys(TFCEndpoint):
         """
         return self._create(self._org_api_v2_base_url, payload)
 
-    def list(self):
+    def list(self, fields=None):
         """
         ``GET /organizations/:organization_name/ssh-keys``
 
         `SSH Keys List API Doc Reference \
             <https://www.terraform.io/docs/cloud/api/ssh-keys.html#list-ssh-keys>`_
         """
-        return self._list(self._org_api_v2_base_url)
+        return self._list(self._org_api_v2_base_url, fields=fields)
 
     def show(self, ssh_key_id):
         """
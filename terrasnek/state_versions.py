@@ -3,7 +3,8 @@ Module for Terraform Cloud API Endpoint: State Versions.
 """
 
 from .endpoint import TFCEndpoint
-from ._constants import Entitlements, MAX_PAGE_SIZE
+from .models import TFCStateVersion
+from ._constants import Entitlements, MAX_PAGE_FETCH_WORKERS, DOWNLOAD_MAX_WORKERS
 
 class TFCStateVersions(TFCEndpoint):
     """
@@ -11,8 +12,12 @@ class TFCStateVersions(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/state-versions.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._state_version_api_v2_base_url = f"{self._api_v2_base_url}/state-versions"
         self._workspace_api_v2_base_url = f"{self._api_v2_base_url}/workspaces"
 
@@ -48,7 +53,7 @@ class TFCStateVersions(TFCEndpoint):
         url = f"{self._workspace_api_v2_base_url}/{workspace_id}/current-state-version"
         return self._get(url)
 
-    def list(self, filters, page=None, page_size=None):
+    def list(self, filters, page=None, page_size=None, fields=None):
         """
         ``GET /state-versions``
 
@@ -78,32 +83,40 @@ class TFCStateVersions(TFCEndpoint):
             ]
         """
         url = f"{self._state_version_api_v2_base_url}"
-        return self._list(url, filters=filters, page=page, page_size=page_size)
+        return self._list(url, filters=filters, page=page, page_size=page_size, fields=fields)
 
-    def list_all(self, filters):
+    def list_all(self, filters, as_models=False, fields=None):
         """
         This function does not correlate to an endpoint in the TFC API Docs specifically,
         but rather is a helper function to wrap the `list` endpoint, which enumerates out
         every page so users do not have to implement the paging logic every time they just
         want to list every state version for a workspace.
 
+        With ``as_models``, each state version is returned as a compact ``TFCStateVersion``
+        object instead, see ``terrasnek.models``.
+
         Returns an array of objects.
         """
-        url = self._state_version_api_v2_base_url
+        return self._list_all(\
+            self._state_version_api_v2_base_url, filters=filters, \
+                model=TFCStateVersion if as_models else None, fields=fields)
 
-        current_page_number = 1
-        state_versions_resp = \
-            self._list(url, filters=filters, page=current_page_number, page_size=MAX_PAGE_SIZE)
-        total_pages = state_versions_resp["meta"]["pagination"]["total-pages"]
+    def iter_all(self, filters, read_ahead=MAX_PAGE_FETCH_WORKERS, as_models=False, fields=None):
+        """
+        This function does not correlate to an endpoint in the TFC API Docs specifically,
+        but rather is a helper function to wrap the `list` endpoint, which lazily
+        enumerates every page so users can stream every state version for a workspace
+        without holding every page in memory. Up to ``read_ahead`` pages are fetched
+        ahead of the caller, and breaking out of the loop stops fetching the rest.
 
-        state_versions = []
-        while current_page_number <= total_pages:
-            state_versions_resp = \
-                self._list(url, filters=filters, page=current_page_number, page_size=MAX_PAGE_SIZE)
-            state_versions += state_versions_resp["data"]
-            current_page_number += 1
+        With ``as_models``, each state version is returned as a compact ``TFCStateVersion``
+        object instead, see ``terrasnek.models``.
 
-        return state_versions
+        Returns a generator of objects.
+        """
+        return self._iter_all(\
+            self._state_version_api_v2_base_url, read_ahead=read_ahead, filters=filters, \
+                model=TFCStateVersion if as_models else None, fields=fields)
 
     def show(self, state_version_id):
         """
@@ -114,3 +127,27 @@ class TFCStateVersions(TFCEndpoint):
         """
         url = f"{self._state_version_api_v2_base_url}/{state_version_id}"
         return self._show(url)
+
+    def download(\
+        self, state_version_id, target_path, checksum=None, max_workers=DOWNLOAD_MAX_WORKERS):
+        """
+        This function does not correlate to an endpoint in the TFC API Docs specifically,
+        but rather is a helper function which downloads the state file of a state
+        version, from the ``hosted-state-download-url`` of its ``show`` response.
+
+        A state version never changes once it exists, so its state is copied from
+        the artifact cache of the API object, if there is one and it holds the
+        state, without looking the state version up. It's checked against
+        ``checksum`` (e.g. ``"sha256:<hex digest>"``), if given.
+        """
+        def download_url():
+            # The download URL is signed and expires, so it's looked up on every cache miss.
+            return self._download_url(self.show(state_version_id))
+
+        return self._download_immutable(\
+            download_url, target_path, f"state-versions/{state_version_id}", \
+                allow_redirects=True, checksum=checksum, max_workers=max_workers)
+
+    @staticmethod
+    def _download_url(state_version):
+        return state_version["data"]["attributes"]["hosted-state-download-url"]
@@ -11,8 +11,12 @@ class TFCTeamAccess(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/team-access.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/team-workspaces"
 
     def required_entitlements(self):
@@ -36,7 +40,7 @@ class TFCTeamAccess(TFCEndpoint):
         """
         return self._post(self._endpoint_base_url, data=payload)
 
-    def list(self, filters=None):
+    def list(self, filters=None, fields=None):
         """
         ``GET /team-workspaces``
 
@@ -58,7 +62,7 @@ class TFCTeamAccess(TFCEndpoint):
                 }
             ]
         """
-        return self._list(self._endpoint_base_url, filters=filters)
+        return self._list(self._endpoint_base_url, filters=filters, fields=fields)
 
     def remove_team_access(self, access_id):
         """
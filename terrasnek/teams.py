@@ -11,8 +11,12 @@ class TFCTeams(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/teams.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._teams_api_v2_base_url = f"{self._api_v2_base_url}/teams"
         self._org_api_v2_base_url = f"{self._api_v2_base_url}/organizations/{org_name}/teams"
 
@@ -47,14 +51,14 @@ class TFCTeams(TFCEndpoint):
         url = f"{self._teams_api_v2_base_url}/{team_id}"
         return self._destroy(url)
 
-    def list(self):
+    def list(self, fields=None):
         """
         ``GET organizations/:organization_name/teams``
 
         `Teams List API Doc Reference \
             <https://www.terraform.io/docs/cloud/api/teams.html#list-teams>`_
         """
-        return self._list(self._org_api_v2_base_url)
+        return self._list(self._org_api_v2_base_url, fields=fields)
 
     def show(self, team_id):
         """
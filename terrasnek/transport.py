@@ -0,0 +1,739 @@
+"""
+Module containing the HTTP transport shared by every endpoint of a TFC API object.
+"""
+
+import copy
+import hashlib
+import itertools
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+
+import requests
+
+from ._constants import \
+    HTTP_OK, HTTP_NOT_MODIFIED, HTTP_NOT_FOUND, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT, \
+        HTTP_COALESCE_GETS, HTTP_UNAUTHORIZED, \
+        HTTP_TOO_MANY_REQUESTS, HTTP_INTERNAL_SERVER_ERROR, HTTP_BAD_GATEWAY, \
+            HTTP_SERVICE_UNAVAILABLE, HTTP_GATEWAY_TIMEOUT, RATE_LIMIT_REQUESTS_PER_SECOND, \
+                RATE_LIMIT_MAX_RETRIES, RATE_LIMIT_TOKEN_COOLDOWN, RETRY_MAX_RETRIES, \
+                    RETRY_BACKOFF_FACTOR, RETRY_MAX_BACKOFF, RETRY_JITTER, RETRY_DEADLINE, \
+                        RETRY_METHODS
+from .exceptions import TFCDeadlineExceeded
+
+# HTTP status codes of transient server side failures, which are worth retrying.
+RETRY_STATUS_CODES = frozenset([\
+    HTTP_INTERNAL_SERVER_ERROR, HTTP_BAD_GATEWAY, HTTP_SERVICE_UNAVAILABLE, HTTP_GATEWAY_TIMEOUT])
+
+# Monotonic time at which the innermost ``deadline`` block of the current context runs out.
+_DEADLINE = ContextVar("terrasnek_deadline", default=None)
+
+# ``(connect, read)`` timeouts set by the innermost ``timeout`` block of the current context.
+_TIMEOUT = ContextVar("terrasnek_timeout", default=None)
+
+
+@contextmanager
+def deadline(seconds):
+    """
+    Bound every request sent within the block, including the ones sent by
+    helpers such as ``list_all``, by an overall deadline of ``seconds``.
+
+    Each request is only given the time left on the deadline as its timeouts,
+    waits for the rate limiter or a retry which would outlast it are given up
+    on, and ``TFCDeadlineExceeded`` is raised once no time is left. A nested
+    deadline can shorten, but never extend, the one around it.
+    """
+    expires_at = time.monotonic() + seconds
+    outer_expires_at = _DEADLINE.get()
+    if outer_expires_at is not None:
+        expires_at = min(expires_at, outer_expires_at)
+
+    token = _DEADLINE.set(expires_at)
+    try:
+        yield
+    finally:
+        _DEADLINE.reset(token)
+
+
+@contextmanager
+def timeout(connect=None, read=None):
+    """
+    Override the connect and read timeouts, in seconds, of every request sent
+    within the block. Timeouts left as ``None`` keep the client's value.
+    """
+    token = _TIMEOUT.set((connect, read))
+    try:
+        yield
+    finally:
+        _TIMEOUT.reset(token)
+
+
+def _remaining_time():
+    """
+    Return the seconds left on the deadline of the current context, or ``None``
+    if there isn't one.
+    """
+    expires_at = _DEADLINE.get()
+    return None if expires_at is None else expires_at - time.monotonic()
+
+
+def _deadline_expired():
+    """
+    Return whether the deadline of the current context has run out.
+    """
+    remaining = _remaining_time()
+    return remaining is not None and remaining <= 0
+
+
+def _request_timeout(connect, read):
+    """
+    Return the ``(connect, read)`` timeouts of the next request, after the
+    overrides of the current context, capped to the time left on its deadline.
+    """
+    override = _TIMEOUT.get()
+    if override is not None:
+        connect = override[0] if override[0] is not None else connect
+        read = override[1] if override[1] is not None else read
+
+    remaining = _remaining_time()
+    if remaining is not None:
+        if remaining <= 0:
+            raise TFCDeadlineExceeded("The deadline ran out before the request could be sent.")
+        connect = remaining if connect is None else min(connect, remaining)
+        read = remaining if read is None else min(read, remaining)
+
+    return connect, read
+
+
+def _check_wait(wait):
+    """
+    Raise ``TFCDeadlineExceeded`` if waiting ``wait`` seconds would outlast the
+    deadline of the current context.
+    """
+    remaining = _remaining_time()
+    if remaining is not None and wait >= remaining:
+        raise TFCDeadlineExceeded("The deadline would run out before the request could be sent.")
+
+
+def _body_position(body):
+    """
+    Return the position to rewind a request body to before sending it again,
+    ``0`` for in-memory bodies, or ``None`` if it can't be sent again, like a
+    generator which has been consumed.
+    """
+    if body is None or isinstance(body, (bytes, bytearray, str, dict, list, tuple)):
+        return 0
+
+    try:
+        return body.tell()
+    except (AttributeError, OSError):
+        return None
+
+
+def _rewind_body(body, position):
+    """
+    Rewind a request body to ``position`` so it can be sent again, returning
+    ``False`` if it can't be.
+    """
+    if position is None:
+        return False
+
+    if hasattr(body, "seek"):
+        body.seek(position)
+
+    return True
+
+
+def _float_header(headers, name):
+    """
+    Return the value of a numeric header, or ``None`` if it is missing or invalid.
+    """
+    try:
+        return max(float(headers[name]), 0.0)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _retry_after_seconds(headers):
+    """
+    Return the seconds to wait from a ``Retry-After`` header, which holds either
+    a number of seconds or an HTTP date, or ``None`` if it can't be parsed.
+    """
+    seconds = _float_header(headers, "Retry-After")
+    if seconds is None and headers.get("Retry-After"):
+        try:
+            retry_at = parsedate_to_datetime(headers["Retry-After"]).timestamp()
+            seconds = max(retry_at - time.time(), 0.0)
+        except (TypeError, ValueError):
+            pass
+
+    return seconds
+
+
+class TFCRateLimiter():
+    """
+    Thread safe token bucket scheduling requests to the TFC API.
+
+    Each request reserves a token, and waits until the bucket has refilled
+    enough to cover it, so bursts above the rate are queued rather than
+    rejected by the server. The bucket also follows the ``X-RateLimit-*`` and
+    ``Retry-After`` headers of every response, pausing all requests until the
+    server says the limit has reset.
+    """
+
+    def __init__(self, rate=RATE_LIMIT_REQUESTS_PER_SECOND, burst=None):
+        self._max_rate = float(rate)
+        self._rate = self._max_rate
+        self._capacity = float(burst if burst is not None else rate)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Reserve a token for a request, returning how many seconds the caller
+        must wait before sending it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = \
+                min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+            self._updated_at = now
+            self._tokens -= 1
+
+            token_wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            return max(token_wait, self._paused_until - now)
+
+    def acquire(self):
+        """
+        Block until a request can be sent.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def update(self, status_code, headers):
+        """
+        Update the bucket from the status code and rate limit headers of a response.
+        """
+        limit = _float_header(headers, "X-RateLimit-Limit")
+        remaining = _float_header(headers, "X-RateLimit-Remaining")
+        reset = _float_header(headers, "X-RateLimit-Reset")
+
+        pause = None
+        if status_code == HTTP_TOO_MANY_REQUESTS:
+            pause = _retry_after_seconds(headers)
+            if pause is None:
+                pause = reset if reset is not None else 1 / self._rate
+        elif remaining is not None and remaining < 1 and reset is not None:
+            pause = reset
+
+        with self._lock:
+            # Never schedule faster than the server allows, or than we were asked to.
+            if limit:
+                self._rate = min(self._max_rate, limit)
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+            if pause is not None:
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+
+
+class _PooledToken():
+    """
+    Rate limit budget of a token of a ``TFCTokenPool``.
+    """
+
+    __slots__ = ("token", "limiter", "remaining", "resets_at", "out_until", "used_at")
+
+    def __init__(self, token, limiter):
+        self.token = token
+        self.limiter = limiter
+        self.remaining = None
+        self.resets_at = None
+        self.out_until = 0.0
+        self.used_at = 0.0
+
+
+class TFCTokenPool():
+    """
+    Thread safe pool of tokens to spread requests over, since the TFC API rate
+    limits each token separately.
+
+    Each request is sent with the token with the most requests left in its
+    current rate limit window, as told by the ``X-RateLimit-Remaining`` header
+    of its last response, and tokens nothing is known about yet come first.
+    Each token is scheduled by its own ``TFCRateLimiter`` of ``rate`` requests
+    per second, unless ``rate`` is ``None``. A token is taken out of rotation
+    when it's rate limited, until the server says the limit has reset or for
+    ``cooldown`` seconds, and for good when it's rejected as unauthorized.
+    The tokens should have the same access, since cached responses are shared
+    between them.
+    """
+
+    def __init__(self, tokens, rate=RATE_LIMIT_REQUESTS_PER_SECOND, burst=None, \
+        cooldown=RATE_LIMIT_TOKEN_COOLDOWN):
+        if not tokens:
+            raise ValueError("A token pool needs at least one token.")
+        self.cooldown = cooldown
+        # Placeholder ``Authorization`` header of the requests to send with a token
+        # of the pool, which the session replaces right before sending them. It's
+        # derived from the tokens, so that it tells pools of other tokens apart.
+        fingerprint = hashlib.sha256("\n".join(sorted(tokens)).encode("utf-8")).hexdigest()
+        self.authorization = f"Bearer terrasnek-token-pool-{fingerprint}"
+        self._tokens = {\
+            token: _PooledToken(token, TFCRateLimiter(rate, burst=burst) if rate else None) \
+                for token in tokens}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def acquire(self):
+        """
+        Pick the token to send the next request with, returning it along with
+        how many seconds the caller must wait before sending it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            in_rotation = [pooled for pooled in self._tokens.values() if pooled.out_until <= now]
+            if in_rotation:
+                # Break ties by the least recently used, to rotate through fresh tokens.
+                pooled = max(in_rotation, key=lambda pooled: \
+                    (self._remaining(pooled, now), -pooled.used_at))
+                wait = 0.0
+            else:
+                # Fall back on the token back in rotation the soonest, or on a rejected
+                # one once they all were, so that the request fails as unauthorized.
+                pooled = min(self._tokens.values(), key=lambda pooled: pooled.out_until)
+                wait = pooled.out_until - now if pooled.out_until != float("inf") else 0.0
+
+            if pooled.remaining is not None:
+                pooled.remaining -= 1
+            pooled.used_at = now
+
+        if pooled.limiter is not None:
+            wait = max(wait, pooled.limiter.reserve())
+        return pooled.token, wait
+
+    def update(self, token, status_code, headers):
+        """
+        Update the budget of a token from the status code and rate limit headers
+        of a response to a request sent with it.
+        """
+        pooled = self._tokens[token]
+        if pooled.limiter is not None:
+            pooled.limiter.update(status_code, headers)
+
+        remaining = _float_header(headers, "X-RateLimit-Remaining")
+        reset = _float_header(headers, "X-RateLimit-Reset")
+
+        with self._lock:
+            now = time.monotonic()
+            if remaining is not None:
+                pooled.remaining = remaining
+                pooled.resets_at = now + reset if reset is not None else None
+            if status_code == HTTP_UNAUTHORIZED:
+                pooled.out_until = float("inf")
+            elif status_code == HTTP_TOO_MANY_REQUESTS:
+                pause = _retry_after_seconds(headers)
+                if pause is None:
+                    pause = reset if reset is not None else self.cooldown
+                pooled.out_until = max(pooled.out_until, now + pause)
+
+    def in_rotation(self):
+        """
+        Return how many tokens of the pool are in rotation.
+        """
+        with self._lock:
+            now = time.monotonic()
+            return sum(1 for pooled in self._tokens.values() if pooled.out_until <= now)
+
+    @staticmethod
+    def _remaining(pooled, now):
+        if pooled.remaining is None or (pooled.resets_at is not None and pooled.resets_at <= now):
+            return float("inf")
+        return pooled.remaining
+
+
+def _retry_with_another_token(token_pool, status_code, rate_limit_retries, max_rate_limit_retries):
+    """
+    Return whether a request refused for its token of a token pool can be sent
+    again with another one, i.e. if it was rate limited and has retries left,
+    or if it was unauthorized and other tokens are still in rotation.
+    """
+    if status_code == HTTP_TOO_MANY_REQUESTS:
+        return rate_limit_retries < max_rate_limit_retries
+    return status_code == HTTP_UNAUTHORIZED and token_pool.in_rotation() > 0
+
+
+def _is_pooled(token_pool, headers):
+    """
+    Return whether a request is to be sent with a token of the token pool.
+    """
+    return token_pool is not None and \
+        (headers or {}).get("Authorization") == token_pool.authorization
+
+
+class TFCRetryPolicy():
+    """
+    Policy for retrying requests which failed transiently, because of a 5XX
+    response, a reset connection or a timeout.
+
+    Only idempotent methods are retried by default. POSTs can be opted in with
+    ``retry_post``. Each retry waits for an exponential backoff, reduced by a
+    random ``jitter`` fraction so that clients don't retry in lockstep. A
+    request is given up on once it runs out of retries, or once the next retry
+    would start after ``retry_deadline`` seconds since the first attempt. Every retry
+    is counted by reason in ``retry_counts``.
+    """
+
+    def __init__(self, max_retries=RETRY_MAX_RETRIES, backoff_factor=RETRY_BACKOFF_FACTOR, \
+        max_backoff=RETRY_MAX_BACKOFF, jitter=RETRY_JITTER, retry_deadline=RETRY_DEADLINE, \
+            retry_post=False, status_codes=RETRY_STATUS_CODES):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_deadline = retry_deadline
+        self.methods = RETRY_METHODS | {"POST"} if retry_post else RETRY_METHODS
+        self.status_codes = status_codes
+        self.retry_counts = Counter()
+        self._lock = threading.Lock()
+
+    def retry_delay(self, method, retries, started_at, retry_after=None):
+        """
+        Return how many seconds to wait before retrying a request which has
+        already been retried ``retries`` times, or ``None`` to give up on it.
+        """
+        if method.upper() not in self.methods or retries >= self.max_retries:
+            return None
+
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** retries))
+        delay = backoff * (1 - self.jitter * random.random())
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if self.retry_deadline is not None and \
+            time.monotonic() + delay - started_at > self.retry_deadline:
+            return None
+
+        return delay
+
+    def record_retry(self, reason):
+        """
+        Count a retry for the given reason, e.g. ``HTTP 503`` or ``ReadTimeout``.
+        """
+        with self._lock:
+            self.retry_counts[reason] += 1
+            self.retry_counts["total"] += 1
+
+
+def _is_bounded():
+    """
+    Return whether the requests of the current context are bounded by a
+    ``deadline`` or ``timeout`` block, which other contexts don't share.
+    """
+    return _DEADLINE.get() is not None or _TIMEOUT.get() is not None
+
+
+def _is_conditional(headers):
+    """
+    Return whether the caller sent its own validators, whose ``304 Not
+    Modified`` answer must reach it as is rather than go through the caches.
+    """
+    return any(name in (headers or {}) for name in ("If-None-Match", "If-Modified-Since"))
+
+
+def _coalesce_key(method, url, headers, allow_redirects, write_generation):
+    """
+    Return the key of the requests which can share a response, i.e. identical
+    GETs sent with the same headers, including the token, since the same write.
+    """
+    return (method.upper(), url, tuple(sorted((headers or {}).items())), allow_redirects, \
+        write_generation)
+
+
+def _copy_response(resp):
+    """
+    Return a copy of a fully read response, sharing its immutable body, for
+    another caller to use and change as its own.
+    """
+    resp_copy = copy.copy(resp)
+    resp_copy.headers = resp.headers.copy()
+    return resp_copy
+
+
+class _SingleFlight():
+    """
+    Thread safe registry of the calls in flight, so that a call made while an
+    identical one is in flight waits for it and shares its result, or its
+    exception, rather than making the call again.
+
+    A call which timed out within a ``deadline`` or ``timeout`` block is made
+    again by each caller waiting on it, since they may not share its bounds.
+    The callers waiting on a call get their own copy of its result, made by
+    ``copy_result``, or of its exception.
+    """
+
+    def __init__(self, copy_result=copy.copy):
+        self._calls = {}
+        self._copy_result = copy_result
+        self._lock = threading.Lock()
+
+    def do(self, key, func):
+        """
+        Return the result of ``func``, or of the call in flight with the same key.
+        """
+        with self._lock:
+            leader = key not in self._calls
+            if leader:
+                self._calls[key] = (Future(), _is_bounded())
+            call, bounded = self._calls[key]
+
+        if not leader:
+            try:
+                return self._copy_result(call.result(timeout=_remaining_time()))
+            except FutureTimeoutError as err:
+                if not call.done():
+                    raise TFCDeadlineExceeded(\
+                        "The deadline ran out while waiting for an identical request.") from None
+                raise copy.copy(err) from err
+            except (requests.Timeout, TFCDeadlineExceeded) as err:
+                if not bounded:
+                    raise copy.copy(err) from err
+            except Exception as err:
+                raise copy.copy(err) from err
+            return func()
+
+        try:
+            result = func()
+        except BaseException as err:
+            call.set_exception(err)
+            raise
+        else:
+            call.set_result(result)
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+        return result
+
+
+def _cached_response(url, content):
+    """
+    Return a successful response to a GET of ``url`` with a cached body.
+    """
+    resp = requests.Response()
+    resp.status_code = HTTP_OK
+    resp.url = url
+    resp._content = content # pylint: disable=protected-access
+    return resp
+
+
+class TFCSession(requests.Session):
+    """
+    Connection pooled HTTP session shared by every endpoint of a ``TFC`` object.
+
+    Every request is scheduled through the rate limiter, if one is set, and
+    requests rejected with HTTP 429 are queued again until they go through or
+    run out of retries. Transient failures are retried per the retry policy,
+    if one is set. Requests which don't set a ``timeout`` themselves are sent
+    with the connect and read timeouts of the session, bounded by the
+    ``deadline`` of the current context. GETs are served from the resource
+    cache or revalidated against the response cache, if either is set, see
+    ``TFCResourceCache`` and ``TFCResponseCache``. If ``coalesce_gets`` is
+    turned on, a GET sent while an identical one is in flight, e.g. by another
+    thread, waits for it and gets a copy of its response, unless the session
+    sent a write since the one in flight started. Given a ``token_pool``, requests
+    which aren't sent with a token of their own are sent with one of its tokens,
+    and with another one if it's refused, see ``TFCTokenPool``.
+    """
+
+    def __init__(self, rate_limiter=None, max_rate_limit_retries=RATE_LIMIT_MAX_RETRIES, \
+        retry_policy=None, connect_timeout=HTTP_CONNECT_TIMEOUT, read_timeout=HTTP_READ_TIMEOUT, \
+            response_cache=None, resource_cache=None, coalesce_gets=HTTP_COALESCE_GETS, \
+                token_pool=None):
+        super().__init__()
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self.rate_limiter = rate_limiter
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.retry_policy = retry_policy
+        self.timeout = (connect_timeout, read_timeout)
+        self.response_cache = response_cache
+        self.resource_cache = resource_cache
+        self._single_flight = _SingleFlight(_copy_response) if coalesce_gets else None
+        self._writes = itertools.count(1)
+        self._write_generation = 0
+        self.token_pool = token_pool
+
+    # pylint: disable=arguments-differ
+    def request(self, method, url, *args, **kwargs):
+        if method.upper() != "GET":
+            try:
+                return self._read_through(method, url, *args, **kwargs)
+            finally:
+                # Later GETs don't share the response of one which may have been read before it.
+                self._write_generation = next(self._writes)
+
+        if self._single_flight is None or kwargs.get("stream"):
+            return self._read_through(method, url, *args, **kwargs)
+
+        key = _coalesce_key(\
+            method, url, kwargs.get("headers"), kwargs.get("allow_redirects", True), \
+                self._write_generation)
+        return self._single_flight.do(\
+            key, lambda: self._read_through(method, url, *args, **kwargs))
+
+    def _read_through(self, method, url, *args, **kwargs):
+        if self.resource_cache is None or kwargs.get("stream") \
+            or _is_conditional(kwargs.get("headers")):
+            return self._revalidate(method, url, *args, **kwargs)
+
+        if method.upper() != "GET":
+            resp = self._revalidate(method, url, *args, **kwargs)
+            self.resource_cache.invalidate(url, resp.content)
+            return resp
+
+        key = self.resource_cache.key(url, kwargs.get("headers"))
+        generation = self.resource_cache.generation
+        content = self.resource_cache.get(key)
+        if content is not None:
+            return _cached_response(url, content)
+
+        resp = self._revalidate(method, url, *args, **kwargs)
+        if resp.status_code == HTTP_OK:
+            self.resource_cache.set(key, url, resp.content, generation)
+        return resp
+
+    def _revalidate(self, method, url, *args, **kwargs):
+        if self.response_cache is None or method.upper() != "GET" or kwargs.get("stream") \
+            or _is_conditional(kwargs.get("headers")):
+            return self._send(method, url, *args, **kwargs)
+
+        key = self.response_cache.key(url, kwargs.get("headers"))
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            kwargs["headers"] = dict(\
+                kwargs.get("headers") or {}, **self.response_cache.conditional_headers(cached))
+
+        resp = self._send(method, url, *args, **kwargs)
+        self.response_cache.record(cached is not None and resp.status_code == HTTP_NOT_MODIFIED)
+        if cached is not None and resp.status_code == HTTP_NOT_MODIFIED:
+            # A 304 has no body, so answer with the cached one as if it was sent again.
+            resp.status_code = HTTP_OK
+            resp._content = cached.content # pylint: disable=protected-access
+        elif resp.status_code == HTTP_OK:
+            self.response_cache.set(key, resp.headers, resp.content)
+        elif resp.status_code == HTTP_NOT_FOUND:
+            self.response_cache.discard(key)
+
+        return resp
+
+    def _send(self, method, url, *args, **kwargs):
+        rate_limit_retries = 0
+        retries = 0
+        started_at = time.monotonic()
+        explicit_timeout = kwargs.pop("timeout", None)
+        body = kwargs.get("data")
+        body_position = _body_position(body)
+        headers = kwargs.get("headers")
+        pooled = _is_pooled(self.token_pool, headers)
+
+        while True:
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve()
+                _check_wait(wait)
+                time.sleep(wait)
+
+            if pooled:
+                token, wait = self.token_pool.acquire()
+                _check_wait(wait)
+                time.sleep(wait)
+                kwargs["headers"] = dict(headers, Authorization=f"Bearer {token}")
+
+            request_timeout = explicit_timeout \
+                if explicit_timeout is not None else _request_timeout(*self.timeout)
+
+            try:
+                resp = super().request(method, url, *args, timeout=request_timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as err:
+                if isinstance(err, requests.Timeout) and _deadline_expired():
+                    raise TFCDeadlineExceeded(\
+                        "The deadline ran out while waiting for the response.") from err
+                delay = self._retry_delay(method, retries, started_at)
+                if delay is None or not _rewind_body(body, body_position):
+                    raise
+                retries += 1
+                self._record_retry(method, url, type(err).__name__, retries, delay)
+                time.sleep(delay)
+                continue
+
+            if pooled:
+                self.token_pool.update(token, resp.status_code, resp.headers)
+                if _retry_with_another_token(self.token_pool, resp.status_code, \
+                    rate_limit_retries, self.max_rate_limit_retries) and \
+                        _rewind_body(body, body_position):
+                    rate_limit_retries += resp.status_code == HTTP_TOO_MANY_REQUESTS
+                    self._logger.debug(\
+                        f"HTTP {method} to {url} was refused with HTTP {resp.status_code}, "
+                        "retrying with another token...")
+                    resp.close()
+                    continue
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(resp.status_code, resp.headers)
+                if resp.status_code == HTTP_TOO_MANY_REQUESTS and \
+                    rate_limit_retries < self.max_rate_limit_retries and \
+                        _rewind_body(body, body_position):
+                    rate_limit_retries += 1
+                    self._logger.debug(\
+                        f"HTTP {method} to {url} was rate limited, retrying "
+                        f"({rate_limit_retries})...")
+                    # Release the connection of a streamed response before retrying.
+                    resp.close()
+                    continue
+
+            if self.retry_policy is not None and \
+                resp.status_code in self.retry_policy.status_codes:
+                delay = self._retry_delay(\
+                    method, retries, started_at, _retry_after_seconds(resp.headers))
+                if delay is not None and _rewind_body(body, body_position):
+                    resp.close()
+                    retries += 1
+                    self._record_retry(method, url, f"HTTP {resp.status_code}", retries, delay)
+                    time.sleep(delay)
+                    continue
+
+            return resp
+
+    def _retry_delay(self, method, retries, started_at, retry_after=None):
+        return _retry_delay(self.retry_policy, method, retries, started_at, retry_after)
+
+    def _record_retry(self, method, url, reason, retries, delay):
+        self.retry_policy.record_retry(reason)
+        self._logger.debug(\
+            f"HTTP {method} to {url} failed ({reason}), retry {retries} in {delay:.2f}s...")
+
+
+def _retry_delay(retry_policy, method, retries, started_at, retry_after=None):
+    """
+    Return how many seconds to wait before retrying a request per the retry
+    policy, or ``None`` to give up on it, including when the wait would outlast
+    the deadline of the current context.
+    """
+    if retry_policy is None:
+        return None
+
+    delay = retry_policy.retry_delay(method, retries, started_at, retry_after)
+    remaining = _remaining_time()
+    if delay is not None and remaining is not None and delay >= remaining:
+        return None
+
+    return delay
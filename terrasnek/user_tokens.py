@@ -10,8 +10,12 @@ class TFCUserTokens(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/user-tokens.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._users_api_v2_base_url = f"{self._api_v2_base_url}/users"
         self._tokens_api_v2_base_url = f"{self._api_v2_base_url}/authentication-tokens"
 
@@ -57,7 +61,7 @@ class TFCUserTokens(TFCEndpoint):
         url = f"{self._tokens_api_v2_base_url}/{token_id}"
         self._destroy(url)
 
-    def list(self, user_id):
+    def list(self, user_id, fields=None):
         """
         ``GET /users/:user_id/authentication-tokens``
 
@@ -70,7 +74,7 @@ class TFCUserTokens(TFCEndpoint):
         ``GET /api/v2/users/:user_id/authentication-tokens``
         """
         url = f"{self._users_api_v2_base_url}/{user_id}/authentication-tokens"
-        return self._list(url)
+        return self._list(url, fields=fields)
 
     def show(self, token_id):
         """
@@ -10,8 +10,12 @@ class TFCVars(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/variables.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/vars"
 
     def required_entitlements(self):
@@ -35,7 +39,7 @@ class TFCVars(TFCEndpoint):
         """
         return self._create(self._endpoint_base_url, payload)
 
-    def list(self, workspace_name=None):
+    def list(self, workspace_name=None, fields=None):
         """
         ``GET /vars``
 
@@ -51,7 +55,7 @@ class TFCVars(TFCEndpoint):
         if workspace_name is not None:
             url += f"&filter[workspace][name]={workspace_name}"
 
-        return self._list(url)
+        return self._list(url, fields=fields)
 
     def update(self, variable_id, payload):
         """
@@ -10,8 +10,12 @@ class TFCWorkspaceVars(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/workspace-variables.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._endpoint_base_url = f"{self._api_v2_base_url}/workspaces"
 
     def required_entitlements(self):
@@ -36,7 +40,7 @@ class TFCWorkspaceVars(TFCEndpoint):
         url = f"{self._endpoint_base_url}/{workspace_id}/vars/"
         return self._create(url, payload)
 
-    def list(self, workspace_id):
+    def list(self, workspace_id, fields=None):
         """
         ``GET /workspaces/:workspace_id/vars``
 
@@ -44,7 +48,7 @@ class TFCWorkspaceVars(TFCEndpoint):
             <https://www.terraform.io/docs/cloud/api/workspace-variables.html#list-variables>`_
         """
         url = f"{self._endpoint_base_url}/{workspace_id}/vars/"
-        return self._list(url)
+        return self._list(url, fields=fields)
 
     def update(self, workspace_id, variable_id, payload):
         """
@@ -3,7 +3,8 @@ Module for Terraform Cloud API Endpoint: Workspaces.
 """
 
 from .endpoint import TFCEndpoint
-from ._constants import MAX_PAGE_SIZE
+from .models import TFCWorkspace
+from ._constants import MAX_PAGE_FETCH_WORKERS
 
 class TFCWorkspaces(TFCEndpoint):
     """
@@ -11,8 +12,12 @@ class TFCWorkspaces(TFCEndpoint):
         <https://www.terraform.io/docs/cloud/api/workspaces.html>`_
     """
 
-    def __init__(self, instance_url, org_name, headers, well_known_paths, verify, log_level):
-        super().__init__(instance_url, org_name, headers, well_known_paths, verify, log_level)
+    def __init__(\
+        self, instance_url, org_name, headers, well_known_paths, verify, log_level, session=None, \
+            serializer=None, artifact_cache=None):
+        super().__init__(\
+            instance_url, org_name, headers, well_known_paths, verify, log_level, session=session, \
+                serializer=serializer, artifact_cache=artifact_cache)
         self._ws_api_v2_base_url = f"{self._api_v2_base_url}/workspaces"
         self._org_api_v2_base_url = f"{self._api_v2_base_url}/organizations/{org_name}/workspaces"
 
@@ -77,7 +82,7 @@ class TFCWorkspaces(TFCEndpoint):
         url = f"{self._ws_api_v2_base_url}/{workspace_id}/actions/lock"
         return self._post(url, data=payload)
 
-    def list(self, page=None, page_size=None):
+    def list(self, page=None, page_size=None, include=None, fields=None):
         """
         ``GET /organizations/:organization_name/workspaces``
 
@@ -88,33 +93,55 @@ class TFCWorkspaces(TFCEndpoint):
             <https://www.terraform.io/docs/cloud/api/workspaces.html#query-parameters>`_):
             - ``page`` (Optional)
             - ``page_size`` (Optional)
+            - ``include`` (Optional)
         """
-        return self._list(self._org_api_v2_base_url, page=page, page_size=page_size)
+        return self._list(\
+            self._org_api_v2_base_url, page=page, page_size=page_size, include=include, \
+                fields=fields)
 
-    def list_all(self):
+    def list_all(self, include=None, as_models=False, fields=None):
         """
         This function does not correlate to an endpoint in the TFC API Docs specifically,
         but rather is a helper function to wrap the `list` endpoint, which enumerates out
         every page so users do not have to implement the paging logic every time they just
         want to list every workspace in an organization.
 
+        With ``include``, the related resources are side-loaded, and the
+        workspaces are returned as ``TFCResources``, which resolves their
+        relationships, see ``terrasnek.documents``.
+
+        With ``as_models``, each workspace is returned as a compact ``TFCWorkspace``
+        object instead, see ``terrasnek.models``.
+
         Returns an array of objects.
         """
-        current_page_number = 1
-        # TODO: this shouldn't require a URL?
-        workspaces_resp = \
-            self.list(page=current_page_number, page_size=MAX_PAGE_SIZE)
-        total_pages = workspaces_resp["meta"]["pagination"]["total-pages"]
-
-        workspaces = []
-        while current_page_number <= total_pages:
-            workspaces_resp = \
-                self._list(self._org_api_v2_base_url, \
-                    page=current_page_number, page_size=MAX_PAGE_SIZE)
-            workspaces += workspaces_resp["data"]
-            current_page_number += 1
-
-        return workspaces
+        return self._list_all(\
+            self._org_api_v2_base_url, include=include, \
+                model=TFCWorkspace if as_models else None, fields=fields)
+
+    def iter_all(\
+        self, read_ahead=MAX_PAGE_FETCH_WORKERS, as_models=False, fields=None, include=None, \
+            resources=None):
+        """
+        This function does not correlate to an endpoint in the TFC API Docs specifically,
+        but rather is a helper function to wrap the `list` endpoint, which lazily
+        enumerates every page so users can stream every workspace in an organization
+        without holding every page in memory. Up to ``read_ahead`` pages are fetched
+        ahead of the caller, and breaking out of the loop stops fetching the rest.
+
+        With ``include``, the related resources are side-loaded, and added to
+        ``resources``, a ``TFCResources``, if one is given, as their pages
+        arrive, so it resolves the relationships of the workspaces yielded so far,
+        see ``terrasnek.documents``.
+
+        With ``as_models``, each workspace is returned as a compact ``TFCWorkspace``
+        object instead, see ``terrasnek.models``.
+
+        Returns a generator of objects.
+        """
+        return self._iter_all(\
+            self._org_api_v2_base_url, read_ahead=read_ahead, include=include, \
+                resources=resources, model=TFCWorkspace if as_models else None, fields=fields)
 
     def show(self, workspace_name=None, workspace_id=None):
         """
@@ -0,0 +1,61 @@
+"""
+Module for testing the asyncio counterpart of the Terraform Cloud API class.
+"""
+
+import asyncio
+import unittest
+
+from terrasnek.async_api import AsyncTFC, aiohttp
+
+from .base import TestTFCBaseTestCase
+
+
+@unittest.skipIf(aiohttp is None, "The aiohttp package is required to test AsyncTFC.")
+class TestTFCAsyncAPI(TestTFCBaseTestCase):
+    """
+    Class for testing the asyncio counterpart of the Terraform Cloud API class.
+    """
+
+    _unittest_name = "async"
+    _endpoint_being_tested = "workspaces"
+
+    def test_async_api(self):
+        """
+        Test the AsyncTFC class against the Workspaces API endpoints.
+        """
+        workspace = self._api.workspaces.create(\
+            self._get_ws_without_vcs_create_payload())["data"]
+        ws_id = workspace["id"]
+        ws_name = workspace["attributes"]["name"]
+
+        async def run_async_api():
+            async with AsyncTFC(\
+                self._test_api_token, url=self._tfc_url, \
+                    verify=self._ssl_verify, log_level=self._api_log_level) as async_api:
+                async_api.set_org(self._test_org_name)
+
+                # Show the same workspace concurrently, by name and by ID
+                shown_by_name, shown_by_id = await asyncio.gather(\
+                    async_api.workspaces.show(workspace_name=ws_name), \
+                    async_api.workspaces.show(workspace_id=ws_id))
+                self.assertEqual(shown_by_name["data"]["id"], ws_id)
+                self.assertEqual(shown_by_id["data"]["attributes"]["name"], ws_name)
+
+                # Show it from many tasks at once, which share one request
+                shown_ws = await asyncio.gather(\
+                    *[async_api.workspaces.show(workspace_id=ws_id) for _ in range(10)])
+                self.assertTrue(all(shown == shown_ws[0] for shown in shown_ws))
+
+                all_ws = await async_api.workspaces.list_all()
+                self.assertIn(ws_id, [listed_ws["id"] for listed_ws in all_ws])
+
+                found_ws = False
+                async for listed_ws in async_api.workspaces.iter_all():
+                    if listed_ws["id"] == ws_id:
+                        found_ws = True
+                        break
+                self.assertTrue(found_ws)
+
+                await async_api.workspaces.destroy(workspace_id=ws_id)
+
+        asyncio.run(run_async_api())
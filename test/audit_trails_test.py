@@ -27,3 +27,6 @@ class TestTFCAuditTrails(TestTFCBaseTestCase):
 
         all_audit_trails = self._api.audit_trails.list_all()
         self.assertEqual(len(all_audit_trails), 0)
+
+        streamed_audit_trails = list(self._api.audit_trails.iter_all())
+        self.assertEqual(len(streamed_audit_trails), 0)
@@ -61,6 +61,7 @@ class TestTFCBaseTestCase(unittest.TestCase):
             './test/testdata/terraform/terrasnek_unittest_config_version_from_string.tf', 'r') \
                 as tf_file:
             cls._config_version_upload_string = tf_file.read()
+        cls._config_version_upload_dir_path = "./test/testdata/terraform/src/tfe"
         cls._module_upload_tarball_path = \
             "./test/testdata/terraform/terrasnek_unittest_module.tar.gz"
         cls._policy_set_upload_tarball_path = \
@@ -0,0 +1,60 @@
+"""
+Module for testing the on-disk artifact cache, which needs neither a token nor network.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from terrasnek.caches import TFCArtifactCache
+
+
+class TestTFCArtifactCache(unittest.TestCase):
+    """
+    Class for testing the on-disk artifact cache.
+    """
+
+    def setUp(self):
+        self._path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._path)
+
+    def test_artifact_cache_evicts_least_recently_used(self):
+        """
+        Test that the least recently used artifacts are evicted once the cache
+        passes its size, and that writes below it don't scan the cache.
+        """
+        cache = TFCArtifactCache(path=self._path, max_bytes=300)
+        with mock.patch("terrasnek.caches.os.walk", side_effect=os.walk) as walk:
+            for i in range(3):
+                cache.put_bytes(f"key-{i}", bytes([i]) * 100)
+                # pylint: disable=protected-access
+                os.utime(cache._lookup(f"key-{i}"), (i, i))
+            # Only the first write scans the cache, to learn its size.
+            self.assertEqual(walk.call_count, 1)
+
+            self.assertEqual(cache.get_bytes("key-0"), bytes([0]) * 100)
+            cache.put_bytes("key-3", bytes([3]) * 100)
+            self.assertEqual(walk.call_count, 2)
+
+        self.assertIsNone(cache.get_bytes("key-1"))
+        for i in (0, 2, 3):
+            self.assertEqual(cache.get_bytes(f"key-{i}"), bytes([i]) * 100)
+
+    def test_artifact_cache_rewrite_adds_no_size(self):
+        """
+        Test that caching an artifact already cached under another key doesn't
+        count its size twice.
+        """
+        cache = TFCArtifactCache(path=self._path, max_bytes=150)
+        cache.put_bytes("key-0", b"x" * 100)
+        with mock.patch("terrasnek.caches.os.walk", side_effect=os.walk) as walk:
+            cache.put_bytes("key-1", b"x" * 100)
+            self.assertEqual(walk.call_count, 0)
+        self.assertEqual(cache.get_bytes("key-0"), b"x" * 100)
+        self.assertEqual(cache.get_bytes("key-1"), b"x" * 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Module for testing the coalescing of identical concurrent GETs, against a local API.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from terrasnek.async_api import AsyncTFC, aiohttp
+from terrasnek.exceptions import TFCDeadlineExceeded, TFCHTTPNotFound
+from terrasnek.transport import TFCSession
+
+from .local_base import TestTFCLocalTestCase
+
+
+class TestTFCCoalescing(TestTFCLocalTestCase):
+    """
+    Class for testing the coalescing of identical concurrent GETs.
+    """
+
+    _delay = 0.3
+
+    def handle(self, request):
+        if request.method != "GET":
+            return 200, {"data": {"id": request.path.rsplit("/", 1)[1], "type": "workspaces"}}, {}
+        time.sleep(self._delay)
+        if request.path == "/api/v2/workspaces/ws-missing":
+            return 404, {"errors": [{"status": "404"}]}, {}
+        return 200, {"data": {"id": request.path.rsplit("/", 1)[1], "type": "workspaces"}}, {}
+
+    def _show_concurrently(self, api, workspace_id, count):
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [executor.submit(api.workspaces.show, workspace_id=workspace_id) \
+                for _ in range(count)]
+        return [future.exception() or future.result() for future in futures]
+
+    def test_coalesce_identical_gets(self):
+        """
+        Test that identical concurrent GETs share one request and its response.
+        """
+        api = self._local_api(coalesce_gets=True)
+        shown = self._show_concurrently(api, "ws-1", 10)
+        self.assertEqual(len(self._received()), 1)
+        self.assertTrue(all(shown_ws == shown[0] for shown_ws in shown))
+        self.assertEqual(shown[0]["data"]["id"], "ws-1")
+
+    def test_coalesce_shares_errors(self):
+        """
+        Test that the callers of a coalesced GET which failed all get its error.
+        """
+        api = self._local_api(coalesce_gets=True)
+        shown = self._show_concurrently(api, "ws-missing", 5)
+        self.assertEqual(len(self._received()), 1)
+        self.assertTrue(all(isinstance(error, TFCHTTPNotFound) for error in shown))
+        self.assertEqual(len(set(map(id, shown))), 5)
+
+    def test_coalesce_copies_responses(self):
+        """
+        Test that the callers of a coalesced GET each get their own copy of its response.
+        """
+        session = TFCSession(coalesce_gets=True)
+        self.addCleanup(session.close)
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(session.get, f"{self._url}/api/v2/workspaces/ws-1") \
+                for _ in range(5)]
+        responses = [future.result() for future in futures]
+
+        self.assertEqual(len(self._received()), 1)
+        self.assertEqual(len(set(map(id, responses))), 5)
+        self.assertEqual(len(set(id(resp.headers) for resp in responses)), 5)
+        self.assertTrue(all(resp.content == responses[0].content for resp in responses))
+
+    def test_coalesce_after_write(self):
+        """
+        Test that a GET sent after a write isn't coalesced with one sent before it.
+        """
+        api = self._local_api(coalesce_gets=True)
+        before_write = threading.Thread(\
+            target=api.workspaces.show, kwargs={"workspace_id": "ws-1"})
+        before_write.start()
+        time.sleep(self._delay / 10)
+        api.workspaces.update({"data": {"type": "workspaces"}}, workspace_id="ws-1")
+        api.workspaces.show(workspace_id="ws-1")
+        before_write.join()
+        self.assertEqual(len(self._received("/api/v2/workspaces/ws-1")), 3)
+
+    def test_coalesce_disabled(self):
+        """
+        Test that identical concurrent GETs are each sent when coalescing is off,
+        as it is by default.
+        """
+        api = self._local_api()
+        self._show_concurrently(api, "ws-1", 4)
+        self.assertEqual(len(self._received()), 4)
+
+    def test_coalesce_deadline_bound_leader(self):
+        """
+        Test that a caller without a deadline, waiting on a GET made by a caller
+        whose deadline ran out, makes the GET again instead of failing too.
+        """
+        api = self._local_api(coalesce_gets=True)
+        errors = []
+
+        def show_with_deadline():
+            try:
+                with api.deadline(self._delay / 3):
+                    api.workspaces.show(workspace_id="ws-1")
+            except TFCDeadlineExceeded as err:
+                errors.append(err)
+
+        leader = threading.Thread(target=show_with_deadline)
+        leader.start()
+        time.sleep(self._delay / 10)
+        shown_ws = api.workspaces.show(workspace_id="ws-1")
+        leader.join()
+
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(shown_ws["data"]["id"], "ws-1")
+        self.assertEqual(len(self._received()), 2)
+
+    def test_coalesce_deadline_bound_follower(self):
+        """
+        Test that a caller waiting on a GET made by another one gives up at its deadline.
+        """
+        api = self._local_api(coalesce_gets=True)
+        leader = threading.Thread(target=api.workspaces.show, kwargs={"workspace_id": "ws-1"})
+        leader.start()
+        time.sleep(self._delay / 10)
+        with self.assertRaises(TFCDeadlineExceeded):
+            with api.deadline(self._delay / 3):
+                api.workspaces.show(workspace_id="ws-1")
+        leader.join()
+        self.assertEqual(len(self._received()), 1)
+
+    @unittest.skipIf(aiohttp is None, "The aiohttp package is required to test AsyncTFC.")
+    def test_async_coalesce(self):
+        """
+        Test that identical concurrent GETs of tasks share one request, unless
+        a write was sent in between, and that a task without a deadline makes
+        the GET again if the one it waited on ran out of the deadline of the
+        task which made it.
+        """
+        async def run_async_api():
+            async with self._local_api(AsyncTFC, coalesce_gets=True) as async_api:
+                shown = await asyncio.gather(\
+                    *[async_api.workspaces.show(workspace_id="ws-1") for _ in range(10)])
+                self.assertEqual(len(self._received()), 1)
+                self.assertTrue(all(shown_ws == shown[0] for shown_ws in shown))
+
+                async def show_with_deadline():
+                    with async_api.deadline(self._delay / 3):
+                        return await async_api.workspaces.show(workspace_id="ws-2")
+
+                leader = asyncio.ensure_future(show_with_deadline())
+                await asyncio.sleep(self._delay / 10)
+                shown_ws = await async_api.workspaces.show(workspace_id="ws-2")
+                with self.assertRaises(TFCDeadlineExceeded):
+                    await leader
+                self.assertEqual(shown_ws["data"]["id"], "ws-2")
+                self.assertEqual(len(self._received("/api/v2/workspaces/ws-2")), 2)
+
+                async def show_after_write():
+                    await async_api.workspaces.update(\
+                        {"data": {"type": "workspaces"}}, workspace_id="ws-3")
+                    return await async_api.workspaces.show(workspace_id="ws-3")
+
+                before_write = asyncio.ensure_future(\
+                    async_api.workspaces.show(workspace_id="ws-3"))
+                await asyncio.sleep(self._delay / 10)
+                await asyncio.gather(before_write, show_after_write())
+                self.assertEqual(len(self._received("/api/v2/workspaces/ws-3")), 3)
+
+        asyncio.run(run_async_api())
@@ -0,0 +1,74 @@
+"""
+Module for testing conditional GETs sent by the caller, against a local API.
+"""
+
+import asyncio
+import unittest
+from datetime import datetime, timezone
+
+from terrasnek.async_api import AsyncTFC, aiohttp
+from terrasnek.caches import TFCResourceCache, TFCResponseCache
+
+from .local_base import TestTFCLocalTestCase
+
+_LAST_MODIFIED = "Tue, 26 May 2020 15:10:05 GMT"
+_IP_RANGES = {"api": ["75.2.98.97/32"], "notifications": [], "sentinel": [], "vcs": []}
+
+
+class TestTFCConditional(TestTFCLocalTestCase):
+    """
+    Class for testing conditional GETs sent by the caller.
+    """
+
+    _path = "/api/meta/ip-ranges"
+
+    def handle(self, request):
+        if request.headers.get("If-Modified-Since") == _LAST_MODIFIED:
+            return 304, b"", {"Last-Modified": _LAST_MODIFIED}
+        return 200, _IP_RANGES, {"Last-Modified": _LAST_MODIFIED, "ETag": '"local-etag"'}
+
+    def test_ip_ranges_modified_since(self):
+        """
+        Test that the IP ranges are only returned if they changed since ``modified_since``.
+        """
+        api = self._local_api()
+        self.assertEqual(api.ip_ranges.list(modified_since="Mon, 25 May 2020 00:00:00 GMT"), \
+            _IP_RANGES)
+        self.assertIsNone(api.ip_ranges.list(modified_since=_LAST_MODIFIED))
+        self.assertIsNone(api.ip_ranges.list(\
+            modified_since=datetime(2020, 5, 26, 15, 10, 5, tzinfo=timezone.utc)))
+        self.assertEqual(\
+            [request.headers.get("If-Modified-Since") for request in self._received(self._path)], \
+                ["Mon, 25 May 2020 00:00:00 GMT", _LAST_MODIFIED, _LAST_MODIFIED])
+
+    def test_caller_validators_bypass_caches(self):
+        """
+        Test that the caches neither replace the caller's validators with their
+        own nor turn the ``304 Not Modified`` answer into a ``200``.
+        """
+        response_cache = TFCResponseCache()
+        api = self._local_api(response_cache=response_cache, resource_cache=TFCResourceCache())
+        api.ip_ranges.list()
+
+        self.assertIsNone(api.ip_ranges.list(modified_since=_LAST_MODIFIED))
+        self.assertIsNone(api.ip_ranges.list(modified_since=_LAST_MODIFIED))
+        received = self._received(self._path)
+        self.assertEqual(len(received), 3)
+        self.assertNotIn("If-None-Match", received[-1].headers)
+        self.assertEqual(response_cache.counts["hits"], 0)
+
+    @unittest.skipIf(aiohttp is None, "The aiohttp package is required to test AsyncTFC.")
+    def test_async_caller_validators_bypass_caches(self):
+        """
+        Test that AsyncTFC passes the caller's ``304 Not Modified`` answer on as is.
+        """
+        response_cache = TFCResponseCache()
+
+        async def run_async_api():
+            async with self._local_api(AsyncTFC, response_cache=response_cache) as async_api:
+                self.assertEqual(await async_api.ip_ranges.list(), _IP_RANGES)
+                return await async_api.ip_ranges.list(modified_since=_LAST_MODIFIED)
+
+        self.assertIsNone(asyncio.run(run_async_api()))
+        self.assertNotIn("If-None-Match", self._received(self._path)[-1].headers)
+        self.assertEqual(response_cache.counts["hits"], 0)
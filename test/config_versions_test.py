@@ -2,6 +2,10 @@
 Module for testing the Terraform Cloud API Endpoint: Config Versions.
 """
 
+import os
+import tempfile
+import time
+
 from .base import TestTFCBaseTestCase
 
 
@@ -25,10 +29,11 @@ class TestTFCConfigVersions(TestTFCBaseTestCase):
         Test the Config Versions API endpoints.
         """
 
-        # two upload methods to test; use a different 1st positional argument for each test
+        # three upload methods to test; use a different 1st positional argument for each test
         upload_tests = (
             (self._api.config_versions.upload, self._config_version_upload_tarball_path),
             (self._api.config_versions.upload_from_string, self._config_version_upload_string),
+            (self._api.config_versions.upload_from_directory, self._config_version_upload_dir_path),
         )
         for upload_handle, source in upload_tests:
 
@@ -77,3 +82,38 @@ class TestTFCConfigVersions(TestTFCBaseTestCase):
                         found_conf_ver = True
                         break
                 self.assertTrue(found_conf_ver)
+
+    def test_config_versions_create_from_directory(self):
+        """
+        Test creating a config version from a directory, and that the same
+        directory isn't uploaded twice to the same workspace.
+        """
+        with tempfile.TemporaryDirectory() as manifest_dir:
+            manifest_path = os.path.join(manifest_dir, "slug-manifest.json")
+
+            created = self._api.config_versions.create_from_directory(\
+                self._ws_id, self._config_version_upload_dir_path, \
+                    payload=self._get_config_version_create_payload(), \
+                        manifest_path=manifest_path)["data"]
+            cv_id = created["id"]
+
+            shown_config_version = self._api.config_versions.show(cv_id)["data"]
+            while shown_config_version["attributes"]["status"] == "pending":
+                self._logger.debug("Waiting for config version to be uploaded...")
+                time.sleep(1)
+                shown_config_version = self._api.config_versions.show(cv_id)["data"]
+            self.assertEqual(shown_config_version["attributes"]["status"], "uploaded")
+
+            # Creating it again from the same directory reuses the config version
+            reused = self._api.config_versions.create_from_directory(\
+                self._ws_id, self._config_version_upload_dir_path, \
+                    payload=self._get_config_version_create_payload(), \
+                        manifest_path=manifest_path)["data"]
+            self.assertEqual(reused["id"], cv_id)
+
+            # Unless dedupe is turned off
+            not_reused = self._api.config_versions.create_from_directory(\
+                self._ws_id, self._config_version_upload_dir_path, \
+                    payload=self._get_config_version_create_payload(), \
+                        manifest_path=manifest_path, dedupe=False)["data"]
+            self.assertNotEqual(not_reused["id"], cv_id)
@@ -0,0 +1,94 @@
+"""
+Module for testing the deadlines and timeouts of requests, against a local API.
+"""
+
+import asyncio
+import time
+import unittest
+
+import requests
+
+from terrasnek.async_api import AsyncTFC, aiohttp
+from terrasnek.exceptions import TFCDeadlineExceeded
+from terrasnek.transport import TFCRetryPolicy
+
+from .local_base import TestTFCLocalTestCase
+
+
+class TestTFCDeadline(TestTFCLocalTestCase):
+    """
+    Class for testing the deadlines and timeouts of requests.
+    """
+
+    _delay = 0.3
+
+    def handle(self, request):
+        time.sleep(self._delay)
+        return 200, {"data": {"id": request.path.rsplit("/", 1)[1], "type": "workspaces"}}, {}
+
+    def test_deadline_expires_during_request(self):
+        """
+        Test that a deadline running out while waiting for a response raises
+        ``TFCDeadlineExceeded``, without retrying the request.
+        """
+        api = self._local_api()
+        started_at = time.monotonic()
+        with self.assertRaises(TFCDeadlineExceeded):
+            with api.deadline(self._delay / 3):
+                api.workspaces.show(workspace_id="ws-1")
+        self.assertLess(time.monotonic() - started_at, self._delay)
+        self.assertEqual(len(self._received()), 1)
+        self.assertEqual(api.get_retry_policy().retry_counts["total"], 0)
+
+    def test_deadline_expired_before_request(self):
+        """
+        Test that a request isn't sent once the deadline has run out.
+        """
+        api = self._local_api()
+        with self.assertRaises(TFCDeadlineExceeded):
+            with api.deadline(0):
+                api.workspaces.show(workspace_id="ws-1")
+        self.assertEqual(len(self._received()), 0)
+
+    def test_deadline_spans_calls(self):
+        """
+        Test that a deadline bounds all the calls made within it, not each one.
+        """
+        api = self._local_api()
+        shown = []
+        with self.assertRaises(TFCDeadlineExceeded):
+            with api.deadline(self._delay * 2.5):
+                for i in range(5):
+                    shown.append(api.workspaces.show(workspace_id=f"ws-{i}"))
+        self.assertEqual(len(shown), 2)
+        self.assertEqual(len(self._received()), 3)
+
+    def test_timeout_without_deadline(self):
+        """
+        Test that a request running past a timeout without a deadline still
+        raises the timeout of ``requests``.
+        """
+        api = self._local_api(retry_policy=TFCRetryPolicy(max_retries=0))
+        with self.assertRaises(requests.Timeout):
+            with api.timeout(read=self._delay / 3):
+                api.workspaces.show(workspace_id="ws-1")
+        self.assertEqual(len(self._received()), 1)
+
+    @unittest.skipIf(aiohttp is None, "The aiohttp package is required to test AsyncTFC.")
+    def test_async_deadline_expires_during_request(self):
+        """
+        Test that a deadline running out while a task waits for a response
+        raises ``TFCDeadlineExceeded``.
+        """
+        async def run_async_api():
+            async with self._local_api(AsyncTFC, coalesce_gets=False) as async_api:
+                with self.assertRaises(TFCDeadlineExceeded):
+                    with async_api.deadline(self._delay / 3):
+                        await async_api.workspaces.show(workspace_id="ws-1")
+                self.assertEqual(len(self._received()), 1)
+
+        asyncio.run(run_async_api())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Module for testing the resolution of side-loaded related resources, against a local API.
+"""
+
+import asyncio
+import unittest
+
+from terrasnek.async_api import AsyncTFC, aiohttp
+from terrasnek.documents import TFCResources
+
+from .local_base import TestTFCLocalTestCase, LOCAL_ORG_NAME
+
+_TOTAL_PAGES = 3
+
+
+def _workspace(page_number):
+    return {
+        "id": f"ws-{page_number}",
+        "type": "workspaces",
+        "relationships": {
+            "current-run": {"data": {"id": f"run-{page_number}", "type": "runs"}}
+        }
+    }
+
+
+class TestTFCDocuments(TestTFCLocalTestCase):
+    """
+    Class for testing the resolution of side-loaded related resources.
+    """
+
+    def handle(self, request):
+        page_number = int(request.query["page[number]"][0])
+        page = {
+            "data": [_workspace(page_number)],
+            "meta": {"pagination": {"current-page": page_number, "total-pages": _TOTAL_PAGES}}
+        }
+        if "include" in request.query:
+            page["included"] = [{"id": f"run-{page_number}", "type": "runs"}]
+        return 200, page, {}
+
+    def _assert_included(self, workspaces, resources):
+        self.assertEqual([workspace["id"] for workspace in workspaces], ["ws-1", "ws-2", "ws-3"])
+        for page_number, workspace in enumerate(workspaces, 1):
+            self.assertEqual(\
+                resources.resolve(workspace, "current-run")["id"], f"run-{page_number}")
+        path = f"/api/v2/organizations/{LOCAL_ORG_NAME}/workspaces"
+        self.assertTrue(all(request.query["include"] == ["current_run"] \
+            for request in self._received(path)))
+
+    def test_list_all_include(self):
+        """
+        Test that ``list_all`` side-loads the related resources of every page.
+        """
+        api = self._local_api()
+        workspaces = api.workspaces.list_all(include="current_run")
+        self.assertIsInstance(workspaces, TFCResources)
+        self._assert_included(workspaces, workspaces)
+
+    def test_iter_all_include(self):
+        """
+        Test that ``iter_all`` side-loads the related resources of every page,
+        and adds them to the given ``TFCResources`` before yielding its records.
+        """
+        api = self._local_api()
+        resources = TFCResources()
+        workspaces = []
+        for workspace in api.workspaces.iter_all(include="current_run", resources=resources):
+            self.assertIsNotNone(resources.resolve(workspace, "current-run"))
+            workspaces.append(workspace)
+        self._assert_included(workspaces, resources)
+
+    @unittest.skipIf(aiohttp is None, "The aiohttp package is required to test AsyncTFC.")
+    def test_async_iter_all_include(self):
+        """
+        Test that the ``iter_all`` and ``list_all`` helpers of ``AsyncTFC``
+        side-load the related resources of every page.
+        """
+        async def run_async_api():
+            async with self._local_api(AsyncTFC) as async_api:
+                resources = TFCResources()
+                workspaces = [workspace async for workspace in \
+                    async_api.workspaces.iter_all(include="current_run", resources=resources)]
+                self._assert_included(workspaces, resources)
+
+                workspaces = await async_api.workspaces.list_all(include="current_run")
+                self._assert_included(workspaces, workspaces)
+
+        asyncio.run(run_async_api())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+"""
+Module for testing downloads in byte range segments, and their resumption,
+against a local API.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from terrasnek.async_api import AsyncTFC, aiohttp
+from terrasnek.caches import TFCArtifactCache
+from terrasnek.exceptions import TFCHTTPUnclassified
+from terrasnek.transport import TFCRetryPolicy
+from terrasnek._segments import SegmentedDownload
+
+from .local_base import TestTFCLocalTestCase
+
+_SEGMENT_SIZE = 64 * 1024
+_CONTENT = os.urandom(5 * _SEGMENT_SIZE + 123)
+_ETAG = '"local-etag"'
+_RANGE_RE = re.compile(r"^bytes=(\d+)-(\d+)$")
+
+
+class TestTFCDownloads(TestTFCLocalTestCase):
+    """
+    Class for testing downloads in byte range segments, and their resumption.
+    """
+
+    _path = "/api/v2/plan-exports/pe-local/download"
+    _state_version_path = "/api/v2/state-versions/sv-local"
+
+    def setUp(self):
+        super().setUp()
+        self._failing_ranges = set()
+        self._other_range_received = threading.Event()
+        self._temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._temp_dir)
+        self._target_path = os.path.join(self._temp_dir, "export.tar.gz")
+        self._checksum = f"sha256:{hashlib.sha256(_CONTENT).hexdigest()}"
+
+    def handle(self, request):
+        if request.path == self._state_version_path:
+            # Serve the content of the plan export as the state of the state version.
+            return 200, {"data": {"id": "sv-local", "type": "state-versions", "attributes": {\
+                "hosted-state-download-url": f"{self._url}{self._path}"}}}, {}
+
+        if request.path != self._path:
+            return super().handle(request)
+
+        match = _RANGE_RE.match(request.headers.get("Range", ""))
+        if match is None or request.headers.get("If-Range", _ETAG) != _ETAG:
+            return 200, _CONTENT, {"ETag": _ETAG}
+
+        start, end = int(match.group(1)), min(int(match.group(2)), len(_CONTENT) - 1)
+        if start > 0:
+            self._other_range_received.set()
+        if start in self._failing_ranges:
+            return 500, {"errors": [{"status": "500"}]}, {}
+        return 206, _CONTENT[start:end + 1], {\
+            "ETag": _ETAG, "Content-Range": f"bytes {start}-{end}/{len(_CONTENT)}"}
+
+    def _download(self, api, **kwargs):
+        # Use the segment size of the tests instead of the one of the public download methods.
+        # pylint: disable=protected-access
+        return api.plan_exports._download(\
+            f"{self._url}{self._path}", self._target_path, segment_size=_SEGMENT_SIZE, **kwargs)
+
+    def _assert_downloaded(self):
+        with open(self._target_path, "rb") as downloaded_file:
+            self.assertEqual(downloaded_file.read(), _CONTENT)
+        self.assertFalse(os.path.exists(f"{self._target_path}.part"))
+        self.assertFalse(os.path.exists(f"{self._target_path}.part.json"))
+
+    def test_segmented_download(self):
+        """
+        Test that a file is downloaded in segments and checked against its checksum.
+        """
+        results = self._download(self._local_api(), checksum=self._checksum)
+        self._assert_downloaded()
+        self.assertEqual(results["bytes"], len(_CONTENT))
+        self.assertEqual(len(self._received(self._path)), 6)
+
+    def test_segmented_download_reads_first_segment_concurrently(self):
+        """
+        Test that the other segments are requested while the first one is still being read.
+        """
+        write = SegmentedDownload.write
+        first_segment_waits = []
+
+        def write_after_other_range(segmented, offset, chunk, end):
+            if offset < _SEGMENT_SIZE and not first_segment_waits:
+                first_segment_waits.append(self._other_range_received.wait(timeout=5))
+            return write(segmented, offset, chunk, end)
+
+        with mock.patch.object(SegmentedDownload, "write", write_after_other_range):
+            self._download(self._local_api(), checksum=self._checksum)
+        self._assert_downloaded()
+        self.assertEqual(first_segment_waits, [True])
+
+    def test_segmented_download_resume(self):
+        """
+        Test that an interrupted download only fetches its missing segments when resumed.
+        """
+        api = self._local_api(retry_policy=TFCRetryPolicy(max_retries=0))
+        self._failing_ranges = {3 * _SEGMENT_SIZE}
+        with self.assertRaises(TFCHTTPUnclassified):
+            self._download(api)
+        self.assertTrue(os.path.exists(f"{self._target_path}.part"))
+
+        self._failing_ranges = set()
+        sent = len(self._received(self._path))
+        results = self._download(api, checksum=self._checksum)
+        self._assert_downloaded()
+        self.assertEqual(results["bytes"], _SEGMENT_SIZE)
+        self.assertEqual(len(self._received(self._path)) - sent, 1)
+
+    def test_segmented_download_resume_after_last_write(self):
+        """
+        Test that a download whose segments were all written, but which wasn't
+        moved to its target, is finished without fetching anything again.
+        """
+        # Crash right after the last segment is written.
+        api = self._local_api()
+        with mock.patch.object(SegmentedDownload, "finish", side_effect=OSError):
+            with self.assertRaises(OSError):
+                self._download(api)
+
+        sent = len(self._received(self._path))
+        results = self._download(api, checksum=self._checksum)
+        self._assert_downloaded()
+        self.assertEqual(results["bytes"], 0)
+        self.assertEqual(len(self._received(self._path)), sent)
+
+    def test_segmented_download_resume_after_last_write_corrupted(self):
+        """
+        Test that a finished part file which doesn't match the checksum is
+        downloaded again from scratch.
+        """
+        api = self._local_api()
+        with mock.patch.object(SegmentedDownload, "finish", side_effect=OSError):
+            with self.assertRaises(OSError):
+                self._download(api)
+        with open(f"{self._target_path}.part", "r+b") as part_file:
+            part_file.write(b"corrupted")
+
+        sent = len(self._received(self._path))
+        self._download(api, checksum=self._checksum)
+        self._assert_downloaded()
+        self.assertEqual(len(self._received(self._path)) - sent, 6)
+
+    def test_artifact_cache_scoped_to_token(self):
+        """
+        Test that an artifact cache shared by two tokens only serves each the
+        artifacts downloaded with it.
+        """
+        artifact_cache = TFCArtifactCache(os.path.join(self._temp_dir, "artifacts"))
+        api = self._local_api(artifact_cache=artifact_cache)
+        api.plan_exports.download("pe-local", self._target_path)
+        sent = len(self._received(self._path))
+
+        api.plan_exports.download("pe-local", self._target_path)
+        self.assertEqual(len(self._received(self._path)), sent)
+
+        api.with_token("other-token").plan_exports.download("pe-local", self._target_path)
+        self.assertGreater(len(self._received(self._path)), sent)
+        self._assert_downloaded()
+
+    def test_state_version_download_cached(self):
+        """
+        Test that downloading a state version again is served from the artifact
+        cache, without looking the state version up.
+        """
+        artifact_cache = TFCArtifactCache(os.path.join(self._temp_dir, "artifacts"))
+        api = self._local_api(artifact_cache=artifact_cache)
+        api.state_versions.download("sv-local", self._target_path, checksum=self._checksum)
+        self.assertEqual(len(self._received(self._state_version_path)), 1)
+        sent = len(self._received(self._path))
+
+        os.remove(self._target_path)
+        api.state_versions.download("sv-local", self._target_path, checksum=self._checksum)
+        self._assert_downloaded()
+        self.assertEqual(len(self._received(self._state_version_path)), 1)
+        self.assertEqual(len(self._received(self._path)), sent)
+
+    @unittest.skipIf(aiohttp is None, "The aiohttp package is required to test AsyncTFC.")
+    def test_async_state_version_download_cached(self):
+        """
+        Test that AsyncTFC serves a state version downloaded again from the artifact cache.
+        """
+        artifact_cache = TFCArtifactCache(os.path.join(self._temp_dir, "artifacts"))
+
+        async def run_async_api():
+            async with self._local_api(AsyncTFC, artifact_cache=artifact_cache) as async_api:
+                for _ in range(2):
+                    await async_api.state_versions.download(\
+                        "sv-local", self._target_path, checksum=self._checksum)
+                    self._assert_downloaded()
+
+        asyncio.run(run_async_api())
+        self.assertEqual(len(self._received(self._state_version_path)), 1)
+        self.assertEqual(len(self._received(self._path)), 1)
+
+    @unittest.skipIf(aiohttp is None, "The aiohttp package is required to test AsyncTFC.")
+    def test_async_download_writes_off_event_loop(self):
+        """
+        Test that AsyncTFC writes downloads to their target in threads, not on the event loop.
+        """
+        write = SegmentedDownload.write
+        write_threads = set()
+
+        def record_write(segmented, offset, chunk, end):
+            write_threads.add(threading.current_thread())
+            return write(segmented, offset, chunk, end)
+
+        async def run_async_api():
+            async with self._local_api(AsyncTFC) as async_api:
+                with mock.patch.object(SegmentedDownload, "write", record_write):
+                    await self._download(async_api, checksum=self._checksum)
+
+        asyncio.run(run_async_api())
+        self._assert_downloaded()
+        self.assertTrue(write_threads)
+        self.assertNotIn(threading.current_thread(), write_threads)
+
+    @unittest.skipIf(aiohttp is None, "The aiohttp package is required to test AsyncTFC.")
+    def test_async_segmented_download_resume_after_last_write(self):
+        """
+        Test that AsyncTFC finishes a download whose segments were all written.
+        """
+        async def run_async_api():
+            async with self._local_api(AsyncTFC) as async_api:
+                with mock.patch.object(SegmentedDownload, "finish", side_effect=OSError):
+                    with self.assertRaises(OSError):
+                        await self._download(async_api)
+
+                sent = len(self._received(self._path))
+                await self._download(async_api, checksum=self._checksum)
+                self._assert_downloaded()
+                self.assertEqual(len(self._received(self._path)), sent)
+
+        asyncio.run(run_async_api())
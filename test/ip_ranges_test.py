@@ -2,6 +2,9 @@
 Module for testing the Terraform Cloud API Endpoint: IP Ranges.
 """
 
+from terrasnek.api import TFC
+from terrasnek.caches import TFCResponseCache
+
 from .base import TestTFCBaseTestCase
 
 
@@ -22,3 +25,19 @@ class TestTFCIPRanges(TestTFCBaseTestCase):
         self.assertIn("notifications", ip_ranges)
         self.assertIn("sentinel", ip_ranges)
         self.assertIn("vcs", ip_ranges)
+
+    def test_ip_ranges_response_cache(self):
+        """
+        Test that polling the IP ranges with a response cache is answered with
+        the cached ranges once they're revalidated.
+        """
+        response_cache = TFCResponseCache()
+        cached_api = TFC(\
+            self._test_api_token, url=self._tfc_url, verify=self._ssl_verify, \
+                log_level=self._api_log_level, response_cache=response_cache)
+
+        ip_ranges = cached_api.ip_ranges.list()
+        self.assertEqual(cached_api.ip_ranges.list(), ip_ranges)
+        self.assertEqual(response_cache.counts["hits"], 1)
+
+        cached_api.close()
@@ -0,0 +1,139 @@
+"""
+Base module for the tests run against a local stand in for the TFC API.
+
+They cover the behaviors of the transport which can't be provoked on demand
+against a real TFC installation, such as rate limiting, transient failures,
+slow responses and interrupted downloads, and need neither a token nor network.
+"""
+
+import json
+import threading
+import unittest
+from collections import namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from terrasnek.api import TFC
+
+# Well known paths of the local API, given to the API objects so they're never discovered.
+LOCAL_WELL_KNOWN_PATHS = {
+    "modules.v1": "/api/registry/v1/modules/",
+    "motd.v1": "/api/terraform/motd",
+    "state.v2": "/api/v2/",
+    "tfe.v2": "/api/v2/",
+    "tfe.v2.1": "/api/v2/",
+    "tfe.v2.2": "/api/v2/"
+}
+
+LOCAL_TOKEN = "local-token"
+LOCAL_ORG_NAME = "local-org"
+
+# A request received by the local API.
+LocalRequest = namedtuple("LocalRequest", ["method", "path", "query", "headers", "body"])
+
+
+class _LocalHandler(BaseHTTPRequestHandler):
+    """
+    Handler passing every request on to the ``handle`` function of its server.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args): # pylint: disable=arguments-differ
+        pass
+
+    def _read_chunked(self):
+        body = b""
+        while True:
+            size = int(self.rfile.readline().split(b";")[0], 16)
+            body += self.rfile.read(size)
+            self.rfile.readline()
+            if size == 0:
+                return body
+
+    def _handle(self):
+        url = urlparse(self.path)
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            body = self._read_chunked()
+        else:
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        request = LocalRequest(\
+            self.command, url.path, parse_qs(url.query), dict(self.headers), body)
+        self.server.record(request)
+
+        status, content, headers = self.server.handle(request)
+        if not isinstance(content, bytes):
+            content = json.dumps(content).encode("utf-8")
+
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(content)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = do_HEAD = _handle
+
+
+class _LocalServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server answering every request with ``handle(request)``, which
+    returns the status code, body and headers of the response.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, handle):
+        super().__init__(("127.0.0.1", 0), _LocalHandler)
+        self.handle = handle
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def record(self, request):
+        """
+        Record a request received by the server.
+        """
+        with self._lock:
+            self.requests.append(request)
+
+
+class TestTFCLocalTestCase(unittest.TestCase):
+    """
+    Base class for the tests run against a local stand in for the TFC API,
+    which answers every request with the ``handle`` method of the test.
+    """
+
+    def setUp(self):
+        self._server = _LocalServer(self.handle)
+        thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self._server.server_close)
+        self.addCleanup(self._server.shutdown)
+        self._url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def handle(self, request): # pylint: disable=unused-argument
+        """
+        Return the status code, body and headers of the response to a request.
+        """
+        return 404, {"errors": [{"status": "404", "title": "not found"}]}, {}
+
+    def _local_api(self, api_class=TFC, **kwargs):
+        """
+        Return an API object of the local API, set to the local org, without
+        rate limiting unless asked to.
+        """
+        kwargs.setdefault("rate_limit", None)
+        api = api_class(\
+            LOCAL_TOKEN, url=self._url, well_known_paths=LOCAL_WELL_KNOWN_PATHS, **kwargs)
+        api.set_org(LOCAL_ORG_NAME)
+        if api_class is TFC:
+            self.addCleanup(api.close)
+        return api
+
+    def _received(self, path=None):
+        """
+        Return the requests received so far, only the ones to ``path`` if given.
+        """
+        return [request for request in self._server.requests \
+            if path is None or request.path == path]
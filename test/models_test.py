@@ -0,0 +1,159 @@
+"""
+Module for testing the compact resource models, which needs neither a token nor network.
+"""
+
+import gc
+import json
+import tracemalloc
+import unittest
+from unittest import mock
+
+from terrasnek.models import TFCRun, TFCWorkspace
+from terrasnek.serializers import TFCJSONSerializer
+
+_RECORD = {
+    "id": "ws-local",
+    "type": "workspaces",
+    "attributes": {"name": "local-workspace", "locked": False},
+    "relationships": {"current-run": {"data": {"id": "run-local", "type": "runs"}}}
+}
+
+
+def _workspace_record(index):
+    """
+    Return a record shaped like the workspaces of a list response.
+    """
+    permissions = {f"can-{action}": True for action in (\
+        "update", "destroy", "queue-destroy", "queue-run", "queue-apply", "read-state-versions",
+        "create-state-versions", "read-variable", "update-variable", "lock", "unlock",
+        "force-unlock", "read-settings", "manage-tags", "read-run", "read-assessment-results")}
+    return {
+        "id": f"ws-{index:016d}",
+        "type": "workspaces",
+        "attributes": {
+            "name": f"workspace-{index}",
+            "description": "A workspace of the memory test.",
+            "auto-apply": False,
+            "locked": False,
+            "execution-mode": "remote",
+            "terraform-version": "1.5.7",
+            "working-directory": "infra/network",
+            "resource-count": index,
+            "tag-names": ["network", "production", f"team-{index % 7}"],
+            "created-at": "2023-01-02T03:04:05.678Z",
+            "updated-at": "2023-06-07T08:09:10.111Z",
+            "environment": "default",
+            "file-triggers-enabled": True,
+            "global-remote-state": False,
+            "queue-all-runs": False,
+            "speculative-enabled": True,
+            "structured-run-output-enabled": True,
+            "trigger-prefixes": [],
+            "trigger-patterns": ["infra/network/**/*"],
+            "vcs-repo": {
+                "branch": "main",
+                "identifier": "example/infrastructure",
+                "ingress-submodules": False,
+                "oauth-token-id": "ot-0123456789abcdef",
+                "repository-http-url": "https://github.com/example/infrastructure",
+                "service-provider": "github"
+            },
+            "actions": {"is-destroyable": True},
+            "permissions": permissions,
+            "setting-overwrites": {"execution-mode": False, "agent-pool": False},
+            "source": "tfe-api",
+            "latest-change-at": "2023-06-07T08:09:10.111Z",
+            "run-failures": index % 3,
+            "workspace-kpis-runs-count": index * 2
+        },
+        "relationships": {
+            "organization": {"data": {"id": "local-org", "type": "organizations"}},
+            "current-run": {"data": {"id": f"run-{index:016d}", "type": "runs"}},
+            "latest-run": {"data": {"id": f"run-{index:016d}", "type": "runs"}},
+            "current-state-version": {\
+                "data": {"id": f"sv-{index:016d}", "type": "state-versions"}},
+            "current-configuration-version": {\
+                "data": {"id": f"cv-{index:016d}", "type": "configuration-versions"}}
+        },
+        "links": {"self": f"/api/v2/organizations/local-org/workspaces/workspace-{index}"}
+    }
+
+
+def _retained_memory(build):
+    """
+    Return the bytes still allocated by what ``build`` returns, once it returned.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        built = build()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - before, built
+    finally:
+        tracemalloc.stop()
+
+
+class TestTFCModels(unittest.TestCase):
+    """
+    Class for testing the compact resource models.
+    """
+
+    def test_model_from_record(self):
+        """
+        Test that a model made from a decoded record exposes its fields and record.
+        """
+        workspace = TFCWorkspace.from_record(_RECORD)
+        self.assertEqual(workspace.id, "ws-local")
+        self.assertEqual(workspace.name, "local-workspace")
+        self.assertFalse(workspace.locked)
+        self.assertEqual(workspace.current_run_id, "run-local")
+        self.assertIsNone(workspace.description)
+        self.assertIsNone(workspace.current_state_version_id)
+        self.assertEqual(workspace.to_dict(), _RECORD)
+        self.assertEqual(workspace.attributes, _RECORD["attributes"])
+
+        self.assertEqual(workspace, TFCWorkspace.from_record(dict(_RECORD)))
+        self.assertNotEqual(workspace, TFCRun.from_record(_RECORD))
+
+    def test_model_decodes_once(self):
+        """
+        Test that the fields of a model are decoded on the first access only.
+        """
+        serializer = TFCJSONSerializer()
+        workspace = TFCWorkspace.from_record(_RECORD, serializer)
+        with mock.patch.object(serializer, "loads", wraps=serializer.loads) as loads:
+            loads.assert_not_called()
+            self.assertEqual(workspace.name, "local-workspace")
+            self.assertEqual(workspace.current_run_id, "run-local")
+            self.assertFalse(workspace.locked)
+        self.assertEqual(loads.call_count, 1)
+
+    def test_model_memory(self):
+        """
+        Test that the models of a page of records take less memory than its
+        decoded records, even once their fields were read.
+        """
+        page = json.dumps({"data": [_workspace_record(index) for index in range(100)]})
+
+        def build_dicts():
+            return json.loads(page)["data"]
+
+        def build_models():
+            return [TFCWorkspace.from_record(record) for record in json.loads(page)["data"]]
+
+        def build_read_models():
+            workspaces = build_models()
+            for workspace in workspaces:
+                self.assertIsNotNone(workspace.name)
+            return workspaces
+
+        dicts_size, _ = _retained_memory(build_dicts)
+        models_size, _ = _retained_memory(build_models)
+        read_models_size, _ = _retained_memory(build_read_models)
+        self.assertLess(models_size, dicts_size / 2)
+        self.assertLess(read_models_size, dicts_size * 2 / 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,8 @@
 Module for testing the Terraform Cloud API Endpoint: Orgs.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 from .base import TestTFCBaseTestCase
 
 
@@ -61,6 +63,16 @@ class TestTFCOrgs(TestTFCBaseTestCase):
         self.assertEqual(updated_org["data"] \
                          ["attributes"]["email"], email_to_update_to)
 
+        # List the workspaces of both orgs from many threads through views of one API
+        # object, and confirm every list was sent to the org of its view
+        views = [self._api.with_org(self._test_org_name), self._api.with_org(created_org_name)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            listed = list(executor.map(\
+                lambda view: (view.get_org(), view.workspaces.list()), views * 8))
+        for org_name, listed_ws in listed:
+            self.assertIn(f"/organizations/{org_name}/", listed_ws["links"]["self"])
+        self.assertEqual(self._api.get_org(), self._test_org_name)
+
         # Destroy the org, confirm it's gone
         self._api.orgs.destroy(created_org_name)
         all_orgs = self._api.orgs.list()["data"]
@@ -2,10 +2,15 @@
 Module for testing the Terraform Cloud API Endpoint: Plan Exports.
 """
 
+import hashlib
+import shutil
+import tempfile
 import time
 import os
 
-from terrasnek.exceptions import TFCHTTPNotFound
+from terrasnek.api import TFC
+from terrasnek.caches import TFCArtifactCache
+from terrasnek.exceptions import TFCHTTPNotFound, TFCDownloadVerificationFailed
 from .base import TestTFCBaseTestCase
 
 
@@ -96,11 +101,39 @@ class TestTFCPlanExports(TestTFCBaseTestCase):
         # export, and verify it gets downloaded
         if os.path.exists(self._plan_export_tarball_target_path):
             os.remove(self._plan_export_tarball_target_path)
-        self._api.plan_exports.download(
+        download_stats = self._api.plan_exports.download(
             plan_export_id, self._plan_export_tarball_target_path)
         self.assertTrue(os.path.exists(self._plan_export_tarball_target_path))
+        self.assertEqual(\
+            download_stats["bytes"], os.path.getsize(self._plan_export_tarball_target_path))
+
+        # Download it again with a single request, checked against the first download
+        with open(self._plan_export_tarball_target_path, "rb") as tarball:
+            checksum = f"sha256:{hashlib.sha256(tarball.read()).hexdigest()}"
+        self._api.plan_exports.download(\
+            plan_export_id, self._plan_export_tarball_target_path, checksum=checksum, max_workers=1)
+        self.assertRaises(\
+            TFCDownloadVerificationFailed, self._api.plan_exports.download, plan_export_id, \
+                self._plan_export_tarball_target_path, checksum="sha256:0")
         os.remove(self._plan_export_tarball_target_path)
 
+        # Download it through an artifact cache, to read it back from disk later on
+        artifact_cache_dir = tempfile.mkdtemp()
+        cached_api = TFC(\
+            self._test_api_token, url=self._tfc_url, verify=self._ssl_verify, \
+                log_level=self._api_log_level, artifact_cache=TFCArtifactCache(artifact_cache_dir))
+        cached_api.set_org(self._test_org_name)
+        cached_api.plan_exports.download(\
+            plan_export_id, self._plan_export_tarball_target_path, checksum=checksum)
+
         # Destroy the plan export and confirm it's gone.
         self._api.plan_exports.destroy(plan_export_id)
         self.assertRaises(TFCHTTPNotFound, self._api.plan_exports.show, plan_export_id)
+
+        # The cached export is still served, since it can't have changed
+        os.remove(self._plan_export_tarball_target_path)
+        cached_api.plan_exports.download(\
+            plan_export_id, self._plan_export_tarball_target_path, checksum=checksum)
+        os.remove(self._plan_export_tarball_target_path)
+        shutil.rmtree(artifact_cache_dir)
+        cached_api.close()
@@ -0,0 +1,148 @@
+"""
+Module for testing the rate limiting of requests, against a local API.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from terrasnek.async_api import AsyncTFC, aiohttp
+from terrasnek.exceptions import TFCHTTPTooManyRequests
+from terrasnek.transport import TFCRateLimiter
+
+from .local_base import TestTFCLocalTestCase
+
+_WORKSPACE_PATH = "/api/v2/workspaces/ws-1"
+_TOO_MANY_REQUESTS = (429, {"errors": [{"status": "429", "title": "too many requests"}]}, {})
+
+
+class TestTFCRateLimiter(unittest.TestCase):
+    """
+    Class for testing the token bucket of the rate limiter, on a fake clock.
+    """
+
+    def setUp(self):
+        patcher = mock.patch("terrasnek.transport.time")
+        self._time = patcher.start()
+        self.addCleanup(patcher.stop)
+        self._time.monotonic.return_value = 100.0
+
+    def test_rate_limiter_burst(self):
+        """
+        Test that requests within the burst aren't delayed, and the following
+        ones are spaced out at the rate.
+        """
+        limiter = TFCRateLimiter(rate=10, burst=2)
+        waits = [limiter.reserve() for _ in range(4)]
+        self.assertEqual(waits[:2], [0, 0])
+        self.assertAlmostEqual(waits[2], 0.1)
+        self.assertAlmostEqual(waits[3], 0.2)
+
+        # Once the bucket has refilled, requests go through right away again.
+        self._time.monotonic.return_value = 101.0
+        self.assertEqual(limiter.reserve(), 0)
+
+    def test_rate_limiter_headers(self):
+        """
+        Test that the bucket follows the rate limit headers of the responses.
+        """
+        limiter = TFCRateLimiter(rate=30)
+        limiter.update(200, {"X-RateLimit-Limit": "10", "X-RateLimit-Remaining": "1"})
+        self.assertEqual(limiter.reserve(), 0)
+        self.assertAlmostEqual(limiter.reserve(), 0.1)
+
+        limiter.update(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"})
+        self.assertAlmostEqual(limiter.reserve(), 2)
+
+    def test_rate_limiter_too_many_requests(self):
+        """
+        Test that a refused request pauses every request for its ``Retry-After``.
+        """
+        limiter = TFCRateLimiter(rate=30)
+        limiter.update(429, {"Retry-After": "5"})
+        self.assertAlmostEqual(limiter.reserve(), 5)
+        self._time.monotonic.return_value = 104.0
+        self.assertAlmostEqual(limiter.reserve(), 1)
+
+
+class TestTFCRateLimit(TestTFCLocalTestCase):
+    """
+    Class for testing the rate limiting of requests.
+    """
+
+    def setUp(self):
+        super().setUp()
+        # Responses to send back in order, or with the final one repeated.
+        self._responses = []
+        self._lock = threading.Lock()
+
+    def handle(self, request):
+        with self._lock:
+            response = self._responses.pop(0) if len(self._responses) > 1 else \
+                (self._responses[0] if self._responses else None)
+        if response is not None:
+            return response
+        return 200, {"data": {"id": request.path.rsplit("/", 1)[1], "type": "workspaces"}}, {}
+
+    def test_rate_limit(self):
+        """
+        Test that requests are sent no faster than the rate limit.
+        """
+        api = self._local_api(rate_limit=10, rate_limit_burst=1)
+        started_at = time.monotonic()
+        for i in range(4):
+            api.workspaces.show(workspace_id=f"ws-{i}")
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.3)
+        self.assertEqual(len(self._received()), 4)
+
+    def test_rate_limited_retry(self):
+        """
+        Test that a rate limited request is sent again after its ``Retry-After``.
+        """
+        api = self._local_api(rate_limit=30)
+        self._responses = [\
+            (429, _TOO_MANY_REQUESTS[1], {"Retry-After": "0.3"}), \
+                (200, {"data": {"id": "ws-1"}}, {})]
+        started_at = time.monotonic()
+        self.assertEqual(api.workspaces.show(workspace_id="ws-1")["data"]["id"], "ws-1")
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.3)
+        self.assertEqual(len(self._received(_WORKSPACE_PATH)), 2)
+
+    def test_rate_limited_retries_exhausted(self):
+        """
+        Test that a request which keeps being rate limited is given up on after
+        ``rate_limit_max_retries``.
+        """
+        api = self._local_api(rate_limit=100, rate_limit_max_retries=2)
+        self._responses = [(429, _TOO_MANY_REQUESTS[1], {"Retry-After": "0.05"})]
+        with self.assertRaises(TFCHTTPTooManyRequests):
+            api.workspaces.show(workspace_id="ws-1")
+        self.assertEqual(len(self._received(_WORKSPACE_PATH)), 3)
+
+    @unittest.skipIf(aiohttp is None, "The aiohttp package is required to test AsyncTFC.")
+    def test_async_rate_limit(self):
+        """
+        Test that the requests of ``AsyncTFC`` are sent no faster than the rate
+        limit, and sent again once they're no longer rate limited.
+        """
+        async def run_async_api():
+            async with self._local_api(AsyncTFC, rate_limit=10, rate_limit_burst=1) as async_api:
+                started_at = time.monotonic()
+                await asyncio.gather(\
+                    *[async_api.workspaces.show(workspace_id=f"ws-{i}") for i in range(4)])
+                self.assertGreaterEqual(time.monotonic() - started_at, 0.3)
+
+                self._responses = [\
+                    (429, _TOO_MANY_REQUESTS[1], {"Retry-After": "0.2"}), \
+                        (200, {"data": {"id": "ws-1"}}, {})]
+                shown_ws = await async_api.workspaces.show(workspace_id="ws-1")
+                self.assertEqual(shown_ws["data"]["id"], "ws-1")
+                self.assertEqual(len(self._received(_WORKSPACE_PATH)), 3)
+
+        asyncio.run(run_async_api())
+
+
+if __name__ == "__main__":
+    unittest.main()
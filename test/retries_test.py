@@ -0,0 +1,163 @@
+"""
+Module for testing the retry policy of requests, against a local API.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from terrasnek.async_api import AsyncTFC, aiohttp
+from terrasnek.exceptions import TFCHTTPUnclassified
+from terrasnek.transport import TFCRetryPolicy
+
+from .local_base import TestTFCLocalTestCase, LOCAL_ORG_NAME
+
+_WORKSPACE_PATH = "/api/v2/workspaces/ws-1"
+_WORKSPACES_PATH = f"/api/v2/organizations/{LOCAL_ORG_NAME}/workspaces"
+_UNAVAILABLE = (503, {"errors": [{"status": "503", "title": "unavailable"}]}, {})
+
+
+class TestTFCRetries(TestTFCLocalTestCase):
+    """
+    Class for testing the retry policy of requests.
+    """
+
+    def setUp(self):
+        super().setUp()
+        # Responses to send back in order, or with the final one repeated.
+        self._responses = []
+        self._delays = []
+        self._lock = threading.Lock()
+
+    def handle(self, request):
+        with self._lock:
+            response = self._responses.pop(0) if len(self._responses) > 1 else \
+                (self._responses[0] if self._responses else None)
+            delay = self._delays.pop(0) if self._delays else 0
+        time.sleep(delay)
+        if response is not None:
+            return response
+        return 200, {"data": {"id": "ws-1", "type": "workspaces"}}, {}
+
+    def _retry_policy(self, **kwargs):
+        kwargs.setdefault("backoff_factor", 0.01)
+        kwargs.setdefault("jitter", 0)
+        return TFCRetryPolicy(**kwargs)
+
+    def test_retry_server_errors(self):
+        """
+        Test that GETs failing with a retryable status code are retried until
+        they succeed, counting each retry by reason.
+        """
+        retry_policy = self._retry_policy()
+        api = self._local_api(retry_policy=retry_policy)
+        self._responses = [_UNAVAILABLE, _UNAVAILABLE, (200, {"data": {"id": "ws-1"}}, {})]
+        self.assertEqual(api.workspaces.show(workspace_id="ws-1")["data"]["id"], "ws-1")
+        self.assertEqual(len(self._received(_WORKSPACE_PATH)), 3)
+        self.assertEqual(retry_policy.retry_counts["HTTP 503"], 2)
+        self.assertEqual(retry_policy.retry_counts["total"], 2)
+
+    def test_retries_exhausted(self):
+        """
+        Test that a request which keeps failing is given up on after ``max_retries``.
+        """
+        retry_policy = self._retry_policy(max_retries=2)
+        api = self._local_api(retry_policy=retry_policy)
+        self._responses = [_UNAVAILABLE]
+        with self.assertRaises(TFCHTTPUnclassified):
+            api.workspaces.show(workspace_id="ws-1")
+        self.assertEqual(len(self._received(_WORKSPACE_PATH)), 3)
+        self.assertEqual(retry_policy.retry_counts["total"], 2)
+
+    def test_no_retry_of_other_errors(self):
+        """
+        Test that responses with a status code outside of the policy aren't retried.
+        """
+        retry_policy = self._retry_policy()
+        api = self._local_api(retry_policy=retry_policy)
+        self._responses = [(501, {"errors": [{"status": "501"}]}, {})]
+        with self.assertRaises(TFCHTTPUnclassified):
+            api.workspaces.show(workspace_id="ws-1")
+        self.assertEqual(len(self._received(_WORKSPACE_PATH)), 1)
+        self.assertEqual(retry_policy.retry_counts["total"], 0)
+
+    def test_retry_post(self):
+        """
+        Test that POSTs are only retried with ``retry_post``, with the same body.
+        """
+        payload = {"data": {"type": "workspaces", "attributes": {"name": "ws-1"}}}
+        self._responses = [_UNAVAILABLE, (201, {"data": {"id": "ws-1"}}, {})]
+        api = self._local_api(retry_policy=self._retry_policy())
+        with self.assertRaises(TFCHTTPUnclassified):
+            api.workspaces.create(payload)
+        self.assertEqual(len(self._received(_WORKSPACES_PATH)), 1)
+
+        self._responses = [_UNAVAILABLE, (201, {"data": {"id": "ws-1"}}, {})]
+        api = self._local_api(retry_policy=self._retry_policy(retry_post=True))
+        self.assertEqual(api.workspaces.create(payload)["data"]["id"], "ws-1")
+        received = self._received(_WORKSPACES_PATH)[1:]
+        self.assertEqual(len(received), 2)
+        self.assertEqual(received[0].body, received[1].body)
+
+    def test_retry_after(self):
+        """
+        Test that a retry waits at least as long as the ``Retry-After`` header asks.
+        """
+        api = self._local_api(retry_policy=self._retry_policy())
+        self._responses = [\
+            (503, _UNAVAILABLE[1], {"Retry-After": "0.3"}), (200, {"data": {"id": "ws-1"}}, {})]
+        started_at = time.monotonic()
+        api.workspaces.show(workspace_id="ws-1")
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.3)
+        self.assertEqual(len(self._received(_WORKSPACE_PATH)), 2)
+
+    def test_retry_deadline(self):
+        """
+        Test that a request isn't retried past the deadline of the retry policy.
+        """
+        retry_policy = self._retry_policy(backoff_factor=0.2, retry_deadline=0.3)
+        api = self._local_api(retry_policy=retry_policy)
+        self._responses = [_UNAVAILABLE]
+        with self.assertRaises(TFCHTTPUnclassified):
+            api.workspaces.show(workspace_id="ws-1")
+        # Retries wait 0.2s then 0.4s, which would end past the deadline.
+        self.assertEqual(len(self._received(_WORKSPACE_PATH)), 2)
+
+    def test_retry_timeouts(self):
+        """
+        Test that requests which timed out are retried.
+        """
+        retry_policy = self._retry_policy()
+        api = self._local_api(retry_policy=retry_policy, read_timeout=0.1)
+        self._delays = [0.3]
+        self.assertEqual(api.workspaces.show(workspace_id="ws-1")["data"]["id"], "ws-1")
+        self.assertEqual(len(self._received(_WORKSPACE_PATH)), 2)
+        self.assertEqual(retry_policy.retry_counts["ReadTimeout"], 1)
+
+    @unittest.skipIf(aiohttp is None, "The aiohttp package is required to test AsyncTFC.")
+    def test_async_retry_server_errors(self):
+        """
+        Test that the GETs of ``AsyncTFC`` failing with a retryable status code
+        are retried until they succeed, or run out of retries.
+        """
+        retry_policy = self._retry_policy(max_retries=2)
+
+        async def run_async_api():
+            async with self._local_api(AsyncTFC, retry_policy=retry_policy) as async_api:
+                self._responses = [_UNAVAILABLE, (200, {"data": {"id": "ws-1"}}, {})]
+                shown_ws = await async_api.workspaces.show(workspace_id="ws-1")
+                self.assertEqual(shown_ws["data"]["id"], "ws-1")
+                self.assertEqual(len(self._received(_WORKSPACE_PATH)), 2)
+
+                self._responses = [_UNAVAILABLE]
+                with self.assertRaises(TFCHTTPUnclassified):
+                    await async_api.workspaces.show(workspace_id="ws-1")
+                self.assertEqual(len(self._received(_WORKSPACE_PATH)), 5)
+
+        asyncio.run(run_async_api())
+        self.assertEqual(retry_policy.retry_counts["HTTP 503"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -84,6 +84,18 @@ class TestTFCRuns(TestTFCBaseTestCase):
                 break
         self.assertTrue(found_run)
 
+        found_run = False
+        for run in self._api.runs.iter_all(self._ws_id):
+            if run["id"] == run_id:
+                found_run = True
+                break
+        self.assertTrue(found_run)
+
+        run_models = {run_model.id: run_model for run_model in \
+            self._api.runs.iter_all(self._ws_id, as_models=True)}
+        self.assertIn(run_id, run_models)
+        self.assertEqual(run_models[run_id].workspace_id, self._ws_id)
+
         # Apply the plan
         apply_payload = {
             "comment": "foo"
@@ -0,0 +1,43 @@
+"""
+Module for testing the JSON serializers of the Terraform Cloud API class.
+"""
+
+import unittest
+
+from terrasnek.api import TFC
+from terrasnek.serializers import TFCOrjsonSerializer, orjson
+
+from .base import TestTFCBaseTestCase
+
+
+@unittest.skipIf(orjson is None, "The orjson package is required to test TFCOrjsonSerializer.")
+class TestTFCSerializers(TestTFCBaseTestCase):
+    """
+    Class for testing the JSON serializers of the Terraform Cloud API class.
+    """
+
+    _unittest_name = "json"
+    _endpoint_being_tested = "workspaces"
+
+    def test_orjson_serializer(self):
+        """
+        Test that the orjson serializer encodes payloads and decodes responses
+        the same way as the default serializer.
+        """
+        orjson_api = TFC(\
+            self._test_api_token, url=self._tfc_url, verify=self._ssl_verify, \
+                log_level=self._api_log_level, serializer=TFCOrjsonSerializer())
+        orjson_api.set_org(self._test_org_name)
+
+        workspace = orjson_api.workspaces.create(\
+            self._get_ws_without_vcs_create_payload())["data"]
+        ws_id = workspace["id"]
+
+        shown_ws = self._api.workspaces.show(workspace_id=ws_id)
+        self.assertEqual(orjson_api.workspaces.show(workspace_id=ws_id), shown_ws)
+        self.assertEqual(\
+            orjson_api.workspaces.list(page_size=50)["meta"], \
+                self._api.workspaces.list(page_size=50)["meta"])
+
+        orjson_api.workspaces.destroy(workspace_id=ws_id)
+        orjson_api.close()
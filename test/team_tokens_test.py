@@ -2,6 +2,8 @@
 Module for testing the Terraform Cloud API Endpoint: Team Tokens.
 """
 
+from terrasnek.api import TFC
+
 from .base import TestTFCBaseTestCase
 
 
@@ -30,5 +32,19 @@ class TestTFCTeamTokens(TestTFCBaseTestCase):
         created_token = self._api.team_tokens.create(self._team_id)["data"]
         self.assertIsNotNone(created_token["id"])
 
+        # Pool it with the test token, so that requests are spread over both
+        pooled_api = TFC(\
+            [created_token["attributes"]["token"], self._test_api_token], url=self._tfc_url, \
+                verify=self._ssl_verify, log_level=self._api_log_level)
+        self.assertEqual(pooled_api.get_token_pool().in_rotation(), 2)
+
         # Then destroy it. There is no lookup so there's nothing to test here.
         self._api.team_tokens.destroy(self._team_id)
+
+        # The destroyed token is rejected and taken out of rotation, while the
+        # requests sent with it go through with the test token instead
+        for _ in range(3):
+            shown_org = pooled_api.orgs.show(self._test_org_name)["data"]
+            self.assertEqual(shown_org["id"], self._test_org_name)
+        self.assertEqual(pooled_api.get_token_pool().in_rotation(), 1)
+        pooled_api.close()
@@ -0,0 +1,60 @@
+"""
+Module for testing the uploads of slugs packed from a directory, against a local API.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from terrasnek import slug
+from terrasnek.async_api import AsyncTFC, aiohttp
+
+from .local_base import TestTFCLocalTestCase
+
+
+class TestTFCUploads(TestTFCLocalTestCase):
+    """
+    Class for testing the uploads of slugs packed from a directory.
+    """
+
+    _path = "/upload"
+
+    def setUp(self):
+        super().setUp()
+        self._config_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._config_dir)
+        with open(os.path.join(self._config_dir, "main.tf"), "w", encoding="utf-8") as main_file:
+            main_file.write('resource "null_resource" "local" {}\n' * 1000)
+
+    def handle(self, request):
+        if request.path != self._path:
+            return super().handle(request)
+        return 200, b"", {}
+
+    @unittest.skipIf(aiohttp is None, "The aiohttp package is required to test AsyncTFC.")
+    def test_async_upload_packs_off_event_loop(self):
+        """
+        Test that AsyncTFC packs a slug in threads, not on the event loop.
+        """
+        iter_tar = slug.iter_tar
+        pack_threads = set()
+
+        def record_iter_tar(*args, **kwargs):
+            for chunk in iter_tar(*args, **kwargs):
+                pack_threads.add(threading.current_thread())
+                yield chunk
+
+        async def run_async_api():
+            async with self._local_api(AsyncTFC) as async_api:
+                with mock.patch.object(slug, "iter_tar", record_iter_tar):
+                    await async_api.config_versions.upload_from_directory(\
+                        self._config_dir, f"{self._url}{self._path}")
+
+        asyncio.run(run_async_api())
+        self.assertEqual(len(self._received(self._path)), 1)
+        self.assertTrue(pack_threads)
+        self.assertNotIn(threading.current_thread(), pack_threads)
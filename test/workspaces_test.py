@@ -2,6 +2,9 @@
 Module for testing the Terraform Cloud API Endpoint: Workspaces.
 """
 
+from terrasnek.api import TFC
+from terrasnek.caches import TFCResourceCache
+
 from .base import TestTFCBaseTestCase
 
 
@@ -46,6 +49,31 @@ class TestTFCWorkspaces(TestTFCBaseTestCase):
                 break
         self.assertTrue(found_ws)
 
+        # List them as compact models, and confirm ours decodes the same
+        ws_models = {ws_model.id: ws_model for ws_model in \
+            self._api.workspaces.list_all(as_models=True)}
+        self.assertIn(ws_id, ws_models)
+        self.assertEqual(ws_models[ws_id].name, workspace["attributes"]["name"])
+
+        # Side-load the organization of every workspace, and resolve ours
+        ws_with_org = self._api.workspaces.list_all(include="organization")
+        ws_listed = [listed_ws for listed_ws in ws_with_org if listed_ws["id"] == ws_id][0]
+        self.assertEqual(\
+            ws_with_org.resolve(ws_listed, "organization")["id"], self._test_org_name)
+
+        # Only ask for the names of the workspaces, and confirm nothing else is returned
+        ws_names = self._api.workspaces.list_all(fields={"workspaces": ["name"]})
+        ws_listed = [listed_ws for listed_ws in ws_names if listed_ws["id"] == ws_id][0]
+        self.assertEqual(list(ws_listed["attributes"]), ["name"])
+
+        # Stream the workspaces lazily, stopping as soon as we find ours
+        found_ws = False
+        for workspace in self._api.workspaces.iter_all():
+            if workspace["id"] == ws_id:
+                found_ws = True
+                break
+        self.assertTrue(found_ws)
+
         # Lock the workspace and confirm it's locked
         ws_locked = self._api.workspaces.lock(
             ws_id, {"reason": "Unit testing."})["data"]
@@ -118,3 +146,30 @@ class TestTFCWorkspaces(TestTFCBaseTestCase):
                 break
 
         self.assertFalse(found_ws)
+
+    def test_workspaces_resource_cache(self):
+        """
+        Test that reads through a resource cache are served from it, and stay
+        coherent with the writes of the same API object.
+        """
+        resource_cache = TFCResourceCache(ttl=300)
+        cached_api = TFC(\
+            self._test_api_token, url=self._tfc_url, verify=self._ssl_verify, \
+                log_level=self._api_log_level, resource_cache=resource_cache)
+        cached_api.set_org(self._test_org_name)
+
+        ws_id = cached_api.workspaces.create(\
+            self._get_ws_without_vcs_create_payload())["data"]["id"]
+        shown_ws = cached_api.workspaces.show(workspace_id=ws_id)["data"]
+        self.assertEqual(cached_api.workspaces.show(workspace_id=ws_id)["data"], shown_ws)
+        self.assertEqual(resource_cache.counts["hits"], 1)
+        self.assertFalse(shown_ws["attributes"]["locked"])
+
+        # Locking it invalidates the cached workspace, which is read back locked
+        cached_api.workspaces.lock(ws_id, {"reason": "Unit testing."})
+        shown_ws = cached_api.workspaces.show(workspace_id=ws_id)["data"]
+        self.assertTrue(shown_ws["attributes"]["locked"])
+
+        cached_api.workspaces.force_unlock(ws_id)
+        cached_api.workspaces.destroy(workspace_id=ws_id)
+        cached_api.close()